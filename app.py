@@ -1,5 +1,8 @@
+import logging
+
 import dash
-from dash import html, dcc, Input, Output, ctx, ALL
+import flask
+from dash import html, dcc, Input, Output, State, ctx, ALL, ClientsideFunction
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import plotly.express as px
@@ -7,19 +10,54 @@ import pandas as pd
 from styles import LAYOUT_STYLE
 from components import *
 from constants import *
+from config import *
 from data_loader import *
+from response_cache import cached_response, response_cache, render_version
+from warmup import Warmup
+import compression
+import serialization
+import metrics
+import image_cache
+import snapshot
+from metrics import instrumented_callback, callback_phase
+from profiling import profiled_callback
 
 # =============================================================================
 # Initialize the Dash app
 # =============================================================================
 
+logger = logging.getLogger(__name__)
+
+if BACKGROUND_CALLBACKS and REQUEST_PROFILING:
+    # A background job runs outside the Flask request, so profiled_callback
+    # cannot see the profiling header there: the debug hook wins.
+    logger.warning(
+        "CFC_REQUEST_PROFILING is on: CFC_BACKGROUND_CALLBACKS is ignored so that every callback can be profiled"
+    )
+    BACKGROUND_CALLBACKS = False
+
+background_callback_manager = None
+if BACKGROUND_CALLBACKS:
+    try:
+        import diskcache
+    except ImportError as exc:
+        raise ImportError(
+            "CFC_BACKGROUND_CALLBACKS requires diskcache: pip install \"dash[diskcache]\""
+        ) from exc
+    background_callback_manager = dash.DiskcacheManager(diskcache.Cache(BACKGROUND_CACHE_DIR))
+
 app = dash.Dash(
     __name__,
     suppress_callback_exceptions=True,
-    external_stylesheets=[dbc.themes.BOOTSTRAP]
+    external_stylesheets=[dbc.themes.BOOTSTRAP],
+    background_callback_manager=background_callback_manager
 )
 app.title = "CFC Performance Insights Vizathon LTH"
 server = app.server
+serialization.install(metrics.timed_serialization if METRICS else None)
+compression.init_app(app)
+metrics.init_app(server)
+image_cache.init_app(server)
 
 # =============================================================================
 # Define the app layout
@@ -31,6 +69,7 @@ app.layout = html.Div(
         dcc.Store(id="selected-tab", data=1),
         dcc.Store(id="selected-player", data=5),
         dcc.Store(id="selected-season", data="2024/2025"),
+        *get_sidebar_stores(df_player_resume),
         get_header_background(),
         get_sidebar_background(),
         get_logo(),
@@ -50,84 +89,38 @@ app.layout = html.Div(
     [Input(tab_id, "n_clicks") for tab_id in TAB_IDS],
     prevent_initial_call=True
 )
+@instrumented_callback("select_tab")
 def select_tab(*_):
     triggered_id = ctx.triggered_id
     return TAB_IDS.index(triggered_id) + 1
 
 # =============================================================================
-# Update Main Content Based on Selected Tab, Player, and Season
+# Update Main Content Based on Selected Tab
 # =============================================================================
 
 @app.callback(
     Output("page-content", "children"),
     Input("selected-tab", "data"),
-    Input("selected-player", "data"),
-    Input("selected-season", "data")
+    State("selected-season", "data")
 )
-def update_content(tab_index, player_id, stored_season):
+@instrumented_callback("update_content", tab=lambda tab_index, *_: tab_index)
+def update_content(tab_index, stored_season):
+    # Only the page skeleton is built here: the figures are rendered by the
+    # page callbacks below, so a player or season change never rebuilds the
+    # container (and never fires the page callbacks a second time).
     if tab_index == 1:
-        player = df_player_resume[df_player_resume["player_id"] == player_id].iloc[0]
-        matches = df_last_5_matches[df_last_5_matches["player_id"] == player_id]
-        # Define positions and sizes
-        image_top = 43
-        image_left = 12
-        image_height = 70
-        number_top = 32
-        number_left = 17
-        number_font_size = 15
-        text_top = 1
-        text_left = 2
-        title_size = TITLE_SIZE
-        subtitle_size = SUBTITLE_SIZE
-        body_size = BODY_SIZE
-        info_top = 82
-        info_left = image_left
-        info_value_size = SUBTITLE_SIZE
-        info_label_size = BODY_SIZE
-        season_top = 15
-        season_left = 30
-        last_5_matches_top = 52
-        last_5_matches_left = season_left
-        margin_bottom_vh = 1
-        logo_height_vh = 8
-        top_donut = 10
-        left_starting_donut = 48
-        left_minutes_played_donut = 70
-        size_donut_vh = 32
         return html.Div(
-            children=[
-                render_player_image(player, image_top, image_left, image_height),
-                render_player_number(player, number_top, number_left, number_font_size),
-                render_player_header(player, text_top, text_left, title_size, body_size),
-                render_info_block(player, info_top, info_left, info_value_size, info_label_size),
-                render_season_stats(player, season_top, season_left, subtitle_size, body_size),
-                render_last_5_matches_tab(
-                    matches,
-                    last_5_matches_top,
-                    last_5_matches_left,
-                    body_size,
-                    title="LAST 5 MATCHES",
-                    title_font_size=subtitle_size,
-                    margin_bottom_vh=margin_bottom_vh,
-                    logo_height_vh=logo_height_vh
-                ),
-                render_donut(
-                    df_player_resume, 'starting_eleven_pct', player_id, top_donut, left_starting_donut, size_donut_vh,
-                    COLOR_LIGHT_BLUE, COLOR_DARK_BLUE, title='STARTING ELEVEN', title_font_size=body_size/1.5
-                ),
-                render_donut(
-                    df_player_resume, 'minutes_played_pct', player_id, top_donut, left_minutes_played_donut, size_donut_vh,
-                    COLOR_LIGHT_BLUE, COLOR_DARK_BLUE, title='MINUTES PLAYED', title_font_size=body_size/1.5
-                )
-            ],
+            id="page1-content",
             style={"position": "relative", "height": "100%", "width": "100%"}
         )
     elif tab_index == 2:
-        saisons = sorted(df_cfc_gps_data_processed["season"].dropna().unique())
+        saisons = sorted(gps_season_date_ranges)
         season_filter_left_vw = 0
         season_filter_top_vh = -0.5
         season_filter_width_vw = 7
         season_filter_fontsize_vw = 0.75
+        # The season dropdown presets the date range, which can then span several seasons.
+        start_date, end_date = season_date_range(stored_season)
         return html.Div(
             style={"position": "relative", "height": "100%", "width": "100%"},
             children=[
@@ -147,9 +140,30 @@ def update_content(tab_index, player_id, stored_season):
                         "backgroundColor": COLOR_SNOW
                     }
                 ),
-                html.Div(
-                    id="page2-content",
-                    style={"position": "relative", "top": "0vh", "left": "0vw", "width": "100%", "height": "100%"}
+                dcc.DatePickerRange(
+                    id="date-range",
+                    min_date_allowed=df_cfc_gps_data_processed["date"].min().date(),
+                    max_date_allowed=df_cfc_gps_data_processed["date"].max().date(),
+                    start_date=start_date,
+                    end_date=end_date,
+                    display_format="YYYY/MM/DD",
+                    minimum_nights=0,
+                    style={
+                        "position": "absolute",
+                        "top": f"{season_filter_top_vh}vh",
+                        "left": f"{season_filter_left_vw + season_filter_width_vw + 0.5}vw",
+                        "zIndex": "999",
+                        "fontSize": f"{season_filter_fontsize_vw}vw"
+                    }
+                ),
+                dcc.Loading(
+                    html.Div(
+                        id="page2-content",
+                        style={"position": "relative", "top": "0vh", "left": "0vw", "width": "100%", "height": "100%"}
+                    ),
+                    type="circle",
+                    color=COLOR_LIGHT_BLUE,
+                    parent_style={"position": "relative", "width": "100%", "height": "100%"}
                 )
             ]
         )
@@ -178,9 +192,14 @@ def update_content(tab_index, player_id, stored_season):
                         "backgroundColor": COLOR_SNOW
                     }
                 ),
-                html.Div(
-                    id="page3-content",
-                    style={"position": "relative", "height": "100%", "width": "100%"}
+                dcc.Loading(
+                    html.Div(
+                        id="page3-content",
+                        style={"position": "relative", "height": "100%", "width": "100%"}
+                    ),
+                    type="circle",
+                    color=COLOR_LIGHT_BLUE,
+                    parent_style={"position": "relative", "width": "100%", "height": "100%"}
                 )
             ],
             style={"position": "relative", "height": "100%", "width": "100%"}
@@ -195,26 +214,35 @@ def update_content(tab_index, player_id, stored_season):
     Input("season-dropdown", "value"),
     prevent_initial_call=True
 )
+@instrumented_callback("store_selected_season")
 def store_selected_season(selected_season):
     if selected_season is None:
         raise dash.exceptions.PreventUpdate
     return selected_season
 
+def season_date_range(season) -> tuple:
+    """Return the (start, end) GPS dates of a season, or of the latest season when it has no GPS data."""
+    if season not in gps_season_date_ranges:
+        season = max(gps_season_date_ranges)
+    return gps_season_date_ranges[season]
+
 @app.callback(
-    Output("selected-player", "data"),
-    Input({'type': 'player-img', 'index': ALL}, 'n_clicks'),
+    Output("date-range", "start_date"),
+    Output("date-range", "end_date"),
+    Input("season-dropdown", "value"),
     prevent_initial_call=True
 )
-def select_player_from_image(n_clicks_list):
-    trigger = ctx.triggered_id
-    if trigger is None:
+@instrumented_callback("select_season_date_range", tab=2)
+def select_season_date_range(selected_season):
+    if selected_season is None:
         raise dash.exceptions.PreventUpdate
-    return trigger['index']
+    return season_date_range(selected_season)
 
 @app.callback(
     Output("tab-bar", "children"),
     Input("selected-tab", "data")
 )
+@instrumented_callback("update_tab_bar")
 def update_tab_bar(tab_index):
     return [
         html.Div(
@@ -238,67 +266,142 @@ def update_tab_bar(tab_index):
         for i, title in enumerate(TAB_TITLES)
     ]
 
+# The sidebar is rendered client-side (assets/sidebar.js): only the avatars in
+# view (plus a few overscan rows) are mounted, and re-rendered when the rows in
+# view change, so its cost and the number of pictures loaded no longer grow with
+# the squad size. The avatar clicks are resolved client-side too, so mounting
+# avatars while scrolling never sends a request.
+app.clientside_callback(
+    ClientsideFunction(namespace="sidebar", function_name="render"),
+    Output("sidebar-window", "children"),
+    Output("sidebar-window", "style"),
+    Input("sidebar-viewport", "data"),
+    Input("sidebar-collapsed-groups", "data"),
+    Input("selected-player", "data"),
+    State("sidebar-players", "data")
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="sidebar", function_name="toggle_group"),
+    Output("sidebar-collapsed-groups", "data"),
+    Input({'type': 'sidebar-group', 'index': ALL}, 'n_clicks'),
+    State("sidebar-collapsed-groups", "data"),
+    prevent_initial_call=True
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="sidebar", function_name="select_player"),
+    Output("selected-player", "data"),
+    Input({'type': 'player-img', 'index': ALL}, 'n_clicks'),
+    prevent_initial_call=True
+)
+
 @app.callback(
-    Output("sidebar", "children"),
+    Output("page1-content", "children"),
     Input("selected-player", "data")
 )
-def update_sidebar(selected_player_id):
-    df_sorted = df_player_resume.sort_values('group_id')
-    return html.Div(
-        style={
-            "height": "100%",
-            "width": f"{SIDEBAR_WIDTH_VW}vw",
-            "position": "absolute",
-            "top": "0",
-            "left": "0",
-            "zIndex": "4",
-            "paddingTop": f"{HEADER_HEIGHT_VH + LOGO_SIZE_VH / 2}vh",
-            "display": "flex",
-            "flexDirection": "column",
-            "alignItems": "center",
-            "overflowY": "auto"
-        },
-        children=[
-            html.Div(
-                id={'type': 'player-img', 'index': row['player_id']},
-                title=row['name'],
-                style={
-                    "width": f"{SCALE_IMAGE_PLAYER_SIDEBAR_VW}vw",
-                    "height": f"{SCALE_IMAGE_PLAYER_SIDEBAR_VW}vw",
-                    "borderRadius": "50%",
-                    "margin": "2vh 0",
-                    "cursor": "pointer",
-                    "overflow": "hidden",
-                    "backgroundColor": COLOR_BLUE,
-                    "display": "flex",
-                    "alignItems": "flex-start",
-                    "justifyContent": "center",
-                    "border": f"{3 * LINEWIDTH_SEPARATION_VH}vh solid white" if row['player_id'] == selected_player_id else "none"
-                },
-                children=html.Img(
-                    src=row['player_picture_url'],
-                    style={
-                        "height": "240%",
-                        "objectFit": "cover"
-                    }
-                )
-            )
-            for _, row in df_sorted.iterrows()
-        ]
+@instrumented_callback("update_page1_content", tab=1)
+@profiled_callback("update_page1_content")
+@cached_response("update_page1_content")
+def update_page1_content(player_id):
+    with callback_phase("filter"):
+        player = df_player_resume[df_player_resume["player_id"] == player_id].iloc[0]
+        matches = df_last_5_matches[df_last_5_matches["player_id"] == player_id]
+    # Define positions and sizes
+    image_top = 43
+    image_left = 12
+    image_height = 70
+    number_top = 32
+    number_left = 17
+    number_font_size = 15
+    text_top = 1
+    text_left = 2
+    title_size = TITLE_SIZE
+    subtitle_size = SUBTITLE_SIZE
+    body_size = BODY_SIZE
+    last_5_matches_top = 52
+    last_5_matches_left = 30
+    margin_bottom_vh = 1
+    logo_height_vh = 8
+    info_block, season_stats, starting_donut, minutes_played_donut = page1_cards(player)
+    return [
+        render_player_image(player, image_top, image_left, image_height),
+        render_player_number(player, number_top, number_left, number_font_size),
+        render_player_header(player, text_top, text_left, title_size, body_size),
+        info_block,
+        season_stats,
+        render_last_5_matches_tab(
+            matches,
+            last_5_matches_top,
+            last_5_matches_left,
+            body_size,
+            title="LAST 5 MATCHES",
+            title_font_size=subtitle_size,
+            margin_bottom_vh=margin_bottom_vh,
+            logo_height_vh=logo_height_vh
+        ),
+        starting_donut,
+        minutes_played_donut
+    ]
+
+def page1_cards(player) -> tuple:
+    """
+    Return the info block, season stats and donuts of a player's overview. They
+    are cached on the values they display, so repeated renders (and players with
+    identical data) share the same components.
+    """
+    info_top = 82
+    info_left = 12
+    season_top = 15
+    season_left = 30
+    top_donut = 10
+    left_starting_donut = 48
+    left_minutes_played_donut = 70
+    size_donut_vh = 32
+    return (
+        render_info_block(player, info_top, info_left, SUBTITLE_SIZE, BODY_SIZE),
+        render_season_stats(player, season_top, season_left, SUBTITLE_SIZE, BODY_SIZE),
+        render_donut(
+            player, 'starting_eleven_pct', top_donut, left_starting_donut, size_donut_vh,
+            COLOR_LIGHT_BLUE, COLOR_DARK_BLUE, title='STARTING ELEVEN', title_font_size=BODY_SIZE/1.5
+        ),
+        render_donut(
+            player, 'minutes_played_pct', top_donut, left_minutes_played_donut, size_donut_vh,
+            COLOR_LIGHT_BLUE, COLOR_DARK_BLUE, title='MINUTES PLAYED', title_font_size=BODY_SIZE/1.5
+        )
     )
 
+def player_gps_window(player_id, start_date, end_date) -> tuple:
+    """
+    Return the GPS rows of a player between two dates (inclusive), sorted by
+    date, and the load chart hover payloads of these rows.
+    """
+    df_player = gps_data_by_player.get(player_id, df_cfc_gps_data_processed.iloc[0:0])
+    dates = df_player["date"]
+    start = dates.searchsorted(pd.Timestamp(start_date), side="left")
+    end = dates.searchsorted(pd.Timestamp(end_date), side="right")
+    hover = load_chart_hover.get(player_id)
+    if hover is not None:
+        hover = {name: customdata[start:end] for name, customdata in hover.items()}
+    return df_player.iloc[start:end], hover
+
 @app.callback(
     Output("page2-content", "children"),
-    Input("selected-season", "data"),
-    Input("selected-player", "data")
+    Input("date-range", "start_date"),
+    Input("date-range", "end_date"),
+    Input("selected-player", "data"),
+    background=BACKGROUND_CALLBACKS
 )
-def update_page2_content(selected_season, player_id):
-    if not selected_season or not player_id:
-        return html.Div("Select a season and a player.")
-    df_filtered = df_cfc_gps_data_processed[
-        (df_cfc_gps_data_processed["player_id"] == player_id) &
-        (df_cfc_gps_data_processed["season"] == selected_season)
-    ]
+@instrumented_callback("update_page2_content", tab=2)
+@profiled_callback("update_page2_content")
+@cached_response("update_page2_content")
+def update_page2_content(start_date, end_date, player_id):
+    if not start_date or not end_date or not player_id:
+        return html.Div("Select a date range and a player.")
+    with callback_phase("filter"):
+        df_filtered, hover = player_gps_window(player_id, start_date, end_date)
+    if df_filtered.empty:
+        return html.Div("No GPS data for this player in the selected date range.")
     top_val = -7
     left_val = -1
     width_vw_val = 92
@@ -318,6 +421,7 @@ def update_page2_content(selected_season, player_id):
     logo_size_val = 100
     return render_load_and_acwr_subplots(
         df=df_filtered,
+        df_injuries=df_injuries_histo,
         top=top_val,
         left=left_val,
         width_vw=width_vw_val,
@@ -334,28 +438,73 @@ def update_page2_content(selected_season, player_id):
         fontsize_title=fontsize_title_val,
         fontsize_axis=fontsize_axis_val,
         fontsize_legend=fontsize_legend_val,
-        logo_size=logo_size_val
+        logo_size=logo_size_val,
+        hover=hover,
+        # A new player or date range resets the zoom and legend state.
+        uirevision=f"{player_id}/{start_date}/{end_date}"
     )
 
+@app.callback(
+    Output(LOAD_CHART_ID, "figure"),
+    Input(LOAD_CHART_ID, "relayoutData"),
+    State(f"{LOAD_CHART_ID}-detail", "data"),
+    State("date-range", "start_date"),
+    State("date-range", "end_date"),
+    State("selected-player", "data"),
+    prevent_initial_call=True
+)
+@instrumented_callback("update_load_chart_detail", tab=2)
+def update_load_chart_detail(relayout_data, detail, start_date, end_date, player_id):
+    # Zooming or panning replaces the coarse daily series with the visible window
+    # at full resolution; resetting the axes restores the coarse series.
+    x_range = relayout_x_range(relayout_data)
+    if x_range is None or not detail or not detail["refine"]:
+        raise dash.exceptions.PreventUpdate
+    with callback_phase("filter"):
+        df_window, hover = player_gps_window(player_id, start_date, end_date)
+        df_load = prepare_load_chart_data(df_window)
+        if df_load.empty:
+            raise dash.exceptions.PreventUpdate
+        if x_range != "autorange":
+            # Keep one row beyond each edge so that the lines reach the plot borders.
+            dates = df_load["date"]
+            start = max(dates.searchsorted(pd.Timestamp(x_range[0]), side="right") - 1, 0)
+            end = dates.searchsorted(pd.Timestamp(x_range[1]), side="left") + 1
+            df_load = df_load.iloc[start:end]
+    return patch_load_chart_series(
+        df_load, detail["trace_indices"], detail["width_vw"], coarse=x_range == "autorange" and PROGRESSIVE_LOAD_CHART,
+        hover=hover
+    )
+
+app.clientside_callback(
+    ClientsideFunction(namespace="heatmap", function_name="cell_text"),
+    Output(RECOVERY_HEATMAP_ID, "figure"),
+    Input(RECOVERY_HEATMAP_ID, "relayoutData"),
+    State(RECOVERY_HEATMAP_ID, "figure"),
+    prevent_initial_call=True
+)
+
 @app.callback(
     Output("page3-content", "children"),
-    [Input("season-dropdown", "value"),
-     Input("selected-player", "data")]
+    Input("season-dropdown", "value"),
+    Input("selected-player", "data"),
+    background=BACKGROUND_CALLBACKS
 )
+@instrumented_callback("update_page3_content", tab=3)
+@profiled_callback("update_page3_content")
+@cached_response("update_page3_content")
 def update_page3_content(selected_season, player_id):
     if not selected_season or not player_id:
         return html.Div("Select a season and a player.")
     
     # Filter processed DataFrames by selected season
-    df_daily_filtered = df_cfc_recovery_data_processed_daily[
-        df_cfc_recovery_data_processed_daily["seasonName"] == selected_season
-    ]
-    df_heatmap_filtered = df_cfc_recovery_data_processed_heatmap[
-        df_cfc_recovery_data_processed_heatmap["seasonName"] == selected_season
-    ]
-    df_weekly_filtered = df_cfc_recovery_data_processed_weekly[
-        df_cfc_recovery_data_processed_weekly["seasonName"] == selected_season
-    ]
+    with callback_phase("filter"):
+        df_daily_filtered = df_cfc_recovery_data_processed_daily[
+            df_cfc_recovery_data_processed_daily["seasonName"] == selected_season
+        ]
+        df_heatmap_filtered = df_cfc_recovery_data_processed_heatmap[
+            df_cfc_recovery_data_processed_heatmap["seasonName"] == selected_season
+        ]
     
     # --------------------------------------------------------------------------
     # Define style and layout variables for graphs
@@ -502,8 +651,9 @@ def update_page3_content(selected_season, player_id):
                 legend_font_size=heatmap_legend_font_size
             ),
             render_weekly_recovery_graph(
-                processed_df=df_weekly_filtered,
+                weekly_series=recovery_weekly_series,
                 player_id=player_id,
+                season=selected_season,
                 top=top_val_weekly,
                 left=left_val,
                 width_vw=width_vw_val,
@@ -560,6 +710,81 @@ def update_page3_content(selected_season, player_id):
         style={"position": "relative", "height": "100%", "width": "100%"}
     )
 
+# =============================================================================
+# Static Reports
+# =============================================================================
+
+def report_seasons() -> list:
+    """Return every season with GPS or recovery data."""
+    return sorted(set(gps_season_date_ranges) | set(df_cfc_recovery_augmented["seasonName"].dropna()))
+
+def report_pages(player_id: int, season: str) -> list:
+    """
+    Return the (tab, title, components) of each tab of a player's season, as
+    rendered by the page callbacks (page 2: the season's date range). Used by
+    the static snapshot and by report_export.py.
+    """
+    pages = [("overview", TAB_TITLES[0], update_page1_content(player_id))]
+    if season in gps_season_date_ranges:
+        pages.append(("load", TAB_TITLES[1], update_page2_content(*season_date_range(season), player_id)))
+    if season in set(df_cfc_recovery_augmented["seasonName"].dropna()):
+        pages.append(("recovery", TAB_TITLES[2], update_page3_content(season, player_id)))
+    return pages
+
+# =============================================================================
+# Startup Warm-up and Readiness
+# =============================================================================
+
+def get_warmup_jobs() -> list:
+    """Return one (callback, args) job per player x season x tab (page 2: the default range of each season)."""
+    player_ids = [int(p) for p in df_player_resume["player_id"]]
+    jobs = [(update_page1_content, (player_id,)) for player_id in player_ids]
+    for start_date, end_date in sorted(gps_season_date_ranges.values()):
+        for player_id in player_ids:
+            jobs.append((update_page2_content, (start_date, end_date, player_id)))
+    for season in sorted(df_cfc_recovery_augmented["seasonName"].dropna().unique()):
+        for player_id in player_ids:
+            jobs.append((update_page3_content, (season, player_id)))
+    return jobs
+
+def precompute_page1_cards():
+    """Build the cached overview cards and donuts of every player once the season data is loaded."""
+    for _, player in df_player_resume.iterrows():
+        page1_cards(player)
+
+precompute_page1_cards()
+
+warmup = Warmup(
+    get_warmup_jobs() if WARMUP and response_cache is not None else [],
+    max_workers=WARMUP_WORKERS
+)
+warmup.start()
+
+@server.route("/ready")
+def ready():
+    status = warmup.status()
+    return flask.jsonify(status), 200 if warmup.ready.is_set() else 503
+
+# =============================================================================
+# Static Snapshot
+# =============================================================================
+
+def build_snapshot() -> snapshot.Snapshot:
+    """
+    Return the static snapshot, generating it if needed (see snapshot.py). It is
+    keyed like the response cache: a change of the data, of the rendering code
+    (including the snapshot pages) or of the render options makes a new one.
+    """
+    with metrics.unrecorded():
+        return snapshot.Snapshot.build(
+            SNAPSHOT_DIR, f"{DATA_VERSION}-{render_version('app', 'snapshot', 'static_html')}", report_pages,
+            players=list(zip(df_player_resume["player_id"].astype(int), df_player_resume["name"])),
+            seasons=report_seasons()
+        )
+
+if SNAPSHOT:
+    snapshot.init_app(server, build_snapshot())
+
 # =============================================================================
 # Run the app
 # =============================================================================
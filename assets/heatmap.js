@@ -0,0 +1,45 @@
+/* Recovery heatmap cell text (see render_recovery_heatmap in components.py).
+   The scores are written in the cells only while few enough cells are visible:
+   on zoom, the visible cells are counted from the axis ranges (one unit per cell)
+   and the trace's texttemplate is switched on or off. The layout meta holds the
+   cell text, the cell budget and the [rows, columns] shape of the heatmap. */
+(function () {
+    function visibleCells(relayoutData, layout, axis, size) {
+        if (relayoutData[axis + '.autorange']) {
+            return size;
+        }
+        let range = [relayoutData[axis + '.range[0]'], relayoutData[axis + '.range[1]']];
+        if (range[0] === undefined && relayoutData[axis + '.range']) {
+            range = relayoutData[axis + '.range'];
+        }
+        if (range[0] === undefined && layout[axis] && !layout[axis].autorange && layout[axis].range) {
+            range = layout[axis].range;
+        }
+        if (range[0] === undefined) {
+            return size;
+        }
+        return Math.min(size, Math.max(1, Math.ceil(Math.abs(range[1] - range[0]))));
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        heatmap: {
+            cell_text: function (relayoutData, figure) {
+                const noUpdate = window.dash_clientside.no_update;
+                if (!relayoutData || !figure || !figure.layout || !figure.layout.meta) {
+                    return noUpdate;
+                }
+                const meta = figure.layout.meta;
+                const cells = visibleCells(relayoutData, figure.layout, 'yaxis', meta.shape[0])
+                    * visibleCells(relayoutData, figure.layout, 'xaxis', meta.shape[1]);
+                const texttemplate = cells <= meta.max_text_cells ? meta.cell_text : '';
+                const trace = figure.data[0];
+                if ((trace.texttemplate || '') === texttemplate) {
+                    return noUpdate;
+                }
+                return Object.assign({}, figure, {
+                    data: [Object.assign({}, trace, {texttemplate: texttemplate})].concat(figure.data.slice(1))
+                });
+            }
+        }
+    });
+})();
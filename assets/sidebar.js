@@ -0,0 +1,203 @@
+/* Virtualized player sidebar (see get_sidebar and get_sidebar_stores in components.py).
+   Players are grouped by position group; only the rows in view, plus a few overscan
+   rows, are mounted, so pictures are only requested when their avatar scrolls in.
+   The viewport is only published when the range of rows to mount changes, and the
+   player selection is resolved client-side: scrolling sends no server request. */
+(function () {
+    function vh(value) { return value * window.innerHeight / 100; }
+    function vw(value) { return value * window.innerWidth / 100; }
+
+    function layoutRows(config, collapsed) {
+        // One row per group header and per avatar of an expanded group, with its offset in px.
+        const counts = {};
+        config.players.forEach(function (player) {
+            counts[player.group] = (counts[player.group] || 0) + 1;
+        });
+        const headerPx = vh(config.header_vh);
+        const avatarPx = vw(config.avatar_vw) + 2 * vh(config.margin_vh);
+        const rows = [];
+        let top = 0;
+        let group = null;
+        config.players.forEach(function (player) {
+            if (player.group !== group) {
+                group = player.group;
+                rows.push({header: true, group: group, count: counts[group], top: top, height: headerPx});
+                top += headerPx;
+            }
+            if (collapsed.indexOf(group) === -1) {
+                rows.push({header: false, player: player, top: top, height: avatarPx});
+                top += avatarPx;
+            }
+        });
+        return {rows: rows, height: top, avatarPx: avatarPx};
+    }
+
+    function firstVisibleRow(rows, y) {
+        let lo = 0;
+        let hi = rows.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (rows[mid].top + rows[mid].height < y) { lo = mid + 1; } else { hi = mid; }
+        }
+        return lo;
+    }
+
+    function visibleRange(layout, viewport, config) {
+        // [first, end) indices of the rows in view, plus the overscan rows.
+        const overscan = config.overscan_rows * layout.avatarPx;
+        const start = viewport.scrollTop - vh(config.padding_top_vh) - overscan;
+        const end = viewport.scrollTop - vh(config.padding_top_vh) + viewport.height + overscan;
+        const first = firstVisibleRow(layout.rows, start);
+        let last = first;
+        while (last < layout.rows.length && layout.rows[last].top <= end) { last++; }
+        return [first, last];
+    }
+
+    // Last rendered state, used to publish the viewport only when the rows to mount change.
+    const rendered = {config: null, collapsed: [], range: null};
+
+    function renderHeader(row, config, collapsed) {
+        const px = row.height + 'px';
+        return {
+            namespace: 'dash_html_components',
+            type: 'Div',
+            props: {
+                id: {type: 'sidebar-group', index: row.group},
+                children: (collapsed.indexOf(row.group) === -1 ? '▾ ' : '▸ ') +
+                    row.group.toUpperCase() + ' (' + row.count + ')',
+                style: {
+                    position: 'absolute',
+                    top: row.top + 'px',
+                    left: '0',
+                    width: '100%',
+                    height: px,
+                    lineHeight: px,
+                    textAlign: 'center',
+                    whiteSpace: 'nowrap',
+                    overflow: 'hidden',
+                    textOverflow: 'ellipsis',
+                    cursor: 'pointer',
+                    fontFamily: 'ChelseaBold',
+                    fontSize: config.header_fontsize_vw + 'vw',
+                    color: config.text_color
+                }
+            }
+        };
+    }
+
+    function renderAvatar(row, config, selected) {
+        const player = row.player;
+        return {
+            namespace: 'dash_html_components',
+            type: 'Div',
+            props: {
+                id: {type: 'player-img', index: player.player_id},
+                title: player.name,
+                style: {
+                    position: 'absolute',
+                    top: (row.top + vh(config.margin_vh)) + 'px',
+                    left: '50%',
+                    transform: 'translateX(-50%)',
+                    width: config.avatar_vw + 'vw',
+                    height: config.avatar_vw + 'vw',
+                    borderRadius: '50%',
+                    cursor: 'pointer',
+                    overflow: 'hidden',
+                    backgroundColor: config.avatar_color,
+                    display: 'flex',
+                    alignItems: 'flex-start',
+                    justifyContent: 'center',
+                    border: player.player_id === selected ? config.selected_border_vh + 'vh solid white' : 'none'
+                },
+                children: {
+                    namespace: 'dash_html_components',
+                    type: 'Img',
+                    props: {
+                        src: player.picture_url,
+                        style: {height: '240%', objectFit: 'cover'}
+                    }
+                }
+            }
+        };
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        sidebar: {
+            render: function (viewport, collapsed, selected, config) {
+                if (!config) {
+                    return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+                }
+                collapsed = collapsed || [];
+                viewport = viewport || {scrollTop: 0, height: window.innerHeight};
+                const layout = layoutRows(config, collapsed);
+                const range = visibleRange(layout, viewport, config);
+                rendered.config = config;
+                rendered.collapsed = collapsed;
+                rendered.range = range;
+                const children = layout.rows.slice(range[0], range[1]).map(function (row) {
+                    return row.header ? renderHeader(row, config, collapsed) : renderAvatar(row, config, selected);
+                });
+                return [children, {position: 'relative', width: '100%', height: layout.height + 'px'}];
+            },
+
+            select_player: function () {
+                // Avatars are mounted and unmounted while the sidebar scrolls: only a real click counts.
+                const triggered = window.dash_clientside.callback_context.triggered[0];
+                if (!triggered || !triggered.value) {
+                    return window.dash_clientside.no_update;
+                }
+                return JSON.parse(triggered.prop_id.slice(0, triggered.prop_id.lastIndexOf('.'))).index;
+            },
+
+            toggle_group: function (nClicks, collapsed) {
+                const triggered = window.dash_clientside.callback_context.triggered[0];
+                if (!triggered || !triggered.value) {
+                    return window.dash_clientside.no_update;
+                }
+                const group = JSON.parse(triggered.prop_id.slice(0, triggered.prop_id.lastIndexOf('.'))).index;
+                collapsed = (collapsed || []).slice();
+                const position = collapsed.indexOf(group);
+                if (position === -1) { collapsed.push(group); } else { collapsed.splice(position, 1); }
+                return collapsed;
+            }
+        }
+    });
+
+    // Publish the scroll position of the sidebar at most once per animation frame,
+    // and only when it changes the rows to mount (or the window size).
+    let pending = false;
+    let publishedSize = null;
+
+    function publishViewport() {
+        pending = false;
+        const sidebar = document.getElementById('sidebar');
+        if (!sidebar || !window.dash_clientside.set_props) {
+            return;
+        }
+        const viewport = {scrollTop: sidebar.scrollTop, height: sidebar.clientHeight, width: window.innerWidth};
+        const size = window.innerWidth + 'x' + window.innerHeight;
+        if (rendered.config && rendered.range && size === publishedSize) {
+            const range = visibleRange(layoutRows(rendered.config, rendered.collapsed), viewport, rendered.config);
+            if (range[0] === rendered.range[0] && range[1] === rendered.range[1]) {
+                return;
+            }
+        }
+        publishedSize = size;
+        window.dash_clientside.set_props('sidebar-viewport', {data: viewport});
+    }
+
+    function scheduleViewport() {
+        if (!pending) {
+            pending = true;
+            window.requestAnimationFrame(publishViewport);
+        }
+    }
+
+    // Scroll events do not bubble: listen in the capture phase.
+    document.addEventListener('scroll', function (event) {
+        if (event.target && event.target.id === 'sidebar') {
+            scheduleViewport();
+        }
+    }, true);
+    window.addEventListener('resize', scheduleViewport);
+})();
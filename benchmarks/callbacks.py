@@ -0,0 +1,49 @@
+import json
+
+# =============================================================================
+# Dash Callback Requests
+# =============================================================================
+
+CALLBACK_ENDPOINT = "/_dash-update-component"
+
+def stringify_id(component_id) -> str:
+    """Return a component id as the Dash renderer writes it (pattern-matching ids are sorted JSON)."""
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(",", ":"))
+    return component_id
+
+def _dependency(item):
+    # A list of (id, property, value) tuples stands for an ALL pattern-matching input.
+    if isinstance(item, list):
+        return [_dependency(i) for i in item]
+    component_id, prop, value = item
+    return {"id": component_id, "property": prop, "value": value}
+
+def _output(output: str) -> dict:
+    component_id, prop = output.split(".")
+    return {"id": component_id, "property": prop}
+
+def callback_request(output, inputs: list, state: list = (), changed: str = None) -> dict:
+    """
+    Build the JSON body that the Dash renderer posts to the callback endpoint.
+
+    `output` is "component-id.property" (or a list of them for a multi-output
+    callback), `inputs` and `state` are lists of (id, property, value) tuples,
+    and `changed` is the input that fired the callback ("id.property", the
+    first input by default).
+    """
+    if changed is None:
+        first = inputs[0][0] if isinstance(inputs[0], list) else inputs[0]
+        changed = f"{stringify_id(first[0])}.{first[1]}"
+    if isinstance(output, list):
+        outputs = [_output(o) for o in output]
+        output = ".." + "...".join(output) + ".."
+    else:
+        outputs = _output(output)
+    return {
+        "output": output,
+        "outputs": outputs,
+        "inputs": [_dependency(i) for i in inputs],
+        "changedPropIds": [changed],
+        "state": [_dependency(s) for s in state]
+    }
@@ -0,0 +1,283 @@
+"""
+Load test of one instance of the dashboard with concurrent simulated coaches.
+
+Each session replays what a browser sends to the Dash callback endpoint: the
+initial page load, then tab switches, player clicks and season changes,
+separated by a random think time. Runs fully offline against a server started
+in-process (Werkzeug, threaded) or against a server started separately:
+
+    python -m benchmarks.loadtest --sessions 20 --duration 60
+    gunicorn app:server -w 4 -b 127.0.0.1:8050 &
+    python -m benchmarks.loadtest --url http://127.0.0.1:8050 --sessions 50
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from werkzeug.serving import make_server
+
+import app as dashboard
+from benchmarks.callbacks import CALLBACK_ENDPOINT, callback_request
+
+# =============================================================================
+# Simulated Coach Session
+# =============================================================================
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+class Recorder:
+    """Thread-safe store of (callback, latency, ok) samples."""
+
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, callback: str, latency: float, ok: bool):
+        with self._lock:
+            self.samples.setdefault(callback, []).append((latency, ok))
+
+class CoachSession:
+    """
+    One simulated user. The callbacks of an interaction are posted in the
+    order the Dash renderer fires them; the state (tab, player, season) follows
+    the same stores as the dashboard layout.
+    """
+
+    def __init__(self, base_url: str, recorder: Recorder, rng: random.Random,
+                 players: list, seasons: dict, think_time: float, poll_interval: float):
+        self.url = base_url.rstrip("/") + CALLBACK_ENDPOINT
+        self.recorder = recorder
+        self.rng = rng
+        self.players = players
+        self.seasons = seasons
+        self.think_time = think_time
+        self.poll_interval = poll_interval
+        self.tab = 1
+        self.player = players[0]
+        self.season = seasons[2][0]
+        self.tab_clicks = [0] * len(dashboard.TAB_IDS)
+
+    def _post(self, body: dict, query: str = ""):
+        request = urllib.request.Request(
+            self.url + query,
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=120) as response:
+            payload = response.read()
+        return json.loads(payload) if payload else None
+
+    def call(self, name: str, body: dict):
+        """Post one callback (polling background jobs until they finish) and record its latency."""
+        start = time.perf_counter()
+        ok = True
+        try:
+            result = self._post(body)
+            # Background callbacks answer with a job id first: poll like the renderer does.
+            if isinstance(result, dict) and "cacheKey" in result and "response" not in result:
+                query = f"?cacheKey={result['cacheKey']}&job={result['job']}"
+                while result is not None and "response" not in result:
+                    time.sleep(self.poll_interval)
+                    result = self._post(body, query)
+        except (urllib.error.URLError, OSError, ValueError):
+            ok = False
+        self.recorder.add(name, time.perf_counter() - start, ok)
+
+    # -- callbacks -------------------------------------------------------------
+
+    def page_callback(self):
+        if self.tab == 1:
+            self.call("update_page1_content", callback_request(
+                "page1-content.children", [("selected-player", "data", self.player)]
+            ))
+        elif self.tab == 2:
+            start_date, end_date = dashboard.season_date_range(self.season)
+            self.call("update_page2_content", callback_request(
+                "page2-content.children",
+                [("date-range", "start_date", start_date), ("date-range", "end_date", end_date),
+                 ("selected-player", "data", self.player)]
+            ))
+        else:
+            self.call(f"update_page{self.tab}_content", callback_request(
+                f"page{self.tab}-content.children",
+                [("season-dropdown", "value", self.season), ("selected-player", "data", self.player)]
+            ))
+
+    def tab_callbacks(self):
+        self.call("update_tab_bar", callback_request("tab-bar.children", [("selected-tab", "data", self.tab)]))
+        self.call("update_content", callback_request(
+            "page-content.children",
+            [("selected-tab", "data", self.tab)],
+            [("selected-season", "data", self.season)]
+        ))
+        self.page_callback()
+
+    # -- interactions ----------------------------------------------------------
+
+    def open_dashboard(self):
+        # The sidebar is rendered client-side: it sends no request.
+        self.tab_callbacks()
+
+    def switch_tab(self):
+        self.tab = self.rng.choice([t for t in range(1, len(dashboard.TAB_IDS) + 1) if t != self.tab])
+        self.tab_clicks[self.tab - 1] += 1
+        self.call("select_tab", callback_request(
+            "selected-tab.data",
+            [(tab_id, "n_clicks", clicks) for tab_id, clicks in zip(dashboard.TAB_IDS, self.tab_clicks)],
+            changed=f"{dashboard.TAB_IDS[self.tab - 1]}.n_clicks"
+        ))
+        if self.tab != 1 and self.season not in self.seasons[self.tab]:
+            self.season = self.seasons[self.tab][0]
+        self.tab_callbacks()
+
+    def click_player(self):
+        # The avatar click is resolved client-side: only the page callback is sent.
+        self.player = self.rng.choice([p for p in self.players if p != self.player] or self.players)
+        self.page_callback()
+
+    def change_season(self):
+        options = [s for s in self.seasons[self.tab] if s != self.season]
+        if not options:
+            return self.switch_tab()
+        self.season = self.rng.choice(options)
+        if self.tab == 2:
+            # The season dropdown of page 2 presets the date range, which triggers the page.
+            self.call("select_season_date_range", callback_request(
+                ["date-range.start_date", "date-range.end_date"], [("season-dropdown", "value", self.season)]
+            ))
+        self.page_callback()
+        self.call("store_selected_season", callback_request(
+            "selected-season.data", [("season-dropdown", "value", self.season)]
+        ))
+
+    def run(self, deadline: float, max_actions: int = None):
+        self.open_dashboard()
+        actions = 0
+        while time.monotonic() < deadline and (max_actions is None or actions < max_actions):
+            time.sleep(self.rng.uniform(0, 2 * self.think_time))
+            if self.tab == 1:
+                action = self.rng.choices([self.switch_tab, self.click_player], weights=[0.5, 0.5])[0]
+            else:
+                action = self.rng.choices(
+                    [self.switch_tab, self.click_player, self.change_season], weights=[0.4, 0.4, 0.2]
+                )[0]
+            action()
+            actions += 1
+
+# =============================================================================
+# Runner and Report
+# =============================================================================
+
+def start_local_server(host: str = "127.0.0.1"):
+    """Serve app.server on a free local port from a background thread."""
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server(host, 0, dashboard.server, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, name="loadtest-server", daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_port}"
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    """Return throughput and latency percentiles (in ms) per callback and overall."""
+    report = {}
+    all_samples = []
+    for callback, samples in sorted(recorder.samples.items()):
+        all_samples.extend(samples)
+        report[callback] = _summarize_samples(samples, elapsed)
+    report["all"] = _summarize_samples(all_samples, elapsed)
+    return report
+
+def _summarize_samples(samples: list, elapsed: float) -> dict:
+    latencies = sorted(latency * 1000 for latency, _ in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for _, ok in samples if not ok),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0
+    }
+
+def print_report(report: dict):
+    header = f"{'callback':<28}{'requests':>10}{'errors':>8}{'req/s':>9}{'p50 (ms)':>11}{'p95 (ms)':>11}{'p99 (ms)':>11}{'max (ms)':>11}"
+    print(header)
+    print("-" * len(header))
+    for callback, s in report.items():
+        if callback == "all":
+            print("-" * len(header))
+        print(
+            f"{callback:<28}{s['requests']:>10}{s['errors']:>8}{s['throughput_rps']:>9.2f}"
+            f"{s['p50_ms']:>11.1f}{s['p95_ms']:>11.1f}{s['p99_ms']:>11.1f}{s['max_ms']:>11.1f}"
+        )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server (default: start one in-process).")
+    parser.add_argument("--sessions", type=int, default=10, help="Number of concurrent simulated coaches.")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration, in seconds.")
+    parser.add_argument("--actions", type=int, default=None, help="Stop each session after this many interactions.")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which the sessions are started.")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause between interactions, in seconds.")
+    parser.add_argument("--poll-interval", type=float, default=0.1, help="Polling interval of background callbacks.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the interaction sequences.")
+    parser.add_argument("--output", help="Also write the report as JSON to this file.")
+    args = parser.parse_args(argv)
+
+    players = [int(p) for p in dashboard.df_player_resume.sort_values("group_id")["player_id"]]
+    seasons = {
+        2: sorted(dashboard.df_cfc_gps_data_processed["season"].dropna().unique(), reverse=True),
+        3: sorted(dashboard.df_cfc_recovery_augmented["seasonName"].dropna().unique(), reverse=True)
+    }
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server, base_url = start_local_server()
+    print(f"{args.sessions} sessions against {base_url} for {args.duration:g}s", file=sys.stderr)
+
+    recorder = Recorder()
+    start = time.monotonic()
+    deadline = start + args.ramp_up + args.duration
+    threads = []
+    for i in range(args.sessions):
+        session = CoachSession(
+            base_url, recorder, random.Random(args.seed + i), players, seasons,
+            args.think_time, args.poll_interval
+        )
+        delay = args.ramp_up * i / args.sessions
+        thread = threading.Thread(
+            target=lambda s=session, d=delay: (time.sleep(d), s.run(deadline, args.actions)),
+            name=f"coach-{i}",
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+    if server is not None:
+        server.shutdown()
+
+    report = summarize(recorder, elapsed)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "meta": {"url": base_url, "sessions": args.sessions, "duration_s": round(elapsed, 2),
+                         "think_time_s": args.think_time, "seed": args.seed},
+                "callbacks": report
+            }, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Benchmark suite of the data pipeline, the renderers and the callbacks.
+
+Run from the repository root:
+
+    python -m benchmarks.run                          # 1x, 10x and 100x the squad
+    python -m benchmarks.run --scales 1 10 --save-baseline
+    python -m benchmarks.run --compare benchmarks/baseline.json --fail-threshold 20
+    python -m benchmarks.run --scales 1 --sections payload   # figure sizes per array encoding
+    python -m benchmarks.run --scales 1 --sections serialize # JSON encoding time per engine
+"""
+import os
+
+# The benchmarks measure real renders: no response cache, warm-up or metrics.
+os.environ["CFC_RESPONSE_CACHE"] = "0"
+os.environ["CFC_WARMUP"] = "0"
+os.environ["CFC_METRICS"] = "0"
+
+import argparse
+import gzip
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from functools import wraps
+
+import dash
+import pandas as pd
+import plotly
+from dash import dcc
+from plotly.io.json import to_json_plotly
+
+import app as dashboard
+import components
+import data_loader
+import figure_templates
+import serialization
+from benchmarks.callbacks import CALLBACK_ENDPOINT, callback_request
+from benchmarks.synthetic import make_synthetic_raw_data, write_raw_data
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_RESULTS_DIR = os.path.join("benchmarks", "results")
+
+# =============================================================================
+# Timing Helpers
+# =============================================================================
+
+def summarize(samples: list) -> dict:
+    """Return the median, min and number of runs of a list of durations (in seconds)."""
+    return {
+        "median_s": round(statistics.median(samples), 6),
+        "min_s": round(min(samples), 6),
+        "runs": len(samples)
+    }
+
+class StageTimer:
+    """Stage runner for data_loader.run_pipeline that records the duration of each stage."""
+
+    def __init__(self):
+        self.timings = {}
+
+    def run(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.timings.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+class RendererTimer:
+    """Wrap the render_* functions used by app.py to time each call made by the callbacks."""
+
+    def __init__(self):
+        self.timings = {}
+        self.originals = {}
+
+    def install(self):
+        for name in dir(components):
+            if name.startswith("render_") and hasattr(dashboard, name):
+                self.originals[name] = getattr(dashboard, name)
+                setattr(dashboard, name, self._timed(name, self.originals[name]))
+
+    def uninstall(self):
+        for name, func in self.originals.items():
+            setattr(dashboard, name, func)
+
+    def _timed(self, name, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.timings.setdefault(name, []).append(time.perf_counter() - start)
+            return result
+        return wrapper
+
+class FigureRecorder(RendererTimer):
+    """Wrap the render_* functions used by app.py to record the figures (and components) they return."""
+
+    def __init__(self):
+        super().__init__()
+        self.figures = {}
+        self.outputs = {}
+
+    def _timed(self, name, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            graphs = [c for c in [result, *result._traverse()] if isinstance(c, dcc.Graph)]
+            if graphs:
+                self.figures.setdefault(name, []).extend(graph.figure for graph in graphs)
+                self.outputs.setdefault(name, []).append(result)
+            return result
+        return wrapper
+
+# =============================================================================
+# Benchmark Sections
+# =============================================================================
+
+def use_frames(frames: dict):
+    """Point the app (and the renderers reading data_loader) at the given processed frames."""
+    for name, frame in frames.items():
+        setattr(dashboard, name, frame)
+        setattr(data_loader, name, frame)
+
+def bench_pipeline(base_raw: dict, scale: int, repeat: int) -> tuple:
+    """Time each data_loader stage on a synthetic squad; return the timings and the last frames."""
+    raw = make_synthetic_raw_data(base_raw, scale)
+    timer = StageTimer()
+    frames = None
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_raw_data(raw, data_dir)
+        for _ in range(repeat):
+            raw_data = timer.run("csv_reads", data_loader.read_raw_data, data_dir)
+            frames = data_loader.run_pipeline(raw_data, timer.run)
+    return {f"pipeline.{name}": summarize(samples) for name, samples in timer.timings.items()}, frames
+
+def representative_slice(frames: dict) -> tuple:
+    """Return the player and season used by the renderer and callback benchmarks."""
+    player_id = int(frames["df_player_resume"]["player_id"].iloc[0])
+    season = sorted(frames["df_cfc_gps_data_processed"]["season"].dropna().unique())[-1]
+    return player_id, season
+
+def bench_renderers(frames: dict, repeat: int) -> dict:
+    """Time every render_* call made by the page callbacks for a representative player and season."""
+    player_id, season = representative_slice(frames)
+    timer = RendererTimer()
+    timer.install()
+    try:
+        for _ in range(repeat):
+            dashboard.update_page1_content(player_id)
+            dashboard.update_page2_content(*dashboard.season_date_range(season), player_id)
+            dashboard.update_page3_content(season, player_id)
+    finally:
+        timer.uninstall()
+    return {f"renderer.{name}": summarize(samples) for name, samples in timer.timings.items()}
+
+def bench_callbacks(frames: dict, repeat: int) -> dict:
+    """Time full HTTP round trips (dispatch, callback, serialization) of the page callbacks."""
+    player_id, season = representative_slice(frames)
+    client = dashboard.server.test_client()
+    client.get("/")
+    requests = {"update_content": []}
+    for tab in (1, 2, 3):
+        requests["update_content"].append(callback_request(
+            "page-content.children",
+            [("selected-tab", "data", tab)],
+            [("selected-season", "data", season)]
+        ))
+    requests["update_page1_content"] = [callback_request(
+        "page1-content.children",
+        [("selected-player", "data", player_id)]
+    )]
+    start_date, end_date = dashboard.season_date_range(season)
+    requests["update_page2_content"] = [callback_request(
+        "page2-content.children",
+        [("date-range", "start_date", start_date), ("date-range", "end_date", end_date),
+         ("selected-player", "data", player_id)]
+    )]
+    requests["update_page3_content"] = [callback_request(
+        "page3-content.children",
+        [("season-dropdown", "value", season), ("selected-player", "data", player_id)]
+    )]
+    results = {}
+    for name, bodies in requests.items():
+        samples = []
+        sizes = []
+        for _ in range(repeat):
+            for body in bodies:
+                start = time.perf_counter()
+                response = client.post(CALLBACK_ENDPOINT, json=body)
+                samples.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{name} returned HTTP {response.status_code}")
+                sizes.append(len(response.get_data()))
+        results[f"callback.{name}"] = {**summarize(samples), "payload_bytes": max(sizes)}
+    return results
+
+FIGURE_ARRAY_MODES = ["json", "f8", "f4"]
+
+def bench_payloads(frames: dict) -> dict:
+    """
+    Serialize every figure rendered by the page callbacks for a representative
+    player and season with each array encoding, and report their sizes.
+    """
+    player_id, season = representative_slice(frames)
+    sizes = {}
+    original_mode = figure_templates.FIGURE_ARRAYS
+    try:
+        for mode in FIGURE_ARRAY_MODES:
+            figure_templates.FIGURE_ARRAYS = mode
+            recorder = FigureRecorder()
+            recorder.install()
+            try:
+                dashboard.update_page1_content(player_id)
+                dashboard.update_page2_content(*dashboard.season_date_range(season), player_id)
+                dashboard.update_page3_content(season, player_id)
+            finally:
+                recorder.uninstall()
+            for name, figures in recorder.figures.items():
+                payload = "".join(to_json_plotly(fig) for fig in figures).encode("utf-8")
+                sizes.setdefault(name, {})[mode] = (len(payload), len(gzip.compress(payload)))
+    finally:
+        figure_templates.FIGURE_ARRAYS = original_mode
+
+    print(f"\n{'figure':<36}" + "".join(f"{mode + ' (KB)':>12}{'gzip':>8}" for mode in FIGURE_ARRAY_MODES))
+    for name, by_mode in sizes.items():
+        print(f"{name:<36}" + "".join(
+            f"{by_mode[mode][0] / 1024:>12.1f}{by_mode[mode][1] / 1024:>8.1f}" for mode in FIGURE_ARRAY_MODES
+        ))
+    return {
+        f"payload.{name}.{mode}": {"bytes": raw, "gzip_bytes": compressed}
+        for name, by_mode in sizes.items()
+        for mode, (raw, compressed) in by_mode.items()
+    }
+
+# JSON engines of the callback responses: Dash's default (plotly's encoder, which
+# picks orjson when installed) and the single-pass orjson path of serialization.py.
+JSON_ENGINES = {
+    "plotly-json": lambda value: to_json_plotly(value, engine="json"),
+    "plotly-orjson": lambda value: to_json_plotly(value, engine="orjson"),
+    "orjson": serialization.orjson_dumps
+}
+
+def bench_serialization(frames: dict, repeat: int) -> dict:
+    """
+    Time the JSON encoding of the components returned by each renderer (as Dash
+    sends them) for a representative player and season, with each JSON engine.
+    """
+    player_id, season = representative_slice(frames)
+    recorder = FigureRecorder()
+    recorder.install()
+    try:
+        dashboard.update_page1_content(player_id)
+        dashboard.update_page2_content(*dashboard.season_date_range(season), player_id)
+        dashboard.update_page3_content(season, player_id)
+    finally:
+        recorder.uninstall()
+    engines = {name: engine for name, engine in JSON_ENGINES.items() if serialization.orjson or "orjson" not in name}
+    results = {}
+    for name, outputs in recorder.outputs.items():
+        response = {"multi": True, "response": {"output": {"children": outputs}}}
+        for engine_name, engine in engines.items():
+            samples = []
+            for _ in range(max(repeat, 5)):
+                start = time.perf_counter()
+                engine(response)
+                samples.append(time.perf_counter() - start)
+            results[f"serialize.{name}.{engine_name}"] = summarize(samples)
+
+    print(f"\n{'renderer':<36}" + "".join(f"{engine_name + ' (ms)':>20}" for engine_name in engines))
+    for name in recorder.outputs:
+        print(f"{name:<36}" + "".join(
+            f"{results[f'serialize.{name}.{engine_name}']['median_s'] * 1000:>20.2f}" for engine_name in engines
+        ))
+    return results
+
+# =============================================================================
+# Results and Baseline Comparison
+# =============================================================================
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def compare(results: dict, baseline: dict, threshold_pct: float) -> list:
+    """Print current vs baseline medians and return the keys slower than `threshold_pct`."""
+    regressions = []
+    print(f"\n{'benchmark':<58}{'baseline (ms)':>15}{'current (ms)':>15}{'change':>10}")
+    for key in sorted(results):
+        if key not in baseline or "median_s" not in results[key]:
+            continue
+        before = baseline[key]["median_s"] * 1000
+        after = results[key]["median_s"] * 1000
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > threshold_pct:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key:<58}{before:>15.2f}{after:>15.2f}{change:>+9.1f}%{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Squad size multipliers.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (the median is reported).")
+    parser.add_argument("--sections", nargs="+", default=["pipeline", "renderer", "callback"],
+                        choices=["pipeline", "renderer", "callback", "payload", "serialize"])
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>.json).")
+    parser.add_argument("--compare", default=DEFAULT_BASELINE, help="Baseline file to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Also save the results as the baseline.")
+    parser.add_argument("--fail-threshold", type=float, default=None,
+                        help="Exit with status 1 if a benchmark is slower than the baseline by more than this %%.")
+    args = parser.parse_args(argv)
+
+    base_raw = data_loader.read_raw_data()
+    original_frames = {name: getattr(dashboard, name) for name in data_loader.frames}
+    results = {}
+    try:
+        for scale in args.scales:
+            print(f"Scale {scale}x ({scale * len(base_raw['ref_players'])} players)", file=sys.stderr)
+            stage_results, frames = bench_pipeline(base_raw, scale, args.repeat if "pipeline" in args.sections else 1)
+            if "pipeline" in args.sections:
+                results.update({f"{key}@{scale}x": value for key, value in stage_results.items()})
+            use_frames(frames)
+            if "renderer" in args.sections:
+                results.update({f"{k}@{scale}x": v for k, v in bench_renderers(frames, args.repeat).items()})
+            if "callback" in args.sections:
+                results.update({f"{k}@{scale}x": v for k, v in bench_callbacks(frames, args.repeat).items()})
+            if "payload" in args.sections:
+                results.update({f"{k}@{scale}x": v for k, v in bench_payloads(frames).items()})
+            if "serialize" in args.sections:
+                results.update({f"{k}@{scale}x": v for k, v in bench_serialization(frames, args.repeat).items()})
+    finally:
+        use_frames(original_frames)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "data_version": data_loader.DATA_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "plotly": plotly.__version__,
+            "dash": dash.__version__,
+            "scales": args.scales,
+            "repeat": args.repeat
+        },
+        "results": results
+    }
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    regressions = []
+    if args.compare and os.path.exists(args.compare):
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.fail_threshold if args.fail_threshold is not None else 10.0)
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {DEFAULT_BASELINE}", file=sys.stderr)
+    if regressions and args.fail_threshold is not None:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+# =============================================================================
+# Synthetic Squads
+# =============================================================================
+
+# Raw tables keyed by player: they are replicated once per copy of the squad.
+PLAYER_TABLES = [
+    'ref_players',
+    'agg_player_season',
+    'agg_player_matches',
+    'cfc_gps_data_augmented',
+    'injuries_histo',
+    'cfc_recovery_augmented'
+]
+
+# File name and separator of each raw table, as read by data_loader.read_raw_data.
+RAW_FILES = {
+    'agg_player_matches': ('agg_player_matches.csv', ';'),
+    'agg_player_season': ('agg_player_season.csv', ';'),
+    'matches': ('matches.csv', ';'),
+    'ref_competitions': ('ref_competitions.csv', ';'),
+    'ref_countries': ('ref_country.csv', ';'),
+    'ref_players': ('ref_player.csv', ';'),
+    'ref_teams': ('ref_team.csv', ';'),
+    'cfc_gps_data_augmented': ('cfc_gps_data_augmented.csv', ','),
+    'injuries_histo': ('injuries_histo.csv', ';'),
+    'cfc_recovery_augmented': ('cfc_recovery_status_data_augmented.csv', ',')
+}
+
+def make_synthetic_raw_data(raw_data: dict, scale: int) -> dict:
+    """
+    Return raw tables for a squad `scale` times larger than the real one.
+
+    Every player-keyed table is replicated `scale` times with shifted player ids,
+    so each synthetic player has the same history as the real player it copies.
+    Club-level tables (matches, teams, countries, competitions) are kept as is.
+    """
+    id_step = int(raw_data['ref_players']['player_id'].max())
+    synthetic = {name: df.copy() for name, df in raw_data.items() if name not in PLAYER_TABLES}
+    for name in PLAYER_TABLES:
+        copies = []
+        for k in range(scale):
+            df_copy = raw_data[name].copy()
+            df_copy['player_id'] = df_copy['player_id'] + k * id_step
+            if name == 'ref_players' and k > 0:
+                df_copy['name'] = df_copy['name'] + f" {k + 1}"
+            copies.append(df_copy)
+        synthetic[name] = pd.concat(copies, ignore_index=True)
+    return synthetic
+
+def write_raw_data(raw_data: dict, data_dir: str):
+    """Write raw tables as CSV files readable by data_loader.read_raw_data."""
+    os.makedirs(data_dir, exist_ok=True)
+    for name, (file_name, sep) in RAW_FILES.items():
+        raw_data[name].to_csv(os.path.join(data_dir, file_name), sep=sep, index=False)
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# Load Chart Hover Payloads
+# =============================================================================
+
+# Columns of the customdata of each hover trace of the load chart, with the
+# number of decimals they are displayed with (None for the text labels).
+LOAD_CHART_HOVER_FIELDS = {
+    "load_hover": [
+        ("distance_km", 1), ("day_duration", 0), ("trimp_edwards", 0),
+        ("distance_label", None), ("duration_label", None), ("load_label", None),
+        ("opposition_text", None), ("acwr", 2)
+    ],
+    "availability_hover": [
+        ("injury_label", None), ("injury_date_label", None), ("return_date_label", None),
+        ("body_part_label", None), ("injury_name_label", None)
+    ],
+    "acwr_hover": [("trimp_edwards_acute_load", 0), ("trimp_edwards_chronic_load", 0)]
+}
+
+def build_load_chart_hover(df: pd.DataFrame) -> dict:
+    """
+    Return the customdata of each hover trace of the load chart as a 2-D array
+    with one row per row of the frame (in positional order), the numbers
+    rounded to their displayed precision. Payloads without text are float
+    arrays, so that they can be sent as typed arrays.
+    """
+    hover = {}
+    for name, fields in LOAD_CHART_HOVER_FIELDS.items():
+        numeric = all(decimals is not None for _, decimals in fields)
+        rows = np.empty((len(df), len(fields)), dtype=float if numeric else object)
+        for i, (column, decimals) in enumerate(fields):
+            values = df[column].to_numpy()
+            rows[:, i] = values if decimals is None else np.round(values.astype(float), decimals)
+        hover[name] = rows
+    return hover
@@ -1,10 +1,49 @@
-from dash import html, dcc
-import plotly.graph_objects as go
-import plotly.express as px
+import json
+from functools import lru_cache, wraps
+
+from dash import html, dcc, Patch
 import pandas as pd
+import numpy as np
 from constants import *
 from styles import *
 import dash_bootstrap_components as dbc
+from image_cache import image_url
+from config import (
+    CHART_SCREEN_WIDTH_PX, WEBGL_POINT_THRESHOLD, PROGRESSIVE_LOAD_CHART, LOAD_CHART_COARSE_POINTS,
+    LOAD_CHART_WEEKLY_AFTER_DAYS, LOAD_CHART_MONTHLY_AFTER_DAYS, HEATMAP_TEXT_MAX_CELLS
+)
+from downsampling import downsample_frame
+from chart_hover import build_load_chart_hover
+from serialization import to_json
+from figure_templates import (
+    figure, encode_arrays, load_chart_layout, daily_recovery_layout, recovery_heatmap_layout,
+    weekly_recovery_layout, weekly_recovery_trace, weekly_recovery_menus, recovery_radar_layout
+)
+
+# =============================================================================
+# Cached Components
+# =============================================================================
+
+# Argument tuples kept by each cached component (one per player and layout).
+COMPONENT_CACHE_SIZE = 256
+
+def cached_component(func):
+    """
+    Cache the component built by `func` for its (hashable) positional arguments
+    as serialized JSON, keeping the COMPONENT_CACHE_SIZE most recent ones. Each
+    call returns a new plain-dict tree (the JSON form Dash sends), so a caller
+    that changes it cannot alter later responses.
+    """
+    @lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+    def encoded(*args):
+        return to_json(func(*args))
+
+    @wraps(func)
+    def wrapper(*args):
+        return json.loads(encoded(*args))
+    wrapper.cache_info = encoded.cache_info
+    wrapper.cache_clear = encoded.cache_clear
+    return wrapper
 
 # =============================================================================
 # Static Components
@@ -20,7 +59,7 @@ def get_sidebar_background() -> html.Div:
 
 def get_logo() -> html.Img:
     """Return an image component displaying the Chelsea logo."""
-    return html.Img(src=URL_CHELSEA_LOGO, style=LOGO_STYLE)
+    return html.Img(src=image_url(URL_CHELSEA_LOGO, "club_logo"), style=LOGO_STYLE)
 
 def get_separation_line() -> html.Div:
     """Return a Div styled as a separation line."""
@@ -35,8 +74,48 @@ def get_page_content() -> html.Div:
     return html.Div(id="page-content", style=PAGE_CONTENT_STYLE)
 
 def get_sidebar() -> html.Div:
-    """Return a Div for the sidebar."""
-    return html.Div(id="sidebar")
+    """
+    Return the scrollable sidebar. Its avatars are rendered client-side
+    (assets/sidebar.js), only for the rows currently in view.
+    """
+    return html.Div(
+        id="sidebar",
+        style=SIDEBAR_STYLE,
+        children=html.Div(id="sidebar-window", style=SIDEBAR_WINDOW_STYLE)
+    )
+
+def get_sidebar_stores(df_player_resume: pd.DataFrame) -> list:
+    """
+    Return the stores read by the client-side sidebar: the players sorted and
+    grouped by position group with the sizes used to lay them out, the scroll
+    viewport, and the collapsed groups.
+    """
+    df_sorted = df_player_resume.sort_values('group_id', kind='stable')
+    players = [
+        {
+            "player_id": int(row['player_id']),
+            "name": row['name'],
+            "group": row['group'],
+            "picture_url": image_url(row['player_picture_url'], "player_sidebar")
+        }
+        for _, row in df_sorted.iterrows()
+    ]
+    return [
+        dcc.Store(id="sidebar-players", data={
+            "players": players,
+            "avatar_vw": SCALE_IMAGE_PLAYER_SIDEBAR_VW,
+            "margin_vh": SIDEBAR_AVATAR_MARGIN_VH,
+            "header_vh": SIDEBAR_GROUP_HEADER_VH,
+            "header_fontsize_vw": SIDEBAR_GROUP_FONTSIZE_VW,
+            "padding_top_vh": HEADER_HEIGHT_VH + LOGO_SIZE_VH / 2,
+            "selected_border_vh": 3 * LINEWIDTH_SEPARATION_VH,
+            "overscan_rows": SIDEBAR_OVERSCAN_ROWS,
+            "avatar_color": COLOR_BLUE,
+            "text_color": COLOR_SNOW
+        }),
+        dcc.Store(id="sidebar-viewport"),
+        dcc.Store(id="sidebar-collapsed-groups", data=[])
+    ]
 
 # =============================================================================
 # Dynamic Rendering Functions
@@ -46,10 +125,15 @@ def get_sidebar() -> html.Div:
 # PAGE 1 - Player Details and Stats
 ##############################################
 
+# The player card, season stats and donuts only depend on the values they
+# display, which change at most once per match. Their builders are cached on
+# those values (see precompute_page1_cards in app.py): every render of the same
+# data, for one player or several, returns the same components.
+
 def render_player_image(player, top, left, height):
     """Render the player's image with absolute positioning."""
     return html.Img(
-        src=player["player_picture_url"],
+        src=image_url(player["player_picture_url"], "player_portrait"),
         style={
             "position": "absolute",
             "height": f"{height}vh",
@@ -84,7 +168,7 @@ def render_player_header(player, top, left, title_size, body_size):
             html.Div([
                 html.Span(player["name"].upper(), style={"marginRight": "1vw"}),
                 html.Img(
-                    src=player["url_picture_country"],
+                    src=image_url(player["url_picture_country"], "flag"),
                     style={
                         "height": f"{title_size * 0.8}vh",
                         "verticalAlign": "middle"
@@ -113,6 +197,17 @@ def render_player_header(player, top, left, title_size, body_size):
 
 def render_info_block(player, top, left, value_size, label_size):
     """Render a block showing player's info (age, height, weight, foot)."""
+    items = (
+        (str(player["age"]), "YR"),
+        (str(player["height"]), "CM"),
+        (str(player["weight"]), "KG"),
+        (str(player["foot"].upper()), "FOOT")
+    )
+    return info_block(items, top, left, value_size, label_size)
+
+@cached_component
+def info_block(items, top, left, value_size, label_size):
+    """Cached info block of render_info_block; `items` are its (value, label) pairs."""
     def info_item(value, label):
         return html.Div([
             html.Div(str(value), style={
@@ -126,12 +221,7 @@ def render_info_block(player, top, left, value_size, label_size):
             })
         ])
     return html.Div(
-        children=[
-            info_item(player["age"], "YR"),
-            info_item(player["height"], "CM"),
-            info_item(player["weight"], "KG"),
-            info_item(player["foot"].upper(), "FOOT")
-        ],
+        children=[info_item(value, label) for value, label in items],
         style={
             "position": "absolute",
             "top": f"{top}vh",
@@ -148,13 +238,55 @@ def render_info_block(player, top, left, value_size, label_size):
 def render_season_stats(player, top, left, subtitle_size, body_size):
     """Render the player's season statistics."""
     group_id = player["group_id"]
+    stats = [
+        ("Appearances (Starts):", f"{player['appearances']} ({player['starts']})"),
+        ("Minutes played:", f"{player['minutes']}"),
+        ("Goals / Assists:", f"{player['goals']} / {player['assists']}")
+    ]
+    if group_id == 1:
+        stats += [
+            ("Pass accuracy (%):", player["pass_accuracy"]),
+            ("Saves:", player["save"]),
+            ("Save (%):", player["pct_save"])
+        ]
+    elif group_id == 2:
+        stats += [
+            ("Pass accuracy (%):", player["pass_accuracy"]),
+            ("Tackles:", player["tackles"]),
+            ("Interceptions:", player["interceptions"])
+        ]
+    elif group_id == 3:
+        stats += [
+            ("Pass accuracy (%):", player["pass_accuracy"]),
+            ("Key Passes:", player["key_passes"]),
+            ("Tackles:", player["tackles"]),
+            ("Interceptions:", player["interceptions"])
+        ]
+    elif group_id == 4:
+        stats += [
+            ("Pass accuracy (%):", player["pass_accuracy"]),
+            ("Key Passes:", player["key_passes"]),
+            ("Shots:", player["shots"]),
+            ("Shots on target:", player["shots_on_target"])
+        ]
+    elif group_id == 5:
+        stats += [
+            ("Pass accuracy (%):", player["pass_accuracy"]),
+            ("Shots:", player["shots"]),
+            ("Shots on target:", player["shots_on_target"])
+        ]
+    return season_stats_card(tuple((label, str(value)) for label, value in stats), top, left, subtitle_size, body_size)
+
+@cached_component
+def season_stats_card(stats, top, left, subtitle_size, body_size):
+    """Cached card of render_season_stats; `stats` are its (label, value) lines."""
     def stat_line(label, value):
         return html.Div([
             html.Span(f"{label} ", style={
                 "fontSize": f"{body_size}vh",
                 "fontFamily": "ChelseaRegular"
             }),
-            html.Span(str(value), style={
+            html.Span(value, style={
                 "fontSize": f"{body_size}vh",
                 "fontFamily": "ChelseaBold",
                 "fontWeight": "bold"
@@ -166,42 +298,8 @@ def render_season_stats(player, top, left, subtitle_size, body_size):
             "fontFamily": "ChelseaBold",
             "marginBottom": "1.5vh"
         }),
-        stat_line("Appearances (Starts):", f"{player['appearances']} ({player['starts']})"),
-        stat_line("Minutes played:", f"{player['minutes']}"),
-        stat_line("Goals / Assists:", f"{player['goals']} / {player['assists']}")
+        *(stat_line(label, value) for label, value in stats)
     ]
-    if group_id == 1:
-        lines += [
-            stat_line("Pass accuracy (%):", player["pass_accuracy"]),
-            stat_line("Saves:", player["save"]),
-            stat_line("Save (%):", player["pct_save"])
-        ]
-    elif group_id == 2:
-        lines += [
-            stat_line("Pass accuracy (%):", player["pass_accuracy"]),
-            stat_line("Tackles:", player["tackles"]),
-            stat_line("Interceptions:", player["interceptions"])
-        ]
-    elif group_id == 3:
-        lines += [
-            stat_line("Pass accuracy (%):", player["pass_accuracy"]),
-            stat_line("Key Passes:", player["key_passes"]),
-            stat_line("Tackles:", player["tackles"]),
-            stat_line("Interceptions:", player["interceptions"])
-        ]
-    elif group_id == 4:
-        lines += [
-            stat_line("Pass accuracy (%):", player["pass_accuracy"]),
-            stat_line("Key Passes:", player["key_passes"]),
-            stat_line("Shots:", player["shots"]),
-            stat_line("Shots on target:", player["shots_on_target"])
-        ]
-    elif group_id == 5:
-        lines += [
-            stat_line("Pass accuracy (%):", player["pass_accuracy"]),
-            stat_line("Shots:", player["shots"]),
-            stat_line("Shots on target:", player["shots_on_target"])
-        ]
     return html.Div(
         children=lines,
         style={
@@ -278,7 +376,7 @@ def render_match_column_with_tooltip(
         id=col_id,
         children=[
             html.Img(
-                src=row["opponent_url_picture"],
+                src=image_url(row["opponent_url_picture"], "match_logo"),
                 style={
                     "height": f"{logo_height_vh}vh",
                     "objectFit": "contain",
@@ -390,50 +488,42 @@ def render_last_5_matches_tab(
         }
     )
 
-def render_donut(df, pct_column, player_id, top, left, size_vh, color, background_color, title, title_font_size):
+def render_donut(player, pct_column, top, left, size_vh, color, background_color, title, title_font_size):
     """
     Render a donut chart with a tooltip displaying either the number of starts or minutes.
     For 'starting_eleven_pct', tooltip shows "Starts: <value> out of 45 games".
     For 'minutes_played_pct', tooltip shows "Minutes: <value> out of 4050".
     """
-    player_data = df[df["player_id"] == player_id]
-    pct = player_data[pct_column].iloc[0]
+    pct = player[pct_column]
     if pct_column == 'starting_eleven_pct':
         tooltip_label = "Starts: "
-        tooltip_value = player_data["starts"].iloc[0]
+        tooltip_value = player["starts"]
         tooltip_suffix = " out of 45 games"
     elif pct_column == 'minutes_played_pct':
         tooltip_label = "Minutes: "
-        tooltip_value = player_data["minutes"].iloc[0]
+        tooltip_value = player["minutes"]
         tooltip_suffix = " out of 4050"
     else:
         tooltip_label = "Value: "
         tooltip_value = "N/A"
         tooltip_suffix = ""
     value = int(round(pct * 100, 1))
-    remaining = 100 - value
-    fig = go.Figure(data=[go.Pie(
-        values=[value, remaining],
-        hole=0.6,
-        marker=dict(colors=[color, background_color]),
-        textinfo='none',
-        hoverinfo='skip',
-        sort=False
-    )])
-    fig.update_layout(
-        showlegend=False,
-        margin=dict(l=0, r=0, t=0, b=0),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        annotations=[dict(
-            text=f"{value}%",
-            font=dict(size=20, family="ChelseaBold", color=color),
-            showarrow=False,
-            x=0.5,
-            y=0.5
-        )]
+    return donut_widget(
+        value, tooltip_label, str(tooltip_value), tooltip_suffix, pct_column,
+        top, left, size_vh, color, background_color, title, title_font_size
     )
-    donut_id = f"donut-{player_id}-{pct_column}"
+
+@cached_component
+def donut_widget(
+    value, tooltip_label, tooltip_value, tooltip_suffix, pct_column,
+    top, left, size_vh, color, background_color, title, title_font_size
+):
+    """
+    Cached donut of render_donut, drawn with CSS (see .donut in assets/style.css):
+    a conic gradient ring filled counterclockwise from the top up to `value` %,
+    with the percentage in its hole. No Plotly figure is sent or drawn.
+    """
+    donut_id = f"donut-{pct_column}"
     donut_div = html.Div(
         children=[
             html.Div(title, style={
@@ -443,10 +533,19 @@ def render_donut(df, pct_column, player_id, top, left, size_vh, color, backgroun
                 "marginBottom": "2vh",
                 "textAlign": "center"
             }),
-            dcc.Graph(
-                figure=fig,
-                config={"displayModeBar": False},
-                style={"width": f"{size_vh}vh", "height": f"{size_vh}vh"}
+            html.Div(
+                children=[
+                    html.Div(className="donut-ring"),
+                    html.Div(f"{value}%", className="donut-label", style={"color": color})
+                ],
+                className="donut",
+                style={
+                    "width": f"{size_vh}vh",
+                    "height": f"{size_vh}vh",
+                    "--donut-value": f"{value}%",
+                    "--donut-color": color,
+                    "--donut-background": background_color
+                }
             )
         ],
         id=donut_id,
@@ -474,8 +573,195 @@ def render_donut(df, pct_column, player_id, top, left, size_vh, color, backgroun
 # PAGE 2 - Load, ACWR & Injury Zones
 ##############################################
 
+def vertical_segments(x, y0, y1) -> tuple:
+    """
+    Return the x and y arrays of a single line trace drawing one vertical
+    segment from y0 to y1 at each x, the segments being separated by gaps.
+    """
+    xs = np.empty((len(x), 3), dtype=object)
+    ys = np.empty((len(x), 3), dtype=object)
+    xs[:, 0] = xs[:, 1] = np.asarray(x, dtype=object)
+    ys[:, 0] = y0
+    ys[:, 1] = y1
+    return xs.ravel(), ys.ravel()
+
+def rectangles(x0, x1, y0, y1) -> tuple:
+    """
+    Return the x and y arrays of a single trace filled with fill="toself"
+    drawing one rectangle per (x0, x1) pair, the rectangles being separated by gaps.
+    """
+    x0 = np.asarray(x0, dtype=object)
+    x1 = np.asarray(x1, dtype=object)
+    xs = np.empty((len(x0), 6), dtype=object)
+    ys = np.empty((len(x0), 6), dtype=object)
+    xs[:, 0] = xs[:, 3] = xs[:, 4] = x0
+    xs[:, 1] = xs[:, 2] = x1
+    ys[:, 0] = ys[:, 1] = ys[:, 4] = y0
+    ys[:, 2] = ys[:, 3] = y1
+    return xs.ravel(), ys.ravel()
+
+LOAD_SERIES_COLUMNS = ["trimp_edwards_acute_load", "trimp_edwards_chronic_load", "acwr"]
+LOAD_CHART_ID = "load-chart"
+# Column of the prepared load chart rows holding their position in the frame
+# they were prepared from, which indexes the precomputed hover payloads.
+HOVER_ROW_COLUMN = "hover_row"
+
+def prepare_load_chart_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the rows drawn by the load chart: complete load series sorted by
+    date, with their position in `df` (HOVER_ROW_COLUMN).
+    """
+    df = df.assign(**{HOVER_ROW_COLUMN: np.arange(len(df))})
+    df = df.dropna(subset=LOAD_SERIES_COLUMNS)
+    df = df.sort_values("date")
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+def load_chart_points(width_vw: float, coarse: bool) -> int:
+    """Point budget of the load chart series: about one per pixel, or the coarse budget."""
+    pixel_points = int(width_vw / 100 * CHART_SCREEN_WIDTH_PX)
+    return min(pixel_points, LOAD_CHART_COARSE_POINTS) if coarse else pixel_points
+
+# Pandas frequency and hover label of each resampling period of the load chart.
+LOAD_CHART_PERIODS = {
+    "week": ("W-MON", "Week"),
+    "month": ("MS", "Month")
+}
+
+def load_chart_period(df: pd.DataFrame):
+    """Return the resampling period of the load chart rows ("week" or "month"), or None to keep them daily."""
+    if df.empty:
+        return None
+    span_days = (df["date"].iloc[-1] - df["date"].iloc[0]).days
+    if span_days > LOAD_CHART_MONTHLY_AFTER_DAYS:
+        return "month"
+    if span_days > LOAD_CHART_WEEKLY_AFTER_DAYS:
+        return "week"
+    return None
+
+def resample_load_chart_data(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Aggregate the daily rows of the load chart per week or per month: the loads
+    and ACWR are averaged, the distance, duration and TRIMP summed, and the
+    hover labels describe the period (matches played, injury if any).
+    """
+    freq, label = LOAD_CHART_PERIODS[period]
+    df = df.assign(
+        is_match=df["opposition_text"] != "",
+        is_injured=df["injury_label"] != "Status: FIT<br>"
+    )
+    grouped = df.groupby(pd.Grouper(key="date", freq=freq, label="left", closed="left"))
+    df_period = grouped.agg(
+        trimp_edwards_acute_load=("trimp_edwards_acute_load", "mean"),
+        trimp_edwards_chronic_load=("trimp_edwards_chronic_load", "mean"),
+        acwr=("acwr", "mean"),
+        distance_km=("distance_km", "sum"),
+        day_duration=("day_duration", "sum"),
+        trimp_edwards=("trimp_edwards", "sum"),
+        matches=("is_match", "sum"),
+        injured_days=("is_injured", "sum"),
+        days=("date", "size")
+    )
+    df_period = df_period[df_period["days"] > 0].reset_index()
+    # Injury details of the first injured day of each period.
+    df_injured = df[df["is_injured"]].groupby(
+        pd.Grouper(key="date", freq=freq, label="left", closed="left")
+    )[["injury_date_label", "return_date_label", "body_part_label", "injury_name_label"]].first()
+    df_period = df_period.merge(df_injured, left_on="date", right_index=True, how="left")
+    df_period["opposition_text"] = df_period["matches"].apply(
+        lambda n: f"{label}: {n} match{'es' if n > 1 else ''}<br>" if n else ""
+    )
+    df_period["distance_label"] = f"{label} distance (km): "
+    df_period["duration_label"] = f"{label} duration (minutes): "
+    df_period["load_label"] = f"{label} load (TRIMP): "
+    df_period["injury_label"] = df_period["injured_days"].apply(
+        lambda n: f"Status: INJURED ({n} day{'s' if n > 1 else ''})<br>" if n else "Status: FIT<br>"
+    )
+    return df_period.fillna({
+        "injury_date_label": "", "return_date_label": "", "body_part_label": "", "injury_name_label": ""
+    })
+
+def load_chart_series_data(df: pd.DataFrame, width_vw: float, coarse: bool) -> tuple:
+    """
+    Return the rows drawn by the daily traces of the load chart and their
+    resampling period: the rows of `df` resampled per week or month over long
+    date ranges, otherwise downsampled (LTTB) to the coarse or the per-pixel
+    budget (period None).
+    """
+    period = load_chart_period(df)
+    if period is not None:
+        return resample_load_chart_data(df, period), period
+    return downsample_frame(df, "date", LOAD_SERIES_COLUMNS, load_chart_points(width_vw, coarse)), None
+
+def load_chart_hover_data(df_series: pd.DataFrame, hover: dict = None, resampled: bool = False) -> dict:
+    """
+    Return the customdata of the hover traces for the rows of `df_series`: taken
+    from `hover`, the payloads precomputed for the frame the daily rows were
+    prepared from (see HOVER_ROW_COLUMN), or else built from the rows (period
+    labels when resampled).
+    """
+    if resampled or hover is None:
+        return build_load_chart_hover(df_series)
+    rows = df_series[HOVER_ROW_COLUMN].to_numpy()
+    return {name: customdata[rows] for name, customdata in hover.items()}
+
+def load_chart_series(df_series: pd.DataFrame, hover: dict = None, resampled: bool = False) -> dict:
+    """Return the data of each daily trace of the load chart, keyed by trace name."""
+    dates = df_series["date"]
+    hover = load_chart_hover_data(df_series, hover, resampled)
+    return {
+        "chronic_load": dict(x=dates, y=df_series["trimp_edwards_chronic_load"]),
+        "acute_load": dict(x=dates, y=df_series["trimp_edwards_acute_load"]),
+        "load_hover": dict(x=dates, y=df_series["trimp_edwards_chronic_load"], customdata=hover["load_hover"]),
+        "availability_hover": dict(
+            x=dates,
+            y=np.ones(len(df_series), dtype=np.int8),
+            customdata=hover["availability_hover"]
+        ),
+        "acwr": dict(x=dates, y=df_series["acwr"]),
+        "acwr_hover": dict(x=dates, y=df_series["acwr"], customdata=hover["acwr_hover"])
+    }
+
+def relayout_x_range(relayout_data):
+    """
+    Return the (start, end) x range set by a relayout event of the load chart,
+    "autorange" when the axes are reset, or None when the x range did not change.
+    """
+    if not relayout_data:
+        return None
+    x_keys = {key: value for key, value in relayout_data.items() if key.startswith("xaxis")}
+    if any(key.endswith(".autorange") and value for key, value in x_keys.items()):
+        return "autorange"
+    starts = [value for key, value in x_keys.items() if key.endswith(".range[0]")]
+    ends = [value for key, value in x_keys.items() if key.endswith(".range[1]")]
+    if starts and ends:
+        return starts[0], ends[0]
+    ranges = [value for key, value in x_keys.items() if key.endswith(".range")]
+    return tuple(ranges[0]) if ranges else None
+
+def patch_load_chart_series(
+    df: pd.DataFrame, trace_indices: dict, width_vw: float, coarse: bool, hover: dict = None
+) -> Patch:
+    """
+    Return a Patch replacing the daily traces of the load chart with the rows of
+    `df` (prepared rows, `hover` holding the hover payloads of the frame they
+    were prepared from), resampled or downsampled like the first render (see
+    load_chart_series_data).
+    """
+    df_series, period = load_chart_series_data(df, width_vw, coarse)
+    scatter_type = "scattergl" if len(df_series) > WEBGL_POINT_THRESHOLD else "scatter"
+    patched_figure = Patch()
+    for name, data in load_chart_series(df_series, hover, resampled=period is not None).items():
+        trace = patched_figure["data"][trace_indices[name]]
+        if name != "acute_load":
+            trace["type"] = scatter_type
+        for key, value in encode_arrays(data).items():
+            trace[key] = value
+    return patched_figure
+
 def render_load_and_acwr_subplots(
     df,
+    df_injuries,
     top,
     left,
     width_vw,
@@ -492,7 +778,9 @@ def render_load_and_acwr_subplots(
     fontsize_title,
     fontsize_axis,
     fontsize_legend,
-    logo_size
+    logo_size,
+    hover=None,
+    uirevision=None
 ):
     """
     Render a composite subplot displaying load, ACWR, and injury zone data.
@@ -500,351 +788,271 @@ def render_load_and_acwr_subplots(
       1. Loads: Acute and chronic load.
       2. Injury Zones: Training availability with injury overlays.
       3. ACWR & Risk Zones: ACWR trends with risk zones and injury markers.
+    `df_injuries` holds the injury history; `hover` the precomputed hover
+    payloads of the rows of `df` (see build_load_chart_hover), built from
+    `df` when omitted. The zoom and legend state are kept across the refine
+    Patches of the chart until `uirevision` changes.
     """
-    df = df.dropna(subset=["trimp_edwards_acute_load", "trimp_edwards_chronic_load", "acwr"])
-    df = df.sort_values("date")
-    df["date"] = pd.to_datetime(df["date"])
+    df = prepare_load_chart_data(df)
     x0 = df["date"].min()
     x1 = df["date"].max()
     total_interval_ms = (x1 - x0).total_seconds() * 1000
     computed_sizex = (logo_size / 100) * total_interval_ms
 
-    from plotly.subplots import make_subplots
-    fig = make_subplots(
-        rows=3, cols=1,
-        shared_xaxes=True,
-        row_heights=[0.6, 0.03, 0.3],
-        vertical_spacing=0.12,
-        subplot_titles=(title1, "", title2)
-    )
+    # Level of detail: the daily series are resampled per week or month over long
+    # date ranges, or else downsampled (LTTB) to about one point per pixel of the
+    # chart and drawn with WebGL when they stay dense. In progressive mode the
+    # first render only sends a coarse series: zooming or panning fetches the
+    # visible window (see patch_load_chart_series).
+    df_series, period = load_chart_series_data(df, width_vw, PROGRESSIVE_LOAD_CHART)
+    scatter_type = "scattergl" if len(df_series) > WEBGL_POINT_THRESHOLD else "scatter"
+    series = load_chart_series(df_series, hover, resampled=period is not None)
+    trace_indices = {}
+
+    traces = []
+    shapes = []
 
     # Subplot 1: Loads
-    fig.add_trace(
-        go.Scatter(
-            x=df["date"],
-            y=df["trimp_edwards_chronic_load"],
-            name="Chronic Load",
-            mode="lines",
-            line=dict(color=chronic_color, width=3, dash="dash"),
-            fill="tozeroy",
-            fillcolor="rgba(50,205,50,0.2)",
-            hovertemplate="Chronic Load: %{y:.0f}<extra></extra>"
-        ),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Bar(
-            x=df["date"],
-            y=df["trimp_edwards_acute_load"],
-            name="Acute Load",
-            marker=dict(color=acute_color, line=dict(width=0)),
-            opacity=0.85,
-            hovertemplate="Acute Load: %{y:.0f}<extra></extra>"
-        ),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=df["date"],
-            y=df["trimp_edwards_chronic_load"],
-            mode="markers",
-            marker=dict(size=0, color="rgba(0,0,0,0)"),
-            customdata=df[[ 
-                "distance_km", "day_duration", "trimp_edwards",
-                "distance_label", "duration_label", "load_label",
-                "opposition_text", "acwr"
-            ]].values.tolist(),
-            hovertemplate=(
-                "ACWR: %{customdata[7]:.2f}<br><br>"
-                "%{customdata[6]}%{customdata[3]}%{customdata[0]:.1f}<br>"
-                "%{customdata[4]}%{customdata[1]:.0f}<br>"
-                "%{customdata[5]}%{customdata[2]:.0f}<extra></extra>"
-            ),
-            showlegend=False
+    trace_indices["chronic_load"] = len(traces)
+    traces.append(dict(
+        type=scatter_type,
+        **series["chronic_load"],
+        name="Chronic Load",
+        mode="lines",
+        line=dict(color=chronic_color, width=3, dash="dash"),
+        fill="tozeroy",
+        fillcolor="rgba(50,205,50,0.2)",
+        hovertemplate="Chronic Load: %{y:.0f}<extra></extra>",
+        xaxis="x", yaxis="y"
+    ))
+    trace_indices["acute_load"] = len(traces)
+    traces.append(dict(
+        type="bar",
+        **series["acute_load"],
+        name="Acute Load",
+        marker=dict(color=acute_color, line=dict(width=0)),
+        opacity=0.85,
+        hovertemplate="Acute Load: %{y:.0f}<extra></extra>",
+        xaxis="x", yaxis="y"
+    ))
+    trace_indices["load_hover"] = len(traces)
+    traces.append(dict(
+        type=scatter_type,
+        **series["load_hover"],
+        mode="markers",
+        marker=dict(size=0, color="rgba(0,0,0,0)"),
+        hovertemplate=(
+            "ACWR: %{customdata[7]:.2f}<br><br>"
+            "%{customdata[6]}%{customdata[3]}%{customdata[0]:.1f}<br>"
+            "%{customdata[4]}%{customdata[1]:.0f}<br>"
+            "%{customdata[5]}%{customdata[2]:.0f}<extra></extra>"
         ),
-        row=1, col=1
-    )
-    for _, row_ in df.iterrows():
-        logo_url = row_.get("url_logo_opponent")
-        if pd.notna(logo_url) and logo_url != "" and row_.get("day_duration", 0) > 0:
-            fig.add_shape(
-                type="line",
-                xref="x", yref="y",
-                x0=row_["date"], x1=row_["date"],
-                y0=0, y1=200 - logo_size / 2 - 2,
-                line=dict(dash="dot", color=font_color, width=1),
-                layer="above"
-            )
-            fig.add_layout_image(
-                dict(
-                    source=logo_url,
-                    xref="x",
-                    yref="y",
-                    x=row_["date"],
-                    y=200,
-                    sizex=computed_sizex,
-                    sizey=logo_size,
-                    xanchor="center",
-                    yanchor="middle",
-                    layer="above"
-                )
-            )
-    fig.update_yaxes(range=[0, 1500], row=1, col=1)
+        showlegend=False,
+        xaxis="x", yaxis="y"
+    ))
+    # Match days: one dotted connector trace for all matches (instead of one
+    # shape per match) and the opponent logos assigned to the layout at once.
+    df_matches = df[
+        df["url_logo_opponent"].notna() & (df["url_logo_opponent"] != "") & (df["day_duration"] > 0)
+    ]
+    connector_x, connector_y = vertical_segments(df_matches["date"], 0, 200 - logo_size / 2 - 2)
+    traces.append(dict(
+        type="scatter",
+        x=connector_x,
+        y=connector_y,
+        mode="lines",
+        line=dict(dash="dot", color=font_color, width=1),
+        hoverinfo="skip",
+        showlegend=False,
+        xaxis="x", yaxis="y"
+    ))
+    images = [
+        dict(
+            source=image_url(logo_url, "chart_logo"),
+            xref="x",
+            yref="y",
+            x=date,
+            y=200,
+            sizex=computed_sizex,
+            sizey=logo_size,
+            xanchor="center",
+            yanchor="middle",
+            layer="above"
+        )
+        for date, logo_url in zip(df_matches["date"], df_matches["url_logo_opponent"])
+    ]
 
     # Subplot 2: Injury Zones
-    fig.add_trace(
-        go.Scatter(x=df["date"], y=[None], showlegend=False),
-        row=2, col=1
-    )
-    fig.update_yaxes(
-        range=[0, 1],
-        title_text="Availability",
-        showticklabels=False,
-        showgrid=False,
-        zeroline=False,
-        row=2, col=1
-    )
-    fig.add_shape(
+    traces.append(dict(type="scatter", x=[x0, x1], y=[None, None], showlegend=False, xaxis="x2", yaxis="y2"))
+    shapes.append(dict(
         type="rect",
         xref="x",
         yref="y2",
-        x0=df["date"].min(),
-        x1=df["date"].max(),
+        x0=x0,
+        x1=x1,
         y0=0,
         y1=1,
         fillcolor=COLOR_GREEN,
         opacity=1,
         layer="below",
-        line_width=0
-    )
-    season_start = df["date"].min()
-    season_end = df["date"].max()
-    from data_loader import df_injuries_histo
-    injuries_player = df_injuries_histo[
-        (df_injuries_histo["player_id"] == df["player_id"].iloc[0]) &
-        (df_injuries_histo["injury_date"] <= season_end) &
-        (df_injuries_histo["return_date"] >= season_start)
+        line=dict(width=0)
+    ))
+    injuries_player = df_injuries[
+        (df_injuries["player_id"] == df["player_id"].iloc[0]) &
+        (df_injuries["injury_date"] <= x1) &
+        (df_injuries["return_date"] >= x0)
     ]
-    for _, inj_row in injuries_player.iterrows():
-        x0_inj = max(inj_row["injury_date"], season_start)
-        x1_inj = min(inj_row["return_date"], season_end)
-        if x0_inj >= x1_inj:
-            continue
-        fig.add_shape(
-            type="rect",
-            xref="x",
-            yref="y2",
-            x0=x0_inj,
-            x1=x1_inj,
-            y0=0,
-            y1=1,
-            fillcolor=COLOR_RED,
-            opacity=1,
-            layer="above",
-            line_width=0
-        )
-    fig.add_trace(
-        go.Scatter(
-            x=df["date"],
-            y=[1] * len(df),
-            mode="markers",
-            marker=dict(size=20, color="rgba(0,0,0,0)"),
-            customdata=df[[ 'injury_label', 'injury_date_label', 'return_date_label',
-                             'body_part_label', 'injury_name_label' ]].values.tolist(),
-            hovertemplate=(
-                "%{customdata[0]}%{customdata[1]}%{customdata[2]}"
-                "%{customdata[3]}%{customdata[4]}<extra></extra>"
-            ),
-            showlegend=False
+    injury_x0 = injuries_player["injury_date"].clip(lower=x0)
+    injury_x1 = injuries_player["return_date"].clip(upper=x1)
+    injury_periods = injury_x0 < injury_x1
+    injury_x, injury_y = rectangles(injury_x0[injury_periods], injury_x1[injury_periods], 0, 1)
+    traces.append(dict(
+        type="scatter",
+        x=injury_x,
+        y=injury_y,
+        mode="lines",
+        fill="toself",
+        fillcolor=COLOR_RED,
+        line=dict(width=0, color=COLOR_RED),
+        hoverinfo="skip",
+        showlegend=False,
+        xaxis="x2", yaxis="y2"
+    ))
+    trace_indices["availability_hover"] = len(traces)
+    traces.append(dict(
+        type=scatter_type,
+        **series["availability_hover"],
+        mode="markers",
+        marker=dict(size=20, color="rgba(0,0,0,0)"),
+        hovertemplate=(
+            "%{customdata[0]}%{customdata[1]}%{customdata[2]}"
+            "%{customdata[3]}%{customdata[4]}<extra></extra>"
         ),
-        row=2, col=1
-    )
+        showlegend=False,
+        xaxis="x2", yaxis="y2"
+    ))
 
     # Subplot 3: ACWR and Risk Zones
-    fig.add_shape(
-        type="rect",
-        xref="x3", yref="y3",
-        x0=x0, x1=x1,
-        y0=0, y1=0.8,
-        fillcolor=zone_under_color,
-        opacity=0.7,
-        layer="below",
-        line_width=0,
-        row=3, col=1
-    )
-    fig.add_shape(
-        type="rect",
-        xref="x3", yref="y3",
-        x0=x0, x1=x1,
-        y0=0.8, y1=1.5,
-        fillcolor=zone_optimal_color,
-        opacity=0.7,
-        layer="below",
-        line_width=0,
-        row=3, col=1
-    )
-    fig.add_shape(
-        type="rect",
-        xref="x3", yref="y3",
-        x0=x0, x1=x1,
-        y0=1.5, y1=4,
-        fillcolor=zone_danger_color,
-        opacity=0.7,
-        layer="below",
-        line_width=0,
-        row=3, col=1
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=df["date"],
-            y=df["acwr"],
-            name="ACWR",
-            mode="lines",
-            line=dict(color=acwr_color, width=2),
-            marker=dict(color=acwr_color),
-            hovertemplate="ACWR: %{y:.2f}<extra></extra>"
-        ),
-        row=3, col=1
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=df["date"],
-            y=df["acwr"],
-            mode="markers",
-            marker=dict(size=0, color="rgba(0,0,0,0)"),
-            customdata=df[["trimp_edwards_acute_load", "trimp_edwards_chronic_load"]].values.tolist(),
-            hovertemplate=(
-                "Chronic Load: %{customdata[1]:.0f}<br>"
-                "Acute Load: %{customdata[0]:.0f}<extra></extra>"
-            ),
-            showlegend=False
-        ),
-        row=3, col=1
-    )
-    from data_loader import df_injuries_histo
+    for zone_color, y0, y1 in [
+        (zone_under_color, 0, 0.8),
+        (zone_optimal_color, 0.8, 1.5),
+        (zone_danger_color, 1.5, 4)
+    ]:
+        shapes.append(dict(
+            type="rect",
+            xref="x3", yref="y3",
+            x0=x0, x1=x1,
+            y0=y0, y1=y1,
+            fillcolor=zone_color,
+            opacity=0.7,
+            layer="below",
+            line=dict(width=0)
+        ))
     df_injuries_on_acwr = pd.merge(
         df[["player_id", "date", "acwr"]],
-        df_injuries_histo[["player_id", "injury_date", "return_date", "body_part", "injury_name"]],
+        df_injuries[["player_id", "injury_date", "return_date", "body_part", "injury_name"]],
         how="inner",
         left_on=["player_id", "date"],
         right_on=["player_id", "injury_date"]
     )
-    fig.add_trace(
-        go.Scatter(
-            x=df_injuries_on_acwr["date"],
-            y=df_injuries_on_acwr["acwr"],
-            mode="markers",
-            marker=dict(
-                symbol="cross",
-                size=15,
-                color="white",
-                line=dict(color="red", width=2)
-            ),
-            name="Injury",
-            customdata=df_injuries_on_acwr[["body_part", "injury_name"]].values.tolist(),
-            hovertemplate=(
-                "Body part: %{customdata[0]}<br>"
-                "Injury: %{customdata[1]}<extra></extra>"
-            ),
-            showlegend=True
-        ),
-        row=3, col=1
-    )
-    fig.update_layout(hovermode="closest", hoverdistance=1)
-    for _, row_ in df_injuries_on_acwr.iterrows():
-        fig.add_shape(
-            type="line",
-            xref="x3",
-            yref="y3",
-            x0=row_["date"],
-            x1=row_["date"],
-            y0=0,
-            y1=row_["acwr"],
-            line=dict(dash="dot", color=COLOR_SNOW, width=1),
-            layer="below",
-            row=3, col=1
-        )
-    fig.update_yaxes(range=[0, 2], row=3, col=1)
-
-    dummy_under = go.Scatter(
-        x=[None],
-        y=[None],
-        mode="markers",
-        marker=dict(color=zone_under_color, size=10),
-        name="Under Training (ACWR < 0.8)"
-    )
-    dummy_optimal = go.Scatter(
-        x=[None],
-        y=[None],
-        mode="markers",
-        marker=dict(color=zone_optimal_color, size=10),
-        name="Optimal Workload (0.8 - 1.5)"
-    )
-    dummy_danger = go.Scatter(
-        x=[None],
-        y=[None],
+    # Dotted connectors from the x-axis to each injury marker, drawn first so
+    # that they stay below the ACWR line.
+    connector_x, connector_y = vertical_segments(df_injuries_on_acwr["date"], 0, df_injuries_on_acwr["acwr"])
+    traces.append(dict(
+        type="scatter",
+        x=connector_x,
+        y=connector_y,
+        mode="lines",
+        line=dict(dash="dot", color=COLOR_SNOW, width=1),
+        hoverinfo="skip",
+        showlegend=False,
+        xaxis="x3", yaxis="y3"
+    ))
+    trace_indices["acwr"] = len(traces)
+    traces.append(dict(
+        type=scatter_type,
+        **series["acwr"],
+        name="ACWR",
+        mode="lines",
+        line=dict(color=acwr_color, width=2),
+        marker=dict(color=acwr_color),
+        hovertemplate="ACWR: %{y:.2f}<extra></extra>",
+        xaxis="x3", yaxis="y3"
+    ))
+    trace_indices["acwr_hover"] = len(traces)
+    traces.append(dict(
+        type=scatter_type,
+        **series["acwr_hover"],
         mode="markers",
-        marker=dict(color=zone_danger_color, size=10),
-        name="Danger zone (ACWR > 1.5)"
-    )
-    fig.add_trace(dummy_under)
-    fig.add_trace(dummy_optimal)
-    fig.add_trace(dummy_danger)
-
-    fig.update_layout(
-        hovermode="x unified",
-        xaxis=dict(
-            tickformat="%b %d",
-            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
-            linecolor=font_color,
-            mirror=True
-        ),
-        yaxis=dict(
-            title="Load (TRIMP)",
-            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
-            zeroline=True,
-            zerolinecolor="gray"
+        marker=dict(size=0, color="rgba(0,0,0,0)"),
+        hovertemplate=(
+            "Chronic Load: %{customdata[1]:.0f}<br>"
+            "Acute Load: %{customdata[0]:.0f}<extra></extra>"
         ),
-        yaxis3=dict(
-            title="ACWR",
-            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
-            zeroline=True,
-            zerolinecolor="gray",
-            showgrid=False
+        showlegend=False,
+        xaxis="x3", yaxis="y3"
+    ))
+    traces.append(dict(
+        type="scatter",
+        x=df_injuries_on_acwr["date"],
+        y=df_injuries_on_acwr["acwr"],
+        mode="markers",
+        marker=dict(
+            symbol="cross",
+            size=15,
+            color="white",
+            line=dict(color="red", width=2)
         ),
-        xaxis3=dict(
-            title=None,
-            tickfont=dict(color=font_color),
-            linecolor=font_color,
-            mirror=True
+        name="Injury",
+        customdata=df_injuries_on_acwr[["body_part", "injury_name"]].values.tolist(),
+        hovertemplate=(
+            "Body part: %{customdata[0]}<br>"
+            "Injury: %{customdata[1]}<extra></extra>"
         ),
-        hoverlabel=dict(
-            bgcolor=COLOR_SNOW,
-            font_size=fontsize_legend,
-            font_family="ChelseaRegular",
-            font_color="black"
+        showlegend=True,
+        xaxis="x3", yaxis="y3"
+    ))
+
+    # Legend entries of the risk zones
+    for zone_color, zone_name in [
+        (zone_under_color, "Under Training (ACWR < 0.8)"),
+        (zone_optimal_color, "Optimal Workload (0.8 - 1.5)"),
+        (zone_danger_color, "Danger zone (ACWR > 1.5)")
+    ]:
+        traces.append(dict(
+            type="scatter",
+            x=[None],
+            y=[None],
+            mode="markers",
+            marker=dict(color=zone_color, size=10),
+            name=zone_name
+        ))
+
+    fig = figure(
+        load_chart_layout(
+            title1, title2, font_color, fontsize_title, fontsize_axis, fontsize_legend,
+            "%b %d" if (x1 - x0).days <= 366 else "%b %Y"
         ),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(family="ChelseaRegular", color=font_color),
-        legend=dict(
-            font=dict(color=font_color, family="ChelseaRegular", size=fontsize_legend),
-            x=1.02,
-            y=0.5
-        )
+        traces,
+        shapes=shapes,
+        images=images,
+        uirevision=uirevision
     )
-    if fig.layout.annotations:
-        for annotation in fig.layout.annotations:
-            annotation.font.size = fontsize_title
-            annotation.font.family = "ChelseaBold"
-            annotation.font.color = font_color
 
     return html.Div(
-        [dcc.Graph(
-            figure=fig,
-            config={"displayModeBar": False},
-            style={"width": f"{width_vw}vw", "height": f"{height_vh}vh"}
-        )],
+        [
+            dcc.Graph(
+                id=LOAD_CHART_ID,
+                figure=fig,
+                config={"displayModeBar": False},
+                style={"width": f"{width_vw}vw", "height": f"{height_vh}vh"}
+            ),
+            dcc.Store(id=f"{LOAD_CHART_ID}-detail", data={
+                "trace_indices": trace_indices,
+                "width_vw": width_vw,
+                "refine": len(df_series) < len(df)
+            })
+        ],
         style={
             "position": "absolute",
             "top": f"{top}vh",
@@ -903,106 +1111,30 @@ def render_daily_recovery_graph(
     # Filter data for the selected player
     df_player = processed_df[processed_df['player_id'] == player_id]
     
-    # Create the figure
-    fig = go.Figure()
-
-    # Trace for "subjective_baseline_composite"
-    if 'subjective_baseline_composite' in df_player.columns:
-        fig.add_trace(go.Scatter(
-            x=df_player['sessionDate'], 
-            y=df_player['subjective_baseline_composite'],
-            mode='lines+markers', 
-            name='Subjective',
-            line=dict(color=subjective_color),
-            showlegend=True
-        ))
-    
-    # Trace for "sleep_baseline_composite"
-    if 'sleep_baseline_composite' in df_player.columns:
-        fig.add_trace(go.Scatter(
-            x=df_player['sessionDate'], 
-            y=df_player['sleep_baseline_composite'],
-            mode='lines+markers', 
-            name='Sleep',
-            line=dict(color=sleep_color),
-            showlegend=True
-        ))
-    
-    # Trace for "soreness_baseline_composite"
-    if 'soreness_baseline_composite' in df_player.columns:
-        fig.add_trace(go.Scatter(
-            x=df_player['sessionDate'], 
-            y=df_player['soreness_baseline_composite'],
-            mode='lines+markers', 
-            name='Soreness',
-            line=dict(color=soreness_color),
-            showlegend=True
-        ))
-    
-    # Visibility control buttons
-    buttons = [
-        dict(
-            label='Display All',
-            method='update',
-            args=[{'visible': [True, True, True]}]
-        ),
+    # One line per composite score, on the pre-styled layout (with its visibility menu)
+    traces = [
         dict(
-            label='Subjective Only',
-            method='update',
-            args=[{'visible': [True, False, False]}]
-        ),
-        dict(
-            label='Sleep Only',
-            method='update',
-            args=[{'visible': [False, True, False]}]
-        ),
-        dict(
-            label='Soreness Only',
-            method='update',
-            args=[{'visible': [False, False, True]}]
+            type='scatter',
+            x=df_player['sessionDate'],
+            y=df_player[column],
+            mode='lines+markers',
+            name=name,
+            line=dict(color=color),
+            showlegend=True
         )
+        for column, name, color in [
+            ('subjective_baseline_composite', 'Subjective', subjective_color),
+            ('sleep_baseline_composite', 'Sleep', sleep_color),
+            ('soreness_baseline_composite', 'Soreness', soreness_color)
+        ]
+        if column in df_player.columns
     ]
-    
-    # Update the layout of the figure
-    fig.update_layout(
-        title={
-            "text": title,
-            "font": {"size": title_font_size, "color": font_color, "family": title_font_family},
-            "x": 0.5,
-            "xanchor": "center",
-            "pad": {"t": 0, "b": 0}
-        },
-        margin=dict(t=50, b=0, l=0, r=0),
-        xaxis_title=None,
-        yaxis_title='Score',
-        template='plotly_white',
-        font={"color": font_color, "family": axis_font_family},
-        xaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
-        },
-        yaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
-        },
-        legend={
-            "font": {"size": legend_font_size, "color": font_color, "family": axis_font_family}
-        },
-        updatemenus=[dict(
-            type="dropdown",
-            direction="down",
-            buttons=buttons,
-            showactive=True,
-            x=1.1,
-            xanchor="right",
-            y=1.05,
-            yanchor="bottom",
-            bgcolor=COLOR_SNOW,
-            font={'color':COLOR_DARK_BLUE}
-        )],
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+    fig = figure(
+        daily_recovery_layout(
+            title, font_color, title_font_family, title_font_size, axis_font_family, axis_font_size, legend_font_size
+        ),
+        traces
     )
-    
-    fig.update_yaxes(range=[-1, 1])
 
     return dcc.Graph(
         figure=fig, 
@@ -1018,6 +1150,9 @@ def render_daily_recovery_graph(
     )
 
 
+RECOVERY_HEATMAP_ID = "recovery-heatmap"
+HEATMAP_CELL_TEXT = "%{z:.2f}"
+
 def render_recovery_heatmap(
     processed_df: pd.DataFrame,
     player_id: int,
@@ -1037,7 +1172,9 @@ def render_recovery_heatmap(
     Creates a heatmap from the processed DataFrame for the given player.
 
     The DataFrame is filtered by player_id, sorted by month (using '%B %Y' format), and then
-    a heatmap is generated using Plotly Express's imshow.
+    a heatmap trace is built from its numeric scores. The scores are shown on hover; they
+    are written in the cells only while at most HEATMAP_TEXT_MAX_CELLS cells are visible,
+    which the "heatmap.cell_text" clientside callback updates on zoom (see the layout meta).
 
     Args:
         processed_df (pd.DataFrame): Pivoted table from process_heatmap_data.
@@ -1069,48 +1206,28 @@ def render_recovery_heatmap(
     # Use all columns except 'player_id' and 'seasonName' for the heatmap
     cols = [c for c in heatmap_data.columns if c not in ['player_id', 'seasonName']]
     
-    # Create the heatmap using Plotly Express
-    fig_heatmap = px.imshow(
-        heatmap_data[cols],
-        labels=dict(x="Month day", y="Month", color="Overall score"),
-        x=heatmap_data[cols].columns,
-        y=heatmap_data.index,
-        color_continuous_scale='RdYlGn',
-        range_color=(-1, 1),
-        color_continuous_midpoint=0,
-        text_auto='.2f',
-        aspect='auto',
-        title=title
-    )
-    
-    # Place the x-axis at the bottom
-    fig_heatmap.update_xaxes(side="bottom")
-    
-    # Update layout with styles and transparent background
-    fig_heatmap.update_layout(
-        title={
-            "text": title,
-            "font": {"size": title_font_size, "color": font_color, "family": title_font_family},
-            "x": 0.5,
-            "xanchor": "center",
-            "pad": {"t": 0, "b": 0}
-        },
-        margin=dict(t=40, b=0, l=0, r=0),
-        font={"color": font_color, "family": font_family},
-        xaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": font_family},
-        },
-        yaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": font_family},
-        },
-        legend={
-            "font": {"size": legend_font_size, "color": font_color, "family": font_family}
-        },
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+    scores = heatmap_data[cols].to_numpy(dtype=float)
+
+    # Heatmap trace on the pre-styled layout (months top to bottom, red-to-green scale)
+    fig_heatmap = figure(
+        recovery_heatmap_layout(
+            title, font_color, font_family, title_font_family, title_font_size, axis_font_size, legend_font_size
+        ),
+        [dict(
+            type="heatmap",
+            x=np.asarray(cols, dtype=np.int64),
+            y=heatmap_data.index.to_numpy(),
+            z=scores,
+            coloraxis="coloraxis",
+            hoverongaps=False,
+            texttemplate=HEATMAP_CELL_TEXT if scores.size <= HEATMAP_TEXT_MAX_CELLS else "",
+            hovertemplate="Month day: %{x}<br>Month: %{y}<br>Overall score: %{z:.2f}<extra></extra>"
+        )],
+        meta={"cell_text": HEATMAP_CELL_TEXT, "max_text_cells": HEATMAP_TEXT_MAX_CELLS, "shape": list(scores.shape)}
     )
     
     return dcc.Graph(
+        id=RECOVERY_HEATMAP_ID,
         figure=fig_heatmap,
         config={"displayModeBar": False},
         style={
@@ -1124,9 +1241,20 @@ def render_recovery_heatmap(
     )
 
 
+# Legend label of each weekly composite metric, in the order of the traces.
+WEEKLY_RECOVERY_LABELS = {
+    "subjective_baseline_composite": "Subjective",
+    "sleep_baseline_composite": "Sleep",
+    "soreness_baseline_composite": "Soreness",
+    "bio_baseline_composite": "Bio",
+    "msk_joint_range_baseline_composite": "Joint Range",
+    "msk_load_tolerance_baseline_composite": "Load Tolerance"
+}
+
 def render_weekly_recovery_graph(
-    processed_df: pd.DataFrame,
+    weekly_series: dict,
     player_id: int,
+    season: str,
     top: float,
     left: float,
     width_vw: float,
@@ -1141,13 +1269,15 @@ def render_weekly_recovery_graph(
     color_discrete_map: dict = None
 ):
     """
-    Filters the aggregated DataFrame for the given player and creates a Plotly line graph
-    showing the weekly evolution of composite scores. A dropdown menu is added to filter
-    the display by metric.
+    Creates a line graph showing the weekly evolution of the composite scores of the given
+    player and season, from their precomputed weekly arrays. A dropdown menu is added to
+    filter the display by metric. The trace styles and the menu are cached and shared by
+    every render; only the arrays are set per request.
 
     Args:
-        processed_df (pd.DataFrame): Aggregated DataFrame from process_weekly_recovery_data.
+        weekly_series (dict): Weekly arrays from build_recovery_weekly_series.
         player_id (int): The player's identifier.
+        season (str): The season to display.
         top (float): Vertical position (in vh) of the graph container.
         left (float): Horizontal position (in vw) of the graph container.
         width_vw (float): Width of the container (in vw).
@@ -1164,94 +1294,25 @@ def render_weekly_recovery_graph(
     Returns:
         dcc.Graph: A Dash Graph component containing the Plotly line graph.
     """
-    # Filter data for the specified player
-    df_player = processed_df[processed_df['player_id'] == player_id].copy()
-    df_player = df_player.sort_values(by='week_date', ascending=True)
-    
-    # Create the line graph with Plotly Express
-    fig = px.line(
-        df_player,
-        x='week_date',
-        y='value_composite',
-        color='metric',
-        markers=True,
-        title=title,
-        color_discrete_map=color_discrete_map,
-        labels={'metric': ''}
-    )
-    
-    # Rename legend entries using a mapping
-    legend_mapping = {
-        "subjective_baseline_composite": "Subjective",
-        "sleep_baseline_composite": "Sleep",
-        "soreness_baseline_composite": "Soreness",
-        "bio_baseline_composite": "Bio",
-        "msk_joint_range_baseline_composite": "Joint Range",
-        "msk_load_tolerance_baseline_composite": "Load Tolerance"
-    }
-    for trace in fig.data:
-        trace.name = legend_mapping.get(trace.name, trace.name)
-    
-    # Update the x-axis to be of date type
-    fig.update_xaxes(type='date')
-    
-    # Create dropdown buttons for filtering metrics
-    unique_metrics = df_player['metric'].unique().tolist()
-    buttons = []
-    buttons.append(dict(
-        label="Display All",
-        method="update",
-        args=[{"visible": [True] * len(unique_metrics)}]
-    ))
-    for i, metric in enumerate(unique_metrics):
-        visible = [False] * len(unique_metrics)
-        visible[i] = True
-        buttons.append(dict(
-            label=f"{legend_mapping.get(metric, metric)}",
-            method="update",
-            args=[{"visible": visible}]
-        ))
-    
-    # Update layout with styling and dropdown menu
-    fig.update_layout(
-        title={
-            "text": title,
-            "font": {"size": title_font_size, "color": font_color, "family": title_font_family},
-            "x": 0.5,
-            "xanchor": "center",
-            "pad": {"t": 0, "b": 0}
-        },
-        margin=dict(t=40, b=0, l=0, r=0),
-        xaxis_title='Week (Date)',
-        yaxis_title='Average composite value',
-        template='plotly_white',
-        font={"color": font_color, "family": axis_font_family},
-        xaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
-        },
-        yaxis={
-            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
-        },
-        legend={
-            "font": {"size": legend_font_size, "color": font_color, "family": axis_font_family}
-        },
-        updatemenus=[dict(
-            type="dropdown",
-            direction="down",
-            buttons=buttons,
-            showactive=True,
-            x=1.1,
-            xanchor="right",
-            y=1.05,
-            yanchor="bottom",
-            bgcolor=COLOR_SNOW,
-            font={'color':COLOR_DARK_BLUE}
-        )],
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+    color_discrete_map = color_discrete_map or {}
+    player_series = weekly_series.get((player_id, season), {})
+    metrics = [metric for metric in WEEKLY_RECOVERY_LABELS if metric in player_series]
+
+    # One line per metric: cached style, per-request arrays
+    traces = []
+    for metric in metrics:
+        week_dates, values = player_series[metric]
+        style = weekly_recovery_trace(metric, WEEKLY_RECOVERY_LABELS[metric], color_discrete_map.get(metric))
+        traces.append({**style, "x": week_dates, "y": values})
+
+    # Traces on the pre-styled layout, with the cached menu of this player's metrics
+    fig = figure(
+        weekly_recovery_layout(
+            title, font_color, title_font_family, title_font_size, axis_font_family, axis_font_size, legend_font_size
+        ),
+        traces,
+        updatemenus=weekly_recovery_menus(tuple(WEEKLY_RECOVERY_LABELS[metric] for metric in metrics))
     )
-    
-    fig.update_yaxes(range=[-1, 1])
 
     return dcc.Graph(
         figure=fig,
@@ -1496,42 +1557,23 @@ def render_recovery_radar_chart(
             display_values.append(f"{sign}{abs(v_float):.2f}")
             colors.append(positive_value_color if v_float >= 0 else negative_value_color)
     
-    # Create the radar chart trace
-    trace_values = go.Scatterpolar(
-        r=values,
-        theta=metrics_labels,
-        mode='lines+markers',
-        fill='toself',
-        name=f"Player {player_id}",
-        marker=dict(color=colors, size=marker_size),
-        line=dict(width=0)
-    )
-    
-    fig = go.Figure(data=[trace_values])
-    
-    # Update layout for the radar chart
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[-1, 1],
-                tickfont=dict(size=axis_font_size, color=axis_font_color, family=axis_font_family)
-            ),
-            angularaxis=dict(
-                tickfont=dict(size=theta_label_fontsize, color=theta_label_color, family=theta_label_font_family)
-            )
+    # Radar trace on the pre-styled layout
+    fig = figure(
+        recovery_radar_layout(
+            title, title_font_size, title_font_family, title_color, background_color,
+            axis_font_size, axis_font_family, axis_font_color,
+            theta_label_color, theta_label_fontsize, theta_label_font_family
         ),
-        margin=dict(t=40, b=10, l=0, r=0),
-        showlegend=False,
-        title=dict(
-            text=title,
-            font=dict(size=title_font_size, color=title_color, family=title_font_family),
-            x=0.5,
-            xanchor="center",
-            pad=dict(t=0, b=0)
-        ),
-        paper_bgcolor=background_color,
-        plot_bgcolor=background_color
+        [dict(
+            type='scatterpolar',
+            r=values,
+            theta=metrics_labels,
+            mode='lines+markers',
+            fill='toself',
+            name=f"Player {player_id}",
+            marker=dict(color=colors, size=marker_size),
+            line=dict(width=0)
+        )]
     )
     
     return dcc.Graph(
@@ -0,0 +1,161 @@
+import gzip
+import json
+import logging
+
+import dash
+import flask
+
+from config import (
+    RESPONSE_COMPRESSION, COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES, PAYLOAD_BUDGET_KB, PAYLOAD_BUDGETS_KB
+)
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json", "text/html", "text/css", "text/plain",
+    "application/javascript", "text/javascript", "image/svg+xml"
+}
+CALLBACK_ROUTE = "/_dash-update-component"
+COMPONENT_SUITES_ROUTE = "/_dash-component-suites/"
+
+# Compressed JavaScript bundles by URL (their paths are fingerprinted) and
+# other responses by ETag (e.g. the snapshot pages), so that each one (plotly.js
+# among them) is compressed once per process.
+_compressed_bodies = {}
+
+# Suffix of the ETag of a gzip body, which must differ from the identity body's.
+GZIP_ETAG_SUFFIX = "-gzip"
+
+# =============================================================================
+# Payload Budget
+# =============================================================================
+
+def _size(value) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+def _is_figure(value) -> bool:
+    return isinstance(value, dict) and "data" in value and "layout" in value
+
+def _is_component(value) -> bool:
+    return isinstance(value, dict) and "type" in value and "namespace" in value and "props" in value
+
+def _contributors(value, path: str):
+    """Yield (path, JSON size) of the figure properties and other leaves of a callback output."""
+    if _is_figure(value):
+        for i, trace in enumerate(value["data"]):
+            for key, item in trace.items():
+                yield f"{path}.data[{i}].{key}", _size(item)
+        for key, item in value["layout"].items():
+            yield f"{path}.layout.{key}", _size(item)
+    elif _is_component(value):
+        component_id = value["props"].get("id")
+        name = value["type"] if component_id is None else f"{value['type']}#{component_id}"
+        for prop, item in value["props"].items():
+            yield from _contributors(item, f"{path} > {name}.{prop}")
+    elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+        for i, item in enumerate(value):
+            yield from _contributors(item, f"{path}[{i}]")
+    else:
+        yield path, _size(value)
+
+def payload_report(body: bytes, limit: int = 5) -> list:
+    """
+    Return the `limit` biggest contributors of a callback response as
+    (path, bytes) pairs, e.g. ("page2-content.children > Graph#load-chart.figure.data[3].customdata", 38000).
+    """
+    response = json.loads(body).get("response", {})
+    contributors = [
+        contributor
+        for output_id, props in response.items()
+        for prop, value in props.items()
+        for contributor in _contributors(value, f"{output_id}.{prop}")
+    ]
+    return sorted(contributors, key=lambda contributor: contributor[1], reverse=True)[:limit]
+
+def payload_budget(callback: str) -> float:
+    """Return the payload budget of a callback, in bytes."""
+    return PAYLOAD_BUDGETS_KB.get(callback, PAYLOAD_BUDGET_KB) * 1024
+
+def callback_name(app: dash.Dash, request: flask.Request) -> str:
+    """Return the name of the callback function answering a callback request."""
+    output = (request.get_json(silent=True) or {}).get("output", "")
+    callback = app.callback_map.get(output, {}).get("callback")
+    return getattr(callback, "__name__", output)
+
+def check_payload_budget(app: dash.Dash, request: flask.Request, body: bytes):
+    """Log a warning with the biggest figure properties when a callback response exceeds its budget."""
+    callback = callback_name(app, request)
+    budget = payload_budget(callback)
+    if len(body) <= budget:
+        return
+    try:
+        report = payload_report(body)
+    except ValueError:
+        report = []
+    logger.warning(
+        "%s response is %.1f KB (budget %.0f KB). Biggest contributors:\n%s",
+        callback, len(body) / 1024, budget / 1024,
+        "\n".join(f"  {size / 1024:8.1f} KB  {path}" for path, size in report)
+    )
+
+# =============================================================================
+# Response Compression
+# =============================================================================
+
+def gzip_response(response: flask.Response, request: flask.Request) -> flask.Response:
+    """
+    Gzip a response body in place if it is compressible, large enough and
+    accepted by the client. A gzip body gets the ETag of the identity body with
+    GZIP_ETAG_SUFFIX, and a client revalidating that ETag is answered a 304.
+    """
+    response.vary.add("Accept-Encoding")
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+    etag, weak = response.get_etag()
+    if COMPONENT_SUITES_ROUTE in request.path:
+        key = request.full_path
+    else:
+        key = etag if etag and not weak else None
+    compressed = _compressed_bodies.get(key) if key else None
+    if compressed is None:
+        body = response.get_data()
+        if len(body) < COMPRESSION_MIN_BYTES:
+            return response
+        compressed = gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+        if key:
+            _compressed_bodies[key] = compressed
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = "gzip"
+    if etag:
+        # The route only compared If-None-Match with the identity ETag.
+        response.set_etag(etag + GZIP_ETAG_SUFFIX, weak)
+        response.make_conditional(request)
+    return response
+
+# =============================================================================
+# Flask Integration
+# =============================================================================
+
+def init_app(app: dash.Dash):
+    """
+    Register the payload budget check and the response compression on the Dash
+    app's server.
+
+    Flask runs the after_request hooks in reverse registration order: call this
+    before registering the hooks that must see the uncompressed body (metrics).
+    """
+    @app.server.after_request
+    def _compress_response(response):
+        request = flask.request
+        if request.path.endswith(CALLBACK_ROUTE) and not response.direct_passthrough and response.status_code == 200:
+            check_payload_budget(app, request, response.get_data())
+        if RESPONSE_COMPRESSION:
+            gzip_response(response, request)
+        return response
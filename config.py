@@ -0,0 +1,143 @@
+import os
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Return True if the environment variable is set to a truthy value."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def env_mapping(name: str, default: dict = None) -> dict:
+    """Return `default` updated with the "key=value,key=value" pairs of an environment variable."""
+    mapping = dict(default or {})
+    for item in os.environ.get(name, "").split(","):
+        key, _, value = item.partition("=")
+        if key.strip() and value.strip():
+            mapping[key.strip()] = float(value)
+    return mapping
+
+# =============================================================================
+# Runtime Options (set through environment variables)
+# =============================================================================
+
+# Background callbacks: page 2 and page 3 figures are built in worker
+# processes managed by diskcache instead of the Flask request thread.
+BACKGROUND_CALLBACKS = env_flag("CFC_BACKGROUND_CALLBACKS")
+BACKGROUND_CACHE_DIR = os.environ.get("CFC_BACKGROUND_CACHE_DIR", ".cache/background")
+
+# Response cache: serialized page 2 and page 3 outputs shared by all workers
+# through a SQLite file. Entries expire after RESPONSE_CACHE_TTL seconds and
+# the least recently used ones are evicted above RESPONSE_CACHE_MAX_MB.
+RESPONSE_CACHE = env_flag("CFC_RESPONSE_CACHE", default=True)
+RESPONSE_CACHE_PATH = os.environ.get("CFC_RESPONSE_CACHE_PATH", ".cache/responses.sqlite")
+RESPONSE_CACHE_TTL = float(os.environ.get("CFC_RESPONSE_CACHE_TTL", 24 * 3600))
+RESPONSE_CACHE_MAX_MB = float(os.environ.get("CFC_RESPONSE_CACHE_MAX_MB", 256))
+
+# Startup warm-up: render every player x season x tab into the response cache
+# after data loading; /ready answers 503 until it has finished.
+WARMUP = env_flag("CFC_WARMUP")
+WARMUP_WORKERS = int(os.environ.get("CFC_WARMUP_WORKERS", min(8, os.cpu_count() or 1)))
+
+# Callback metrics: call counts, phase latencies and payload sizes exposed in
+# the Prometheus text format on /metrics, summed over all processes through a
+# SQLite file.
+METRICS = env_flag("CFC_METRICS", default=True)
+METRICS_PATH = os.environ.get("CFC_METRICS_PATH", ".cache/metrics.sqlite")
+
+# Startup profiler: wall time, CPU time, peak memory delta and row count of
+# each data_loader stage, printed on stderr or written as JSON to a file.
+STARTUP_PROFILE = env_flag("CFC_PROFILE_STARTUP")
+STARTUP_PROFILE_PATH = os.environ.get("CFC_PROFILE_STARTUP_PATH", "")
+
+# On-demand callback profiler (debug only): a callback request carrying the
+# "X-CFC-Profile: 1" header or "profile=1" query flag is sample-profiled and
+# its folded stacks are written to REQUEST_PROFILING_DIR.
+REQUEST_PROFILING = env_flag("CFC_REQUEST_PROFILING")
+REQUEST_PROFILING_DIR = os.environ.get("CFC_REQUEST_PROFILING_DIR", ".cache/profiles")
+REQUEST_PROFILING_INTERVAL_MS = float(os.environ.get("CFC_REQUEST_PROFILING_INTERVAL_MS", 2))
+
+# Local image cache: player photos, flags and club logos downloaded once by
+# `python image_cache.py`, resized per usage and served from /images.
+IMAGE_CACHE = env_flag("CFC_IMAGE_CACHE", default=True)
+IMAGE_CACHE_DIR = os.environ.get("CFC_IMAGE_CACHE_DIR", ".cache/images")
+IMAGE_CACHE_MAX_AGE = int(os.environ.get("CFC_IMAGE_CACHE_MAX_AGE", 365 * 24 * 3600))
+
+# Load chart level of detail: the acute, chronic and ACWR series are downsampled
+# (LTTB) to about one point per pixel of the chart on a screen of this width, and
+# drawn with WebGL traces above the point threshold.
+CHART_SCREEN_WIDTH_PX = int(os.environ.get("CFC_CHART_SCREEN_WIDTH_PX", 1920))
+WEBGL_POINT_THRESHOLD = int(os.environ.get("CFC_WEBGL_POINT_THRESHOLD", 1000))
+
+# Progressive load chart: the first render sends a coarse series (at most
+# LOAD_CHART_COARSE_POINTS points) and zooming or panning fetches the visible
+# window at full resolution.
+PROGRESSIVE_LOAD_CHART = env_flag("CFC_PROGRESSIVE_LOAD_CHART", default=True)
+LOAD_CHART_COARSE_POINTS = int(os.environ.get("CFC_LOAD_CHART_COARSE_POINTS", 400))
+
+# GPS data window: the rows outside [GPS_START_DATE, GPS_END_DATE] (YYYY-MM-DD)
+# are dropped when the data is loaded. The load chart date range can span every
+# season of the window.
+GPS_START_DATE = os.environ.get("CFC_GPS_START_DATE", "2023-08-01")
+GPS_END_DATE = os.environ.get("CFC_GPS_END_DATE", "2025-03-13")
+
+# Load chart resampling: above these date spans (in days), the acute load,
+# chronic load and ACWR are averaged per week or per month before the figure is
+# built, so that the response size does not grow with the selected range.
+LOAD_CHART_WEEKLY_AFTER_DAYS = int(os.environ.get("CFC_LOAD_CHART_WEEKLY_AFTER_DAYS", 400))
+LOAD_CHART_MONTHLY_AFTER_DAYS = int(os.environ.get("CFC_LOAD_CHART_MONTHLY_AFTER_DAYS", 1100))
+
+# Figure arrays: encoding of the numeric arrays of the figures built by
+# components.py. "f4" sends base64 float32 typed arrays, "f8" float64 ones and
+# "json" plain JSON lists. With typed arrays, dates are sent as epoch milliseconds.
+FIGURE_ARRAYS = os.environ.get("CFC_FIGURE_ARRAYS", "f4").strip().lower()
+
+# Recovery heatmap cell text: the score is written in each cell only while at
+# most HEATMAP_TEXT_MAX_CELLS cells are visible (zoom in to see it); otherwise it
+# is shown on hover only.
+HEATMAP_TEXT_MAX_CELLS = int(os.environ.get("CFC_HEATMAP_TEXT_MAX_CELLS", 150))
+
+# JSON engine of the callback responses: "orjson" encodes them in one pass with
+# orjson (falling back to plotly's encoder without it), "plotly" keeps Dash's
+# default serialization.
+JSON_ENGINE = os.environ.get("CFC_JSON_ENGINE", "orjson").strip().lower()
+
+# Response compression: JSON, HTML, JavaScript and CSS responses larger than
+# COMPRESSION_MIN_BYTES are gzip-compressed when the browser accepts it.
+RESPONSE_COMPRESSION = env_flag("CFC_RESPONSE_COMPRESSION", default=True)
+COMPRESSION_LEVEL = int(os.environ.get("CFC_COMPRESSION_LEVEL", 6))
+COMPRESSION_MIN_BYTES = int(os.environ.get("CFC_COMPRESSION_MIN_BYTES", 1024))
+
+# Payload budget: a callback response whose JSON body exceeds the budget of its
+# callback (in KB, uncompressed) logs a warning naming its biggest figure
+# properties. CFC_PAYLOAD_BUDGETS overrides it per callback ("name=KB,...").
+PAYLOAD_BUDGET_KB = float(os.environ.get("CFC_PAYLOAD_BUDGET_KB", 128))
+PAYLOAD_BUDGETS_KB = env_mapping("CFC_PAYLOAD_BUDGETS", {
+    "update_page1_content": 64,
+    "update_page2_content": 128,
+    "update_page3_content": 96
+})
+
+# Static snapshot: every tab of every player and season is rendered once per
+# data version into static HTML pages and figure JSON under SNAPSHOT_DIR, and
+# served from /snapshot/ with ETags, without running any Dash callback.
+SNAPSHOT = env_flag("CFC_SNAPSHOT", default=False)
+SNAPSHOT_DIR = os.environ.get("CFC_SNAPSHOT_DIR", ".cache/snapshots")
+
+# Options that change the rendered figures or their encoding. Their resolved
+# values are part of the response cache keys and of the snapshot version, so
+# that changing one never serves outputs rendered with the previous value.
+RENDER_OPTIONS = {
+    "CHART_SCREEN_WIDTH_PX": CHART_SCREEN_WIDTH_PX,
+    "WEBGL_POINT_THRESHOLD": WEBGL_POINT_THRESHOLD,
+    "PROGRESSIVE_LOAD_CHART": PROGRESSIVE_LOAD_CHART,
+    "LOAD_CHART_COARSE_POINTS": LOAD_CHART_COARSE_POINTS,
+    "LOAD_CHART_WEEKLY_AFTER_DAYS": LOAD_CHART_WEEKLY_AFTER_DAYS,
+    "LOAD_CHART_MONTHLY_AFTER_DAYS": LOAD_CHART_MONTHLY_AFTER_DAYS,
+    "FIGURE_ARRAYS": FIGURE_ARRAYS,
+    "HEATMAP_TEXT_MAX_CELLS": HEATMAP_TEXT_MAX_CELLS,
+    "JSON_ENGINE": JSON_ENGINE
+}
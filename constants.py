@@ -22,6 +22,12 @@ LINEWIDTH_SEPARATION_VH = 0.1
 FONTSIZE_TAB_VH = "2.5vh"
 SCALE_IMAGE_PLAYER_SIDEBAR_VW = 4.5
 
+# Sidebar (virtualized player list)
+SIDEBAR_AVATAR_MARGIN_VH = 2
+SIDEBAR_GROUP_HEADER_VH = 3
+SIDEBAR_GROUP_FONTSIZE_VW = 0.55
+SIDEBAR_OVERSCAN_ROWS = 2
+
 # Tabs configuration
 TAB_TITLES = ['OVERVIEW', 'LOAD DEMAND', 'RECOVERY']
 TAB_IDS = [f"tab-{i+1}" for i in range(len(TAB_TITLES))]
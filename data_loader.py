@@ -1,71 +1,87 @@
+import hashlib
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from profiling import startup_profiler
+from config import GPS_START_DATE, GPS_END_DATE
+from chart_hover import build_load_chart_hover
+
+# =============================================================================
+# Data Version
+# =============================================================================
+
+DATA_FILES = [
+    'data/agg_player_matches.csv',
+    'data/agg_player_season.csv',
+    'data/matches.csv',
+    'data/ref_competitions.csv',
+    'data/ref_country.csv',
+    'data/ref_player.csv',
+    'data/ref_team.csv',
+    'data/cfc_gps_data_augmented.csv',
+    'data/injuries_histo.csv',
+    'data/cfc_recovery_status_data_augmented.csv'
+]
+
+def compute_data_version(paths: list, *options: str) -> str:
+    """Return a short hash of the content of the given data files and of the loading options."""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    for option in options:
+        digest.update(option.encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+DATA_VERSION = compute_data_version(DATA_FILES, GPS_START_DATE, GPS_END_DATE)
 
 # =============================================================================
 # Load Raw Data
 # =============================================================================
 
-df_agg_player_matches = pd.read_csv('data/agg_player_matches.csv', sep=';')
-df_agg_player_season = pd.read_csv('data/agg_player_season.csv', sep=';')
-df_matches = pd.read_csv('data/matches.csv', sep=';')
-df_ref_competitions = pd.read_csv('data/ref_competitions.csv', sep=';')
-df_ref_countries = pd.read_csv('data/ref_country.csv', sep=';')
-df_ref_players = pd.read_csv('data/ref_player.csv', sep=';')
-df_ref_teams = pd.read_csv('data/ref_team.csv', sep=';')
-df_cfc_gps_data_augmented = pd.read_csv('data/cfc_gps_data_augmented.csv', sep=',')
-df_injuries_histo = pd.read_csv('data/injuries_histo.csv', sep=';')
-df_cfc_recovery_augmented = pd.read_csv('data/cfc_recovery_status_data_augmented.csv', sep=',')
+def read_raw_data(data_dir: str = 'data') -> dict:
+    """Read every raw CSV file used by the dashboard."""
+    return {
+        'agg_player_matches': pd.read_csv(f'{data_dir}/agg_player_matches.csv', sep=';'),
+        'agg_player_season': pd.read_csv(f'{data_dir}/agg_player_season.csv', sep=';'),
+        'matches': pd.read_csv(f'{data_dir}/matches.csv', sep=';'),
+        'ref_competitions': pd.read_csv(f'{data_dir}/ref_competitions.csv', sep=';'),
+        'ref_countries': pd.read_csv(f'{data_dir}/ref_country.csv', sep=';'),
+        'ref_players': pd.read_csv(f'{data_dir}/ref_player.csv', sep=';'),
+        'ref_teams': pd.read_csv(f'{data_dir}/ref_team.csv', sep=';'),
+        'cfc_gps_data_augmented': pd.read_csv(f'{data_dir}/cfc_gps_data_augmented.csv', sep=','),
+        'injuries_histo': pd.read_csv(f'{data_dir}/injuries_histo.csv', sep=';'),
+        'cfc_recovery_augmented': pd.read_csv(f'{data_dir}/cfc_recovery_status_data_augmented.csv', sep=',')
+    }
 
 # =============================================================================
 # Construct df_player_resume
 # =============================================================================
 
-df_player_resume = pd.merge(df_ref_players, df_agg_player_season, on='player_id', how='left')
-df_player_resume = pd.merge(
-    df_player_resume,
-    df_ref_countries[['country_id', 'url_picture']].rename(columns={'url_picture': 'url_picture_country'}),
-    on='country_id',
-    how='left'
-)
-df_player_resume['birthdate'] = pd.to_datetime(df_player_resume['birthdate'], format='%Y/%m/%d')
-today = pd.Timestamp.today()
-df_player_resume['age'] = df_player_resume['birthdate'].apply(
-    lambda x: today.year - x.year - ((today.month, today.day) < (x.month, x.day))
-)
+def build_player_resume(
+    df_ref_players: pd.DataFrame,
+    df_agg_player_season: pd.DataFrame,
+    df_ref_countries: pd.DataFrame
+) -> pd.DataFrame:
+    """Merge player references, season aggregates and country flags, and compute ages."""
+    df_player_resume = pd.merge(df_ref_players, df_agg_player_season, on='player_id', how='left')
+    df_player_resume = pd.merge(
+        df_player_resume,
+        df_ref_countries[['country_id', 'url_picture']].rename(columns={'url_picture': 'url_picture_country'}),
+        on='country_id',
+        how='left'
+    )
+    df_player_resume['birthdate'] = pd.to_datetime(df_player_resume['birthdate'], format='%Y/%m/%d')
+    today = pd.Timestamp.today()
+    df_player_resume['age'] = df_player_resume['birthdate'].apply(
+        lambda x: today.year - x.year - ((today.month, today.day) < (x.month, x.day))
+    )
+    return df_player_resume
 
 # =============================================================================
 # Construct DataFrame for Last 5 Matches
 # =============================================================================
 
-df_player_matches = pd.merge(
-    df_matches,
-    df_agg_player_matches,
-    on='match_id',
-    how='left'
-)
-df_player_matches['is_home'] = df_player_matches['home_team_id'] == 1
-df_player_matches['opponent_id'] = df_player_matches.apply(
-    lambda row: row['away_team_id'] if row['is_home'] else row['home_team_id'],
-    axis=1
-)
-df_player_matches = df_player_matches.merge(
-    df_ref_teams[['team_id', 'team_name', 'url_picture']],
-    left_on='opponent_id',
-    right_on='team_id',
-    how='left'
-)
-df_result = df_player_matches[[
-    'match_id', 'match_date_x', 'player_id', 'team_name',
-    'is_home', 'starter_group', 'minutes_played', 'url_picture',
-    'home_team_score', 'away_team_score', 'goals', 'assists'
-]].rename(columns={
-    'match_date_x': 'match_date',
-    'team_name': 'opponent_name',
-    'url_picture': 'opponent_url_picture'
-})
-df_result['match_date'] = pd.to_datetime(df_result['match_date'], format='%Y/%m/%d')
-df_result = df_result.sort_values(by='match_date', ascending=False).reset_index(drop=True)
-
 def get_result_and_score(row: pd.Series) -> pd.Series:
     """Determine match result (W, D, L) and format the score."""
     if row['is_home']:
@@ -87,220 +103,319 @@ def get_result_and_score(row: pd.Series) -> pd.Series:
         score = f"{home_score} - {away_score}"
     return pd.Series({'result': result, 'score': score})
 
-df_result[['result', 'score']] = df_result.apply(get_result_and_score, axis=1)
-last_5_match_ids = df_result.drop_duplicates(subset='match_id').head(5)['match_id'].tolist()
-df_last_5_matches = df_result[df_result['match_id'].isin(last_5_match_ids)]
+def build_last_5_matches(
+    df_matches: pd.DataFrame,
+    df_agg_player_matches: pd.DataFrame,
+    df_ref_teams: pd.DataFrame
+) -> pd.DataFrame:
+    """Return one row per player and match for the last 5 matches of the club."""
+    df_player_matches = pd.merge(
+        df_matches,
+        df_agg_player_matches,
+        on='match_id',
+        how='left'
+    )
+    df_player_matches['is_home'] = df_player_matches['home_team_id'] == 1
+    df_player_matches['opponent_id'] = df_player_matches.apply(
+        lambda row: row['away_team_id'] if row['is_home'] else row['home_team_id'],
+        axis=1
+    )
+    df_player_matches = df_player_matches.merge(
+        df_ref_teams[['team_id', 'team_name', 'url_picture']],
+        left_on='opponent_id',
+        right_on='team_id',
+        how='left'
+    )
+    df_result = df_player_matches[[
+        'match_id', 'match_date_x', 'player_id', 'team_name',
+        'is_home', 'starter_group', 'minutes_played', 'url_picture',
+        'home_team_score', 'away_team_score', 'goals', 'assists'
+    ]].rename(columns={
+        'match_date_x': 'match_date',
+        'team_name': 'opponent_name',
+        'url_picture': 'opponent_url_picture'
+    })
+    df_result['match_date'] = pd.to_datetime(df_result['match_date'], format='%Y/%m/%d')
+    df_result = df_result.sort_values(by='match_date', ascending=False).reset_index(drop=True)
+    df_result[['result', 'score']] = df_result.apply(get_result_and_score, axis=1)
+    last_5_match_ids = df_result.drop_duplicates(subset='match_id').head(5)['match_id'].tolist()
+    return df_result[df_result['match_id'].isin(last_5_match_ids)]
 
 # =============================================================================
 # Construct DataFrame for GPS Data
 # =============================================================================
 
+GPS_EXCLUDE_COLS = ['player_id', 'date', 'opposition_code', 'opposition_full', 'md_plus_code', 'md_minus_code', 'season']
+
 # 1) Convert injury dates
-df_injuries_histo['injury_date'] = pd.to_datetime(df_injuries_histo['injury_date'], format='%d/%m/%Y')
-df_injuries_histo['return_date'] = pd.to_datetime(df_injuries_histo['return_date'], format='%d/%m/%Y')
+def parse_injury_dates(df_injuries_histo: pd.DataFrame) -> pd.DataFrame:
+    """Convert the injury and return dates of the injury history to datetimes."""
+    df_injuries_histo['injury_date'] = pd.to_datetime(df_injuries_histo['injury_date'], format='%d/%m/%Y')
+    df_injuries_histo['return_date'] = pd.to_datetime(df_injuries_histo['return_date'], format='%d/%m/%Y')
+    return df_injuries_histo
 
 # 2) Prepare the GPS DataFrame
-df_cfc_gps_data_processed = df_cfc_gps_data_augmented.copy()
-df_cfc_gps_data_processed['date'] = pd.to_datetime(df_cfc_gps_data_processed['date'], format='%d/%m/%Y')
-cutoff_date_sup = pd.to_datetime('13/03/2025', format='%d/%m/%Y')
-cutoff_date_inf = pd.to_datetime('01/08/2023', format='%d/%m/%Y')
-df_cfc_gps_data_processed = df_cfc_gps_data_processed[
-    (df_cfc_gps_data_processed['date'] <= cutoff_date_sup) &
-    (df_cfc_gps_data_processed['date'] >= cutoff_date_inf)
-]
-exclude_cols = ['player_id', 'date', 'opposition_code', 'opposition_full', 'md_plus_code', 'md_minus_code', 'season']
-cols_to_update = [col for col in df_cfc_gps_data_processed.columns if col not in exclude_cols]
-hr_zone_cols = [col for col in cols_to_update if col.startswith("hr_zone")]
-other_cols = [col for col in cols_to_update if col not in hr_zone_cols]
-for col in ["injury_date", "return_date", "body_part", "injury_name", "is_injury_active"]:
-    if col not in df_cfc_gps_data_processed.columns:
-        df_cfc_gps_data_processed[col] = None
+def prepare_gps_data(
+    df_cfc_gps_data_augmented: pd.DataFrame,
+    cutoff_date_inf: pd.Timestamp,
+    cutoff_date_sup: pd.Timestamp
+) -> pd.DataFrame:
+    """Parse GPS dates, keep the rows inside the cutoff window and add the injury columns."""
+    df_cfc_gps_data_processed = df_cfc_gps_data_augmented.copy()
+    df_cfc_gps_data_processed['date'] = pd.to_datetime(df_cfc_gps_data_processed['date'], format='%d/%m/%Y')
+    df_cfc_gps_data_processed = df_cfc_gps_data_processed[
+        (df_cfc_gps_data_processed['date'] <= cutoff_date_sup) &
+        (df_cfc_gps_data_processed['date'] >= cutoff_date_inf)
+    ]
+    for col in ["injury_date", "return_date", "body_part", "injury_name", "is_injury_active"]:
+        if col not in df_cfc_gps_data_processed.columns:
+            df_cfc_gps_data_processed[col] = None
+    return df_cfc_gps_data_processed
 
 # 3) Update data for injuries
-for idx, injury in df_injuries_histo.iterrows():
-    mask = (
-        (df_cfc_gps_data_processed['player_id'] == injury['player_id']) &
-        (df_cfc_gps_data_processed['date'] > injury['injury_date']) &
-        (df_cfc_gps_data_processed['date'] < injury['return_date'])
-    )
-    df_cfc_gps_data_processed.loc[mask, other_cols] = 0
-    df_cfc_gps_data_processed.loc[mask, hr_zone_cols] = "00:00:00"
-    df_cfc_gps_data_processed.loc[mask, "injury_date"] = injury["injury_date"]
-    df_cfc_gps_data_processed.loc[mask, "return_date"] = injury["return_date"]
-    df_cfc_gps_data_processed.loc[mask, "body_part"] = injury["body_part"]
-    df_cfc_gps_data_processed.loc[mask, "injury_name"] = injury["injury_name"]
-    df_cfc_gps_data_processed.loc[mask, "is_injury_active"] = injury["is_injury_active"]
+def apply_injuries(df_cfc_gps_data_processed: pd.DataFrame, df_injuries_histo: pd.DataFrame) -> pd.DataFrame:
+    """Zero the GPS metrics of the days a player was injured and attach the injury details."""
+    cols_to_update = [
+        col for col in df_cfc_gps_data_processed.columns
+        if col not in GPS_EXCLUDE_COLS + ["injury_date", "return_date", "body_part", "injury_name", "is_injury_active"]
+    ]
+    hr_zone_cols = [col for col in cols_to_update if col.startswith("hr_zone")]
+    other_cols = [col for col in cols_to_update if col not in hr_zone_cols]
+    for idx, injury in df_injuries_histo.iterrows():
+        mask = (
+            (df_cfc_gps_data_processed['player_id'] == injury['player_id']) &
+            (df_cfc_gps_data_processed['date'] > injury['injury_date']) &
+            (df_cfc_gps_data_processed['date'] < injury['return_date'])
+        )
+        df_cfc_gps_data_processed.loc[mask, other_cols] = 0
+        df_cfc_gps_data_processed.loc[mask, hr_zone_cols] = "00:00:00"
+        df_cfc_gps_data_processed.loc[mask, "injury_date"] = injury["injury_date"]
+        df_cfc_gps_data_processed.loc[mask, "return_date"] = injury["return_date"]
+        df_cfc_gps_data_processed.loc[mask, "body_part"] = injury["body_part"]
+        df_cfc_gps_data_processed.loc[mask, "injury_name"] = injury["injury_name"]
+        df_cfc_gps_data_processed.loc[mask, "is_injury_active"] = injury["is_injury_active"]
+    return df_cfc_gps_data_processed
 
 # 4) Compute TRIMP Edwards
-df_cfc_gps_data_processed['trimp_edwards'] = (
-    pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_1_hms']).dt.total_seconds() / 60 * 1 +
-    pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_2_hms']).dt.total_seconds() / 60 * 2 +
-    pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_3_hms']).dt.total_seconds() / 60 * 3 +
-    pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_4_hms']).dt.total_seconds() / 60 * 4 +
-    pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_5_hms']).dt.total_seconds() / 60 * 5
-)
-df_cfc_gps_data_processed['date'] = pd.to_datetime(df_cfc_gps_data_processed['date'], format='%d/%m/%Y')
+def compute_trimp(df_cfc_gps_data_processed: pd.DataFrame) -> pd.DataFrame:
+    """Compute the Edwards TRIMP from the time spent in each heart-rate zone."""
+    df_cfc_gps_data_processed['trimp_edwards'] = (
+        pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_1_hms']).dt.total_seconds() / 60 * 1 +
+        pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_2_hms']).dt.total_seconds() / 60 * 2 +
+        pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_3_hms']).dt.total_seconds() / 60 * 3 +
+        pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_4_hms']).dt.total_seconds() / 60 * 4 +
+        pd.to_timedelta(df_cfc_gps_data_processed['hr_zone_5_hms']).dt.total_seconds() / 60 * 5
+    )
+    df_cfc_gps_data_processed['date'] = pd.to_datetime(df_cfc_gps_data_processed['date'], format='%d/%m/%Y')
+    return df_cfc_gps_data_processed
 
 # 5) Compute acute (7d) and chronic (28d) loads for each player
-dfs = []
-for player_id in df_cfc_gps_data_processed['player_id'].unique():
-    df_temp = df_cfc_gps_data_processed[df_cfc_gps_data_processed['player_id'] == player_id].copy()
-    df_temp = df_temp.sort_values('date')
-    df_temp['trimp_edwards_acute_load'] = df_temp.rolling(window='7d', on='date')['trimp_edwards'].sum()
-    df_temp['trimp_edwards_chronic_load'] = df_temp.rolling(window='28d', on='date')['trimp_edwards'].sum() / 4
-    df_temp = df_temp.reset_index(drop=True)
-    dfs.append(df_temp)
-df_cfc_gps_data_processed = pd.concat(dfs, ignore_index=True)
-
-# 6) Compute ACWR (Acute:Chronic Workload Ratio)
-df_cfc_gps_data_processed['acwr'] = (
-    df_cfc_gps_data_processed['trimp_edwards_acute_load'] /
-    df_cfc_gps_data_processed['trimp_edwards_chronic_load']
-).fillna(0)
-
-# 7) Merge with df_ref_teams to get opponent logo
-df_cfc_gps_data_processed = df_cfc_gps_data_processed.merge(
-    df_ref_teams[['team_name', 'url_picture']],
-    left_on='opposition_full',
-    right_on='team_name',
-    how='left'
-)
-df_cfc_gps_data_processed = df_cfc_gps_data_processed.rename(columns={'url_picture': 'url_logo_opponent'})
-df_cfc_gps_data_processed = df_cfc_gps_data_processed.drop(columns='team_name')
-
-# 8) Conversions and label creation
-df_cfc_gps_data_processed["distance_km"] = df_cfc_gps_data_processed["distance"] / 1000
-df_cfc_gps_data_processed["opposition_text"] = df_cfc_gps_data_processed["opposition_full"].apply(
-    lambda x: f"Opponent: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
-)
-df_cfc_gps_data_processed["distance_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
-    lambda x: "Match distance (km): " if pd.notna(x) and str(x).strip() != "" else "Session distance (km): "
-)
-df_cfc_gps_data_processed["duration_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
-    lambda x: "Time played (minutes): " if pd.notna(x) and str(x).strip() != "" else "Session duration (minutes): "
-)
-df_cfc_gps_data_processed["load_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
-    lambda x: "Match load (TRIMP): " if pd.notna(x) and str(x).strip() != "" else "Session load (TRIMP): "
-)
-df_cfc_gps_data_processed["injury_label"] = df_cfc_gps_data_processed["is_injury_active"].apply(
-    lambda x: "Status: INJURED<br>" if pd.notna(x) and str(x).strip() != "" else "Status: FIT<br>"
-)
-df_cfc_gps_data_processed["injury_date_label"] = df_cfc_gps_data_processed["injury_date"].apply(
-    lambda d: f"From {d.strftime('%Y/%m/%d')}<br>" if pd.notna(d) else ""
-)
-df_cfc_gps_data_processed["return_date_label"] = df_cfc_gps_data_processed["return_date"].apply(
-    lambda d: f"To {d.strftime('%Y/%m/%d')}<br>" if pd.notna(d) else ""
-)
-df_cfc_gps_data_processed["body_part_label"] = df_cfc_gps_data_processed["body_part"].apply(
-    lambda x: f"Body part: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
-)
-df_cfc_gps_data_processed["injury_name_label"] = df_cfc_gps_data_processed["injury_name"].apply(
-    lambda x: f"Injury: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
-)
-
-# 9) Cap match time at 90 minutes for consistency
-mask = (
-    df_cfc_gps_data_processed["opposition_full"].notna() &
-    (df_cfc_gps_data_processed["opposition_full"].str.strip() != "") &
-    (df_cfc_gps_data_processed["day_duration"] > 90)
-)
-df_cfc_gps_data_processed.loc[mask, "day_duration"] = 90
+def compute_rolling_loads(df_cfc_gps_data_processed: pd.DataFrame) -> pd.DataFrame:
+    """Compute the acute (7-day) and chronic (28-day) TRIMP loads of each player."""
+    dfs = []
+    for player_id in df_cfc_gps_data_processed['player_id'].unique():
+        df_temp = df_cfc_gps_data_processed[df_cfc_gps_data_processed['player_id'] == player_id].copy()
+        df_temp = df_temp.sort_values('date')
+        df_temp['trimp_edwards_acute_load'] = df_temp.rolling(window='7d', on='date')['trimp_edwards'].sum()
+        df_temp['trimp_edwards_chronic_load'] = df_temp.rolling(window='28d', on='date')['trimp_edwards'].sum() / 4
+        df_temp = df_temp.reset_index(drop=True)
+        dfs.append(df_temp)
+    return pd.concat(dfs, ignore_index=True)
+
+# 6) Compute ACWR (Acute:Chronic Workload Ratio) and 7) merge with df_ref_teams to get opponent logo
+def compute_acwr(df_cfc_gps_data_processed: pd.DataFrame, df_ref_teams: pd.DataFrame) -> pd.DataFrame:
+    """Compute the ACWR and attach the opponent logo of match days."""
+    df_cfc_gps_data_processed['acwr'] = (
+        df_cfc_gps_data_processed['trimp_edwards_acute_load'] /
+        df_cfc_gps_data_processed['trimp_edwards_chronic_load']
+    ).fillna(0)
+    df_cfc_gps_data_processed = df_cfc_gps_data_processed.merge(
+        df_ref_teams[['team_name', 'url_picture']],
+        left_on='opposition_full',
+        right_on='team_name',
+        how='left'
+    )
+    df_cfc_gps_data_processed = df_cfc_gps_data_processed.rename(columns={'url_picture': 'url_logo_opponent'})
+    return df_cfc_gps_data_processed.drop(columns='team_name')
+
+# 8) Conversions and label creation, 9) cap match time at 90 minutes for consistency
+def add_hover_labels(df_cfc_gps_data_processed: pd.DataFrame) -> pd.DataFrame:
+    """Add the hover labels of the load chart and cap match durations at 90 minutes."""
+    df_cfc_gps_data_processed["distance_km"] = df_cfc_gps_data_processed["distance"] / 1000
+    df_cfc_gps_data_processed["opposition_text"] = df_cfc_gps_data_processed["opposition_full"].apply(
+        lambda x: f"Opponent: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
+    )
+    df_cfc_gps_data_processed["distance_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
+        lambda x: "Match distance (km): " if pd.notna(x) and str(x).strip() != "" else "Session distance (km): "
+    )
+    df_cfc_gps_data_processed["duration_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
+        lambda x: "Time played (minutes): " if pd.notna(x) and str(x).strip() != "" else "Session duration (minutes): "
+    )
+    df_cfc_gps_data_processed["load_label"] = df_cfc_gps_data_processed["opposition_full"].apply(
+        lambda x: "Match load (TRIMP): " if pd.notna(x) and str(x).strip() != "" else "Session load (TRIMP): "
+    )
+    df_cfc_gps_data_processed["injury_label"] = df_cfc_gps_data_processed["is_injury_active"].apply(
+        lambda x: "Status: INJURED<br>" if pd.notna(x) and str(x).strip() != "" else "Status: FIT<br>"
+    )
+    df_cfc_gps_data_processed["injury_date_label"] = df_cfc_gps_data_processed["injury_date"].apply(
+        lambda d: f"From {d.strftime('%Y/%m/%d')}<br>" if pd.notna(d) else ""
+    )
+    df_cfc_gps_data_processed["return_date_label"] = df_cfc_gps_data_processed["return_date"].apply(
+        lambda d: f"To {d.strftime('%Y/%m/%d')}<br>" if pd.notna(d) else ""
+    )
+    df_cfc_gps_data_processed["body_part_label"] = df_cfc_gps_data_processed["body_part"].apply(
+        lambda x: f"Body part: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
+    )
+    df_cfc_gps_data_processed["injury_name_label"] = df_cfc_gps_data_processed["injury_name"].apply(
+        lambda x: f"Injury: {x}<br>" if pd.notna(x) and str(x).strip() != "" else ""
+    )
+    mask = (
+        df_cfc_gps_data_processed["opposition_full"].notna() &
+        (df_cfc_gps_data_processed["opposition_full"].str.strip() != "") &
+        (df_cfc_gps_data_processed["day_duration"] > 90)
+    )
+    df_cfc_gps_data_processed.loc[mask, "day_duration"] = 90
+    return df_cfc_gps_data_processed
+
+# 10) Index the processed GPS data by player
+def build_player_index(df_cfc_gps_data_processed: pd.DataFrame) -> dict:
+    """Split the processed GPS data into one date-sorted DataFrame per player_id."""
+    df_sorted = df_cfc_gps_data_processed.sort_values('date', kind='stable')
+    return {player_id: df_player for player_id, df_player in df_sorted.groupby('player_id', sort=False)}
+
+# 11) Date range of each season
+def build_season_date_ranges(df_cfc_gps_data_processed: pd.DataFrame) -> dict:
+    """Return the first and last GPS dates (YYYY-MM-DD) of each season, the default load chart ranges."""
+    bounds = df_cfc_gps_data_processed.groupby('season')['date'].agg(['min', 'max'])
+    return {
+        season: (row['min'].strftime('%Y-%m-%d'), row['max'].strftime('%Y-%m-%d'))
+        for season, row in bounds.iterrows()
+    }
+
+# 12) Precompute the hover payloads of the load chart
+def build_player_hover(gps_data_by_player: dict) -> dict:
+    """
+    Return the hover payloads of the load chart of each player (see
+    chart_hover.build_load_chart_hover), with one row per row of the player's
+    DataFrame in `gps_data_by_player`.
+    """
+    return {player_id: build_load_chart_hover(df_player) for player_id, df_player in gps_data_by_player.items()}
 
 # =============================================================================
 # Construct DataFrame for Recovery Data (Graph 1 - Daily Recovery)
 # =============================================================================
 
-if df_cfc_recovery_augmented['sessionDate'].dtype == 'object':
-    df_cfc_recovery_augmented['sessionDate'] = pd.to_datetime(df_cfc_recovery_augmented['sessionDate'], format='%d/%m/%Y')
-composite_metrics = [
-    'subjective_baseline_composite',
-    'sleep_baseline_composite',
-    'soreness_baseline_composite'
-]
-completeness_metrics = [
-    'subjective_baseline_completeness',
-    'sleep_baseline_completeness',
-    'soreness_baseline_completeness'
-]
-df_composite = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'].isin(composite_metrics)].copy()
-df_completeness = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'].isin(completeness_metrics)].copy()
-df_composite['metric_base'] = df_composite['metric'].str.replace('_baseline_composite', '')
-df_completeness['metric_base'] = df_completeness['metric'].str.replace('_baseline_completeness', '')
-df_merged = pd.merge(
-    df_composite,
-    df_completeness[['player_id', 'sessionDate', 'seasonName', 'category', 'value', 'metric_base']],
-    on=['player_id', 'sessionDate', 'seasonName', 'category', 'metric_base'],
-    how='left',
-    suffixes=('_composite', '_completeness')
-)
-df_merged_filtered = df_merged[df_merged['value_completeness'] > 0.2]
-df_cfc_recovery_data_processed_daily = df_merged_filtered.pivot_table(
-    index=['player_id', 'sessionDate', 'seasonName'],
-    columns='metric',
-    values='value_composite'
-).reset_index()
+def parse_recovery_dates(df_cfc_recovery_augmented: pd.DataFrame) -> pd.DataFrame:
+    """Convert the recovery session dates to datetimes."""
+    if df_cfc_recovery_augmented['sessionDate'].dtype == 'object':
+        df_cfc_recovery_augmented['sessionDate'] = pd.to_datetime(df_cfc_recovery_augmented['sessionDate'], format='%d/%m/%Y')
+    return df_cfc_recovery_augmented
+
+def build_recovery_daily(df_cfc_recovery_augmented: pd.DataFrame) -> pd.DataFrame:
+    """Pivot the daily composite scores with a completeness above 20%."""
+    composite_metrics = [
+        'subjective_baseline_composite',
+        'sleep_baseline_composite',
+        'soreness_baseline_composite'
+    ]
+    completeness_metrics = [
+        'subjective_baseline_completeness',
+        'sleep_baseline_completeness',
+        'soreness_baseline_completeness'
+    ]
+    df_composite = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'].isin(composite_metrics)].copy()
+    df_completeness = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'].isin(completeness_metrics)].copy()
+    df_composite['metric_base'] = df_composite['metric'].str.replace('_baseline_composite', '')
+    df_completeness['metric_base'] = df_completeness['metric'].str.replace('_baseline_completeness', '')
+    df_merged = pd.merge(
+        df_composite,
+        df_completeness[['player_id', 'sessionDate', 'seasonName', 'category', 'value', 'metric_base']],
+        on=['player_id', 'sessionDate', 'seasonName', 'category', 'metric_base'],
+        how='left',
+        suffixes=('_composite', '_completeness')
+    )
+    df_merged_filtered = df_merged[df_merged['value_completeness'] > 0.2]
+    return df_merged_filtered.pivot_table(
+        index=['player_id', 'sessionDate', 'seasonName'],
+        columns='metric',
+        values='value_composite'
+    ).reset_index()
 
 # =============================================================================
 # Construct DataFrame for Recovery Data (Graph 2 - Heatmap)
 # =============================================================================
 
-if df_cfc_recovery_augmented['sessionDate'].dtype == 'object':
-    df_cfc_recovery_augmented['sessionDate'] = pd.to_datetime(df_cfc_recovery_augmented['sessionDate'], format='%d/%m/%Y')
-df_heatmap = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'] == 'emboss_baseline_score'].dropna().copy()
-df_heatmap['Month'] = df_heatmap['sessionDate'].dt.strftime('%B %Y')
-df_heatmap['Day'] = df_heatmap['sessionDate'].dt.day
-df_cfc_recovery_data_processed_heatmap = df_heatmap.pivot_table(
-    index=['player_id', 'Month', 'seasonName'],
-    columns='Day',
-    values='value',
-    aggfunc='mean'
-).reset_index()
+def build_recovery_heatmap(df_cfc_recovery_augmented: pd.DataFrame) -> pd.DataFrame:
+    """Pivot the EMBOSS score by player, month and day of month."""
+    df_heatmap = df_cfc_recovery_augmented[df_cfc_recovery_augmented['metric'] == 'emboss_baseline_score'].dropna().copy()
+    df_heatmap['Month'] = df_heatmap['sessionDate'].dt.strftime('%B %Y')
+    df_heatmap['Day'] = df_heatmap['sessionDate'].dt.day
+    return df_heatmap.pivot_table(
+        index=['player_id', 'Month', 'seasonName'],
+        columns='Day',
+        values='value',
+        aggfunc='mean'
+    ).reset_index()
 
 # =============================================================================
 # Construct DataFrame for Recovery Data (Graph 3 - Weekly Recovery)
 # =============================================================================
 
-df = df_cfc_recovery_augmented.copy()
-if df['sessionDate'].dtype == 'object':
-    df['sessionDate'] = pd.to_datetime(df['sessionDate'], format='%d/%m/%Y')
-desired_composite_metrics = [
-    'bio_baseline_composite',
-    'msk_joint_range_baseline_composite',
-    'msk_load_tolerance_baseline_composite',
-    'soreness_baseline_composite',
-    'subjective_baseline_composite',
-    'sleep_baseline_composite'
-]
-desired_completeness_metrics = [m.replace('composite', 'completeness') for m in desired_composite_metrics]
-df_composite = df[df['metric'].isin(desired_composite_metrics)].copy()
-df_completeness = df[df['metric'].isin(desired_completeness_metrics)].copy()
-df_composite['metric_base'] = df_composite['metric'].str.replace('_baseline_composite', '')
-df_completeness['metric_base'] = df_completeness['metric'].str.replace('_baseline_completeness', '')
-df_merged = pd.merge(
-    df_composite,
-    df_completeness[['sessionDate', 'seasonName', 'category', 'value', 'metric_base']],
-    on=['sessionDate', 'seasonName', 'category', 'metric_base'],
-    how='left',
-    suffixes=('_composite', '_completeness')
-)
-df_merged = df_merged[df_merged['value_completeness'] > 0.2].copy()
-df_merged['iso_year'] = df_merged['sessionDate'].dt.isocalendar().year
-df_merged['iso_week'] = df_merged['sessionDate'].dt.isocalendar().week
-df_merged['year_week'] = df_merged['iso_year'].astype(str) + '-' + df_merged['iso_week'].astype(str).str.zfill(2)
-df_weekly_agg = df_merged.groupby(['player_id', 'year_week', 'seasonName', 'metric'])['value_composite'].mean().reset_index()
-df_cfc_recovery_data_processed_weekly = df_weekly_agg.sort_values(by='year_week', ascending=True)
-df_cfc_recovery_data_processed_weekly['week_date'] = pd.to_datetime(df_weekly_agg['year_week'] + '-1', format='%G-%V-%u')
+def build_recovery_weekly(df_cfc_recovery_augmented: pd.DataFrame) -> pd.DataFrame:
+    """Average the composite scores by player, ISO week and metric."""
+    df = df_cfc_recovery_augmented.copy()
+    if df['sessionDate'].dtype == 'object':
+        df['sessionDate'] = pd.to_datetime(df['sessionDate'], format='%d/%m/%Y')
+    desired_composite_metrics = [
+        'bio_baseline_composite',
+        'msk_joint_range_baseline_composite',
+        'msk_load_tolerance_baseline_composite',
+        'soreness_baseline_composite',
+        'subjective_baseline_composite',
+        'sleep_baseline_composite'
+    ]
+    desired_completeness_metrics = [m.replace('composite', 'completeness') for m in desired_composite_metrics]
+    df_composite = df[df['metric'].isin(desired_composite_metrics)].copy()
+    df_completeness = df[df['metric'].isin(desired_completeness_metrics)].copy()
+    df_composite['metric_base'] = df_composite['metric'].str.replace('_baseline_composite', '')
+    df_completeness['metric_base'] = df_completeness['metric'].str.replace('_baseline_completeness', '')
+    df_merged = pd.merge(
+        df_composite,
+        df_completeness[['player_id', 'sessionDate', 'seasonName', 'category', 'value', 'metric_base']],
+        on=['player_id', 'sessionDate', 'seasonName', 'category', 'metric_base'],
+        how='left',
+        suffixes=('_composite', '_completeness')
+    )
+    df_merged = df_merged[df_merged['value_completeness'] > 0.2].copy()
+    df_merged['iso_year'] = df_merged['sessionDate'].dt.isocalendar().year
+    df_merged['iso_week'] = df_merged['sessionDate'].dt.isocalendar().week
+    df_merged['year_week'] = df_merged['iso_year'].astype(str) + '-' + df_merged['iso_week'].astype(str).str.zfill(2)
+    df_weekly_agg = df_merged.groupby(['player_id', 'year_week', 'seasonName', 'metric'])['value_composite'].mean().reset_index()
+    df_cfc_recovery_data_processed_weekly = df_weekly_agg.sort_values(by='year_week', ascending=True)
+    df_cfc_recovery_data_processed_weekly['week_date'] = pd.to_datetime(df_weekly_agg['year_week'] + '-1', format='%G-%V-%u')
+    return df_cfc_recovery_data_processed_weekly
+
+def build_recovery_weekly_series(df_cfc_recovery_data_processed_weekly: pd.DataFrame) -> dict:
+    """
+    Return the weekly composite scores as {(player_id, seasonName): {metric: (week_dates, values)}},
+    date-sorted numpy arrays that the weekly recovery chart draws as they are.
+    """
+    keys = ['player_id', 'seasonName', 'metric']
+    df = df_cfc_recovery_data_processed_weekly.sort_values(keys + ['week_date'], kind='stable')
+    df_keys = df[keys]
+    starts = np.flatnonzero(df_keys.ne(df_keys.shift()).any(axis=1).to_numpy())
+    ends = np.append(starts[1:], len(df))
+    week_dates = df['week_date'].to_numpy()
+    values = df['value_composite'].to_numpy(dtype=float)
+    series = {}
+    for start, end, (player_id, season, metric) in zip(starts, ends, df_keys.iloc[starts].itertuples(index=False)):
+        series.setdefault((player_id, season), {})[metric] = (week_dates[start:end], values[start:end])
+    return series
 
 # =============================================================================
 # Construct DataFrame for Recovery Data (Last 7 Days)
 # =============================================================================
 
-df = df_cfc_recovery_augmented.copy()
-df['sessionDate'] = pd.to_datetime(df['sessionDate'], format='%d/%m/%Y')
-end_date = pd.Timestamp('2025-03-13')
-start_date = end_date - timedelta(days=6)
-df_last7 = df[(df['sessionDate'] >= start_date) & (df['sessionDate'] <= end_date)].copy()
-
 def extract_base_metric(metric):
     if metric.endswith("_composite"):
         return metric[:-len("_composite")]
@@ -317,17 +432,6 @@ def extract_metric_type(metric):
     else:
         return "simple"
 
-df_last7['base_metric'] = df_last7['metric'].apply(extract_base_metric)
-df_last7['metric_type'] = df_last7['metric'].apply(extract_metric_type)
-weighted_df = df_last7[df_last7['metric_type'].isin(["composite", "completeness"])].copy()
-simple_df = df_last7[df_last7['metric_type'] == "simple"].copy()
-weighted_pivot = weighted_df.pivot_table(
-    index=['player_id', 'sessionDate', 'base_metric', 'category'],
-    columns='metric_type',
-    values='value'
-).reset_index()
-
-weighted_group = weighted_pivot.groupby(['player_id', 'base_metric'])
 def compute_weighted_avg(group):
     group = group.dropna(subset=['completeness'])
     group = group[~((group['completeness'] == 0) & (group['composite'].isna()))]
@@ -336,22 +440,125 @@ def compute_weighted_avg(group):
     denominator = group['completeness'].sum()
     return numerator / denominator if denominator != 0 else None
 
-weighted_result = weighted_group.apply(compute_weighted_avg).reset_index(name='weighted_avg')
-simple_group = simple_df.groupby(['player_id', 'base_metric']).agg(simple_avg=('value', 'mean')).reset_index()
-weighted_result['avg_type'] = 'weighted'
-simple_group['avg_type'] = 'simple'
-weighted_result = weighted_result.rename(columns={'base_metric': 'metric'})
-simple_group = simple_group.rename(columns={'base_metric': 'metric'})
-df_cfc_recovery_last_7d = pd.concat([
-    weighted_result[['player_id', 'metric', 'weighted_avg', 'avg_type']],
-    simple_group[['player_id', 'metric', 'simple_avg', 'avg_type']]
-], ignore_index=True)
 def format_value(row):
     val = row['weighted_avg'] if row['avg_type'] == 'weighted' else row['simple_avg']
     return '/' if pd.isna(val) else f"{val:.2f}"
-df_cfc_recovery_last_7d['avg'] = df_cfc_recovery_last_7d.apply(format_value, axis=1)
-df_cfc_recovery_last_7d = df_cfc_recovery_last_7d.drop(columns=['weighted_avg', 'simple_avg'])
+
+def last_recovery_date(df_cfc_recovery_augmented: pd.DataFrame, cutoff_date_sup: pd.Timestamp) -> pd.Timestamp:
+    """Return the last recovery session date of the data window (`cutoff_date_sup` when there is none)."""
+    dates = pd.to_datetime(df_cfc_recovery_augmented['sessionDate'], format='%d/%m/%Y')
+    end_date = dates[dates <= cutoff_date_sup].max()
+    return cutoff_date_sup if pd.isna(end_date) else end_date
+
+def build_recovery_last_7d(df_cfc_recovery_augmented: pd.DataFrame, end_date: pd.Timestamp) -> pd.DataFrame:
+    """Average every recovery metric over the 7 days ending at `end_date`, weighted by completeness."""
+    df = df_cfc_recovery_augmented.copy()
+    df['sessionDate'] = pd.to_datetime(df['sessionDate'], format='%d/%m/%Y')
+    start_date = end_date - timedelta(days=6)
+    df_last7 = df[(df['sessionDate'] >= start_date) & (df['sessionDate'] <= end_date)].copy()
+    df_last7['base_metric'] = df_last7['metric'].apply(extract_base_metric)
+    df_last7['metric_type'] = df_last7['metric'].apply(extract_metric_type)
+    weighted_df = df_last7[df_last7['metric_type'].isin(["composite", "completeness"])].copy()
+    simple_df = df_last7[df_last7['metric_type'] == "simple"].copy()
+    weighted_pivot = weighted_df.pivot_table(
+        index=['player_id', 'sessionDate', 'base_metric', 'category'],
+        columns='metric_type',
+        values='value'
+    ).reset_index()
+
+    weighted_group = weighted_pivot.groupby(['player_id', 'base_metric'])
+    weighted_result = weighted_group.apply(compute_weighted_avg).reset_index(name='weighted_avg')
+    simple_group = simple_df.groupby(['player_id', 'base_metric']).agg(simple_avg=('value', 'mean')).reset_index()
+    weighted_result['avg_type'] = 'weighted'
+    simple_group['avg_type'] = 'simple'
+    weighted_result = weighted_result.rename(columns={'base_metric': 'metric'})
+    simple_group = simple_group.rename(columns={'base_metric': 'metric'})
+    df_cfc_recovery_last_7d = pd.concat([
+        weighted_result[['player_id', 'metric', 'weighted_avg', 'avg_type']],
+        simple_group[['player_id', 'metric', 'simple_avg', 'avg_type']]
+    ], ignore_index=True)
+    df_cfc_recovery_last_7d['avg'] = df_cfc_recovery_last_7d.apply(format_value, axis=1)
+    return df_cfc_recovery_last_7d.drop(columns=['weighted_avg', 'simple_avg'])
+
+# =============================================================================
+# Run the Data Pipeline
+# =============================================================================
+
+cutoff_date_sup = pd.Timestamp(GPS_END_DATE)
+cutoff_date_inf = pd.Timestamp(GPS_START_DATE)
+
+def call_stage(name, func, *args):
+    """Default stage runner of `run_pipeline`: call the stage function."""
+    return func(*args)
+
+def run_pipeline(raw_data: dict, run=call_stage) -> dict:
+    """
+    Build every processed DataFrame from the raw data returned by `read_raw_data`.
+
+    Each stage is executed through `run(name, func, *args)`, which lets the
+    startup profiler and the benchmarks time the stages individually.
+    """
+    frames = {}
+    frames['df_player_resume'] = run(
+        "player_resume", build_player_resume,
+        raw_data['ref_players'], raw_data['agg_player_season'], raw_data['ref_countries']
+    )
+    frames['df_last_5_matches'] = run(
+        "last_5_matches", build_last_5_matches,
+        raw_data['matches'], raw_data['agg_player_matches'], raw_data['ref_teams']
+    )
+
+    df_injuries_histo = run("injury_dates", parse_injury_dates, raw_data['injuries_histo'])
+    df_gps = run("gps_prepare", prepare_gps_data, raw_data['cfc_gps_data_augmented'], cutoff_date_inf, cutoff_date_sup)
+    df_gps = run("injury_loop", apply_injuries, df_gps, df_injuries_histo)
+    df_gps = run("trimp", compute_trimp, df_gps)
+    df_gps = run("rolling_loads", compute_rolling_loads, df_gps)
+    df_gps = run("acwr", compute_acwr, df_gps, raw_data['ref_teams'])
+    frames['df_injuries_histo'] = df_injuries_histo
+    frames['df_cfc_gps_data_processed'] = run("labels", add_hover_labels, df_gps).reset_index(drop=True)
+    frames['gps_data_by_player'] = run("player_index", build_player_index, frames['df_cfc_gps_data_processed'])
+    frames['gps_season_date_ranges'] = run("season_ranges", build_season_date_ranges, frames['df_cfc_gps_data_processed'])
+    frames['load_chart_hover'] = run("hover_payloads", build_player_hover, frames['gps_data_by_player'])
+
+    df_recovery = run("recovery_dates", parse_recovery_dates, raw_data['cfc_recovery_augmented'])
+    frames['df_cfc_recovery_augmented'] = df_recovery
+    frames['df_cfc_recovery_data_processed_daily'] = run("recovery_daily_pivot", build_recovery_daily, df_recovery)
+    frames['df_cfc_recovery_data_processed_heatmap'] = run("recovery_heatmap_pivot", build_recovery_heatmap, df_recovery)
+    frames['df_cfc_recovery_data_processed_weekly'] = run("recovery_weekly", build_recovery_weekly, df_recovery)
+    frames['recovery_weekly_series'] = run(
+        "recovery_weekly_series", build_recovery_weekly_series, frames['df_cfc_recovery_data_processed_weekly']
+    )
+    recovery_end_date = last_recovery_date(df_recovery, cutoff_date_sup)
+    frames['df_cfc_recovery_last_7d'] = run("recovery_last_7d", build_recovery_last_7d, df_recovery, recovery_end_date)
+    return frames
+
+raw_data = startup_profiler.run("csv_reads", read_raw_data)
+df_agg_player_matches = raw_data['agg_player_matches']
+df_agg_player_season = raw_data['agg_player_season']
+df_matches = raw_data['matches']
+df_ref_competitions = raw_data['ref_competitions']
+df_ref_countries = raw_data['ref_countries']
+df_ref_players = raw_data['ref_players']
+df_ref_teams = raw_data['ref_teams']
+df_cfc_gps_data_augmented = raw_data['cfc_gps_data_augmented']
+
+frames = run_pipeline(raw_data, startup_profiler.run)
+df_player_resume = frames['df_player_resume']
+df_last_5_matches = frames['df_last_5_matches']
+df_injuries_histo = frames['df_injuries_histo']
+df_cfc_gps_data_processed = frames['df_cfc_gps_data_processed']
+gps_data_by_player = frames['gps_data_by_player']
+gps_season_date_ranges = frames['gps_season_date_ranges']
+load_chart_hover = frames['load_chart_hover']
+df_cfc_recovery_augmented = frames['df_cfc_recovery_augmented']
+df_cfc_recovery_data_processed_daily = frames['df_cfc_recovery_data_processed_daily']
+df_cfc_recovery_data_processed_heatmap = frames['df_cfc_recovery_data_processed_heatmap']
+df_cfc_recovery_data_processed_weekly = frames['df_cfc_recovery_data_processed_weekly']
+recovery_weekly_series = frames['recovery_weekly_series']
+df_cfc_recovery_last_7d = frames['df_cfc_recovery_last_7d']
+
+startup_profiler.emit()
 
 # =============================================================================
 # End of Data Preparation
-# =============================================================================
\ No newline at end of file
+# =============================================================================
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# Largest-Triangle-Three-Buckets Downsampling
+# =============================================================================
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Return the indices of the `n_out` points kept by the Largest-Triangle-Three-Buckets
+    algorithm (Steinarsson, 2013), which preserves the visual shape of a series.
+
+    `x` must be sorted. NaN values of `y` are treated as 0 when choosing points.
+    All indices are returned when the series has no more than `n_out` points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    bucket_edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = bucket_edges[i], bucket_edges[i + 1]
+        next_start, next_end = bucket_edges[i + 1], bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        # Average of the next bucket (the last point for the last bucket).
+        next_x = x[next_start:next_end].mean() if next_end > next_start else x[-1]
+        next_y = y[next_start:next_end].mean() if next_end > next_start else y[-1]
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        indices[i + 1] = previous
+    return indices
+
+def downsample_frame(df: pd.DataFrame, x_column: str, y_columns: list, max_points: int) -> pd.DataFrame:
+    """
+    Downsample the rows of a frame sorted by `x_column` to about `max_points` rows.
+
+    Each of `y_columns` is downsampled with LTTB and the union of the kept rows is
+    returned, so the peaks and troughs of every series survive. The frame is
+    returned unchanged when it is already small enough.
+    """
+    if len(df) <= max_points:
+        return df
+    x = df[x_column]
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x = x.astype("int64")
+    points_per_series = max(3, max_points // len(y_columns))
+    kept = np.unique(np.concatenate([
+        lttb_indices(x.to_numpy(), df[column].to_numpy(), points_per_series) for column in y_columns
+    ]))
+    return df.iloc[kept]
@@ -0,0 +1,356 @@
+"""
+Pre-styled layouts of the Plotly charts of components.py.
+
+Each chart's layout (fonts, axis styles, transparent backgrounds, legend, title,
+menus and template) is built and validated by Plotly once per style, then cached
+as a plain dict. A renderer only clones it and injects its data traces as
+dicts: no go.Figure is built, so nothing is validated again per request.
+
+The cached layouts are shared by every request and must never be mutated:
+per-request values are passed as overrides to `figure`.
+"""
+import base64
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from config import FIGURE_ARRAYS
+from constants import COLOR_SNOW, COLOR_DARK_BLUE
+
+# =============================================================================
+# Figure Assembly
+# =============================================================================
+
+# plotly.js typed array type of each numpy dtype.
+TYPED_ARRAY_DTYPES = {
+    "float64": "f8", "float32": "f4",
+    "int32": "i4", "int16": "i2", "int8": "i1",
+    "uint32": "u4", "uint16": "u2", "uint8": "u1"
+}
+
+def typed_array(values, mode: str = None):
+    """
+    Return a numeric or datetime array as a plotly.js typed array spec (base64
+    data), or `values` unchanged when it is not numeric or in "json" mode.
+
+    Floats are sent as float32 in "f4" mode and as float64 in "f8" mode. Dates
+    are sent as float64 epoch milliseconds, which plotly.js reads as dates on
+    axes of type "date" (NaT becomes NaN, a gap).
+    """
+    mode = mode or FIGURE_ARRAYS
+    if mode == "json":
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind == "M":
+        milliseconds = array.astype("datetime64[ms]").astype(np.int64).astype(np.float64)
+        array = np.where(np.isnat(array), np.nan, milliseconds)
+    elif array.dtype == np.float64 and mode == "f4":
+        array = array.astype(np.float32)
+    elif array.dtype == np.int64 and array.size:
+        if np.iinfo(np.int32).min <= array.min() and array.max() <= np.iinfo(np.int32).max:
+            array = array.astype(np.int32)
+    dtype = TYPED_ARRAY_DTYPES.get(str(array.dtype))
+    if dtype is None or array.size == 0:
+        return values
+    spec = {"dtype": dtype, "bdata": base64.b64encode(np.ascontiguousarray(array)).decode("ascii")}
+    if array.ndim > 1:
+        spec["shape"] = ", ".join(str(n) for n in array.shape)
+    return spec
+
+def encode_arrays(trace: dict) -> dict:
+    """
+    Replace the numeric and datetime numpy arrays and pandas Series of a trace
+    dict (and of its nested dicts) with typed arrays (see typed_array).
+    """
+    for key, value in trace.items():
+        if isinstance(value, dict):
+            encode_arrays(value)
+        elif isinstance(value, (np.ndarray, pd.Series, pd.Index)):
+            trace[key] = typed_array(value)
+    return trace
+
+def figure(layout: dict, data: list, **overrides) -> dict:
+    """
+    Return a figure dict made of a cached layout, shallow-copied with the
+    per-request `overrides`, and the trace dicts `data`.
+    """
+    return {"data": [encode_arrays(trace) for trace in data], "layout": {**layout, **overrides}}
+
+# Subplot types of the template layout, dropped unless a chart uses them.
+TEMPLATE_SUBPLOTS = {"geo": "scattergeo", "mapbox": "scattermapbox", "polar": "scatterpolar",
+                     "scene": "scatter3d", "ternary": "scatterternary"}
+
+def _layout(fig: go.Figure, trace_types: tuple) -> dict:
+    """
+    Return the layout of `fig` as a dict, its template slimmed to the trace types
+    and subplots the chart draws (the rest would be sent with every figure).
+    """
+    layout = fig.to_plotly_json()["layout"]
+    template = layout.get("template")
+    if template:
+        template["data"] = {k: v for k, v in template.get("data", {}).items() if k in trace_types}
+        for subplot, trace_type in TEMPLATE_SUBPLOTS.items():
+            if trace_type not in trace_types:
+                template.get("layout", {}).pop(subplot, None)
+    return layout
+
+def _title(text, size, color, family) -> dict:
+    return {
+        "text": text,
+        "font": {"size": size, "color": color, "family": family},
+        "x": 0.5,
+        "xanchor": "center",
+        "pad": {"t": 0, "b": 0}
+    }
+
+# =============================================================================
+# Page 2 - Load, ACWR & Injury Zones
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def load_chart_layout(title1, title2, font_color, fontsize_title, fontsize_axis, fontsize_legend, tickformat) -> dict:
+    """
+    Layout of the three stacked subplots of the load chart (loads, availability,
+    ACWR). The traces of row N use the axes xN/yN ("x"/"y" for the first row).
+    """
+    fig = make_subplots(
+        rows=3, cols=1,
+        shared_xaxes=True,
+        row_heights=[0.6, 0.03, 0.3],
+        vertical_spacing=0.12,
+        subplot_titles=(title1, "", title2)
+    )
+    fig.update_yaxes(range=[0, 1500], row=1, col=1)
+    fig.update_yaxes(
+        range=[0, 1],
+        title_text="Availability",
+        showticklabels=False,
+        showgrid=False,
+        zeroline=False,
+        row=2, col=1
+    )
+    fig.update_yaxes(range=[0, 2], row=3, col=1)
+    fig.update_layout(
+        hovermode="x unified",
+        hoverdistance=1,
+        xaxis=dict(
+            type="date",
+            tickformat=tickformat,
+            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
+            linecolor=font_color,
+            mirror=True
+        ),
+        yaxis=dict(
+            title="Load (TRIMP)",
+            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
+            zeroline=True,
+            zerolinecolor="gray"
+        ),
+        yaxis3=dict(
+            title="ACWR",
+            tickfont=dict(color=font_color, family="ChelseaRegular", size=fontsize_axis),
+            zeroline=True,
+            zerolinecolor="gray",
+            showgrid=False
+        ),
+        xaxis2=dict(type="date"),
+        xaxis3=dict(
+            type="date",
+            title=None,
+            tickfont=dict(color=font_color),
+            linecolor=font_color,
+            mirror=True
+        ),
+        hoverlabel=dict(
+            bgcolor=COLOR_SNOW,
+            font_size=fontsize_legend,
+            font_family="ChelseaRegular",
+            font_color="black"
+        ),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="ChelseaRegular", color=font_color),
+        legend=dict(
+            font=dict(color=font_color, family="ChelseaRegular", size=fontsize_legend),
+            x=1.02,
+            y=0.5
+        )
+    )
+    for annotation in fig.layout.annotations:
+        annotation.font.size = fontsize_title
+        annotation.font.family = "ChelseaBold"
+        annotation.font.color = font_color
+    return _layout(fig, ("scatter", "scattergl", "bar"))
+
+# =============================================================================
+# Page 3 - Recovery
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def daily_recovery_layout(
+    title, font_color, title_font_family, title_font_size, axis_font_family, axis_font_size, legend_font_size
+) -> dict:
+    """Layout of the daily recovery chart, with its metric visibility menu (one trace per metric)."""
+    buttons = [
+        dict(label='Display All', method='update', args=[{'visible': [True, True, True]}]),
+        dict(label='Subjective Only', method='update', args=[{'visible': [True, False, False]}]),
+        dict(label='Sleep Only', method='update', args=[{'visible': [False, True, False]}]),
+        dict(label='Soreness Only', method='update', args=[{'visible': [False, False, True]}])
+    ]
+    return _layout(go.Figure(layout=dict(
+        title=_title(title, title_font_size, font_color, title_font_family),
+        margin=dict(t=50, b=0, l=0, r=0),
+        xaxis_title=None,
+        yaxis_title='Score',
+        template='plotly_white',
+        font={"color": font_color, "family": axis_font_family},
+        xaxis={
+            "type": "date",
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family}
+        },
+        yaxis={
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
+            "range": [-1, 1]
+        },
+        legend={"font": {"size": legend_font_size, "color": font_color, "family": axis_font_family}},
+        updatemenus=[_metric_menu(buttons)],
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )), ("scatter",))
+
+@lru_cache(maxsize=None)
+def recovery_heatmap_layout(
+    title, font_color, font_family, title_font_family, title_font_size, axis_font_size, legend_font_size
+) -> dict:
+    """
+    Layout of the monthly recovery heatmap: months from top to bottom, red-to-green
+    score scale. The zoom is kept when the cell text is toggled (uirevision).
+    """
+    return _layout(go.Figure(layout=dict(
+        title=_title(title, title_font_size, font_color, title_font_family),
+        uirevision="heatmap",
+        margin=dict(t=40, b=0, l=0, r=0),
+        font={"color": font_color, "family": font_family},
+        xaxis={
+            "title": {"text": "Month day"},
+            "side": "bottom",
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": font_family}
+        },
+        yaxis={
+            "title": {"text": "Month"},
+            "autorange": "reversed",
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": font_family}
+        },
+        coloraxis={
+            "colorscale": "RdYlGn",
+            "cmin": -1,
+            "cmax": 1,
+            "cmid": 0,
+            "colorbar": {"title": {"text": "Overall score"}}
+        },
+        legend={"font": {"size": legend_font_size, "color": font_color, "family": font_family}},
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )), ("heatmap",))
+
+@lru_cache(maxsize=None)
+def weekly_recovery_layout(
+    title, font_color, title_font_family, title_font_size, axis_font_family, axis_font_size, legend_font_size
+) -> dict:
+    """Layout of the weekly recovery chart; the buttons of its metric menu are set per request."""
+    return _layout(go.Figure(layout=dict(
+        title=_title(title, title_font_size, font_color, title_font_family),
+        margin=dict(t=40, b=0, l=0, r=0),
+        xaxis_title='Week (Date)',
+        yaxis_title='Average composite value',
+        template='plotly_white',
+        font={"color": font_color, "family": axis_font_family},
+        xaxis={
+            "type": "date",
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family}
+        },
+        yaxis={
+            "tickfont": {"size": axis_font_size, "color": font_color, "family": axis_font_family},
+            "range": [-1, 1]
+        },
+        legend={
+            "title": {"text": ""},
+            "tracegroupgap": 0,
+            "font": {"size": legend_font_size, "color": font_color, "family": axis_font_family}
+        },
+        updatemenus=[_metric_menu([])],
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )), ("scatter",))
+
+@lru_cache(maxsize=None)
+def weekly_recovery_trace(metric, label, color) -> dict:
+    """Style of the line of one metric of the weekly recovery chart (its x and y are set per request)."""
+    return dict(
+        type="scatter",
+        mode="lines+markers",
+        name=label,
+        legendgroup=metric,
+        showlegend=True,
+        line=dict(color=color, dash="solid") if color else dict(dash="solid"),
+        marker=dict(symbol="circle"),
+        hovertemplate=f"{label}<br>Week: %{{x}}<br>Average composite value: %{{y:.2f}}<extra></extra>"
+    )
+
+@lru_cache(maxsize=None)
+def weekly_recovery_menus(labels: tuple) -> list:
+    """Metric menu of the weekly recovery chart for its traces `labels`: all of them, or one at a time."""
+    buttons = [dict(label="Display All", method="update", args=[{"visible": [True] * len(labels)}])]
+    for i, label in enumerate(labels):
+        buttons.append(dict(
+            label=label, method="update", args=[{"visible": [j == i for j in range(len(labels))]}]
+        ))
+    return [_metric_menu(buttons)]
+
+def _metric_menu(buttons: list) -> dict:
+    return dict(
+        type="dropdown",
+        direction="down",
+        buttons=buttons,
+        showactive=True,
+        x=1.1,
+        xanchor="right",
+        y=1.05,
+        yanchor="bottom",
+        bgcolor=COLOR_SNOW,
+        font={'color': COLOR_DARK_BLUE}
+    )
+
+@lru_cache(maxsize=None)
+def recovery_radar_layout(
+    title, title_font_size, title_font_family, title_color, background_color,
+    axis_font_size, axis_font_family, axis_font_color,
+    theta_label_color, theta_label_fontsize, theta_label_font_family
+) -> dict:
+    """Layout of the 7-day recovery radar chart."""
+    return _layout(go.Figure(layout=dict(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[-1, 1],
+                tickfont=dict(size=axis_font_size, color=axis_font_color, family=axis_font_family)
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=theta_label_fontsize, color=theta_label_color, family=theta_label_font_family)
+            )
+        ),
+        margin=dict(t=40, b=10, l=0, r=0),
+        showlegend=False,
+        title=dict(
+            text=title,
+            font=dict(size=title_font_size, color=title_color, family=title_font_family),
+            x=0.5,
+            xanchor="center",
+            pad=dict(t=0, b=0)
+        ),
+        paper_bgcolor=background_color,
+        plot_bgcolor=background_color
+    )), ("scatterpolar",))
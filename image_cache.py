@@ -0,0 +1,244 @@
+"""
+Local cache of the remote images (player photos, flags and club logos).
+
+`python image_cache.py` downloads every image referenced by the data once and
+writes a thumbnail sized for each place it is displayed. The app then serves
+them from its own /images route with long-lived cache headers; images that
+were not prefetched keep their remote URL.
+"""
+import argparse
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import sys
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import flask
+import pandas as pd
+
+from config import IMAGE_CACHE, IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_AGE
+from constants import URL_CHELSEA_LOGO
+
+IMAGE_ROUTE = "/images"
+MANIFEST_FILE = "manifest.json"
+
+# Files served as they were downloaded (not decodable by Pillow, e.g. SVG) can
+# hold scripts: they are served with a policy that blocks them, and as an
+# attachment when opened directly rather than displayed by an <img>.
+IMAGE_CONTENT_SECURITY_POLICY = "default-src 'none'; style-src 'unsafe-inline'; sandbox"
+RASTER_MIMETYPES = {"image/webp", "image/png", "image/jpeg", "image/gif"}
+
+# Height (in px) of the thumbnail generated for each usage context: about twice
+# the displayed height on a 1080p screen, so that they stay sharp on HiDPI screens.
+# Images are never upscaled.
+THUMBNAIL_HEIGHTS = {
+    "player_sidebar": 420,   # sidebar avatars (shown at 240% of a 4.5vw circle)
+    "player_portrait": 860,  # overview page portrait (70vh)
+    "flag": 80,              # flag next to the player's name
+    "match_logo": 180,       # opponent logos of the last 5 matches
+    "chart_logo": 96,        # opponent logos above the load chart
+    "club_logo": 300         # Chelsea logo of the header
+}
+
+# Raw CSV file and column of the image URLs of each usage context (besides the
+# Chelsea logo of the header).
+IMAGE_SOURCES = {
+    "player_sidebar": ("ref_player.csv", "player_picture_url"),
+    "player_portrait": ("ref_player.csv", "player_picture_url"),
+    "flag": ("ref_country.csv", "url_picture"),
+    "match_logo": ("ref_team.csv", "url_picture"),
+    "chart_logo": ("ref_team.csv", "url_picture")
+}
+
+# =============================================================================
+# Image Cache
+# =============================================================================
+
+class ImageCache:
+    """
+    Manifest of the prefetched images: for each remote URL, the local file of
+    each thumbnail. File names are content hashes, so a cached file never
+    changes and can be served as immutable.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+
+    @property
+    def version(self) -> str:
+        """Hash of the manifest, which changes whenever images are prefetched again."""
+        raw = json.dumps(self.manifest, sort_keys=True)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+    def url(self, source_url, context: str):
+        """Return the local URL of the thumbnail of `source_url` for `context`, or `source_url` itself."""
+        path = self.manifest.get(source_url, {}).get(context)
+        return f"{IMAGE_ROUTE}/{path}" if path else source_url
+
+    def _write(self, relative_path: str, content: bytes):
+        path = os.path.join(self.cache_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(content)
+
+    def prefetch(self, urls_by_context: dict, workers: int = 8, timeout: float = 20, force: bool = False) -> dict:
+        """
+        Download every URL once and write its thumbnail for each of its contexts.
+
+        Already cached URLs are skipped unless `force` is set. Returns the number
+        of downloaded, skipped and failed URLs.
+        """
+        contexts_by_url = {}
+        for context, urls in urls_by_context.items():
+            for url in urls:
+                contexts_by_url.setdefault(url, set()).add(context)
+        todo = {
+            url: contexts for url, contexts in contexts_by_url.items()
+            if force or not contexts <= set(self.manifest.get(url, {}))
+        }
+        summary = {"downloaded": 0, "skipped": len(contexts_by_url) - len(todo), "failed": 0}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {url: executor.submit(download, url, timeout) for url in todo}
+            for url, future in futures.items():
+                try:
+                    content, content_type = future.result()
+                    self.manifest[url] = {
+                        context: self._store(content, content_type, context)
+                        for context in sorted(todo[url])
+                    }
+                    summary["downloaded"] += 1
+                except Exception as exc:
+                    print(f"Failed to cache {url}: {exc}", file=sys.stderr)
+                    summary["failed"] += 1
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.manifest_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        return summary
+
+    def _store(self, content: bytes, content_type: str, context: str) -> str:
+        """Write the thumbnail of an image for a context and return its path relative to the cache."""
+        thumbnail, extension = make_thumbnail(content, THUMBNAIL_HEIGHTS[context])
+        if thumbnail is None:
+            # Not decodable by Pillow (e.g. SVG): serve the original file, with
+            # the restrictive headers of init_app.
+            thumbnail = content
+            extension = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ".img"
+        name = hashlib.sha256(thumbnail).hexdigest()[:20] + extension
+        relative_path = f"{context}/{name}"
+        self._write(relative_path, thumbnail)
+        return relative_path
+
+def download(url: str, timeout: float) -> tuple:
+    """Return the content and content type of a remote image."""
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (CFC Vizathon image cache)"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read(), response.headers.get("Content-Type", "")
+
+def make_thumbnail(content: bytes, height: int) -> tuple:
+    """Resize an image to `height` (never upscaled) as WebP, or PNG without WebP support."""
+    try:
+        from PIL import Image, UnidentifiedImageError, features
+    except ImportError as exc:
+        raise ImportError("Generating thumbnails requires Pillow: pip install pillow") from exc
+    try:
+        image = Image.open(io.BytesIO(content))
+        image.load()
+    except (UnidentifiedImageError, OSError):
+        return None, None
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    if image.height > height:
+        width = max(1, round(image.width * height / image.height))
+        image = image.resize((width, height), Image.LANCZOS)
+    output = io.BytesIO()
+    if features.check("webp"):
+        image.save(output, format="WEBP", quality=85, method=6)
+        return output.getvalue(), ".webp"
+    image.save(output, format="PNG", optimize=True)
+    return output.getvalue(), ".png"
+
+image_cache = ImageCache(IMAGE_CACHE_DIR) if IMAGE_CACHE else None
+
+def image_url(source_url, context: str):
+    """Return the URL to display an image in a context: the local thumbnail when prefetched."""
+    if image_cache is None or not isinstance(source_url, str):
+        return source_url
+    return image_cache.url(source_url, context)
+
+def image_cache_version() -> str:
+    """Version of the prefetched images, part of the response cache keys."""
+    return image_cache.version if image_cache is not None else ""
+
+# =============================================================================
+# Flask Integration and Prefetch Command
+# =============================================================================
+
+def init_app(server: flask.Flask):
+    """
+    Serve the cached images with long-lived, immutable cache headers, and a
+    content security policy that keeps active content (SVG scripts) inert.
+    """
+    if image_cache is None:
+        return
+
+    @server.route(f"{IMAGE_ROUTE}/<path:filename>")
+    def _cached_image(filename):
+        response = flask.send_from_directory(
+            os.path.abspath(image_cache.cache_dir), filename, max_age=IMAGE_CACHE_MAX_AGE
+        )
+        response.cache_control.immutable = True
+        response.headers["Content-Security-Policy"] = IMAGE_CONTENT_SECURITY_POLICY
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        if response.mimetype not in RASTER_MIMETYPES:
+            response.headers["Content-Disposition"] = "attachment"
+        return response
+
+def collect_image_urls(data_dir: str) -> dict:
+    """
+    Return the remote image URLs of the raw CSV files, grouped by usage context.
+    Only the URL columns are read: the data pipeline is not run.
+    """
+    columns = {}
+    for filename, column in IMAGE_SOURCES.values():
+        columns.setdefault(filename, set()).add(column)
+    tables = {
+        filename: pd.read_csv(os.path.join(data_dir, filename), sep=";", usecols=sorted(names))
+        for filename, names in columns.items()
+    }
+    urls_by_context = {
+        context: {url for url in tables[filename][column].dropna().unique() if isinstance(url, str) and url}
+        for context, (filename, column) in IMAGE_SOURCES.items()
+    }
+    urls_by_context["club_logo"] = {URL_CHELSEA_LOGO}
+    return urls_by_context
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default="data", help="Directory of the raw CSV files.")
+    parser.add_argument("--cache-dir", default=IMAGE_CACHE_DIR, help="Directory of the image cache.")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel downloads.")
+    parser.add_argument("--timeout", type=float, default=20, help="Timeout of each download, in seconds.")
+    parser.add_argument("--force", action="store_true", help="Download images that are already cached again.")
+    args = parser.parse_args(argv)
+
+    cache = ImageCache(args.cache_dir)
+    summary = cache.prefetch(collect_image_urls(args.data_dir), args.workers, args.timeout, args.force)
+    print(
+        f"{summary['downloaded']} downloaded, {summary['skipped']} already cached, "
+        f"{summary['failed']} failed ({args.cache_dir})",
+        file=sys.stderr
+    )
+    if summary["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
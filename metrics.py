@@ -0,0 +1,299 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+import flask
+from dash.exceptions import PreventUpdate
+
+from config import METRICS, METRICS_PATH
+
+# =============================================================================
+# Shared Metric Store
+# =============================================================================
+
+class MetricStore:
+    """
+    Metric samples summed in a SQLite file shared by every process of the app
+    (gunicorn workers, background callback jobs), so that /metrics reports all
+    of them whichever worker answers the scrape. The file is created on the
+    first sample and kept across restarts, which Prometheus counters allow.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current thread and process."""
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS samples ("
+                "name TEXT NOT NULL, labels TEXT NOT NULL, suffix TEXT NOT NULL, le TEXT NOT NULL, "
+                "value REAL NOT NULL, PRIMARY KEY (name, labels, suffix, le))"
+            )
+            self._local.pid = pid
+            self._local.conn = conn
+        return self._local.conn
+
+    def add(self, samples: list):
+        """Add each (name, labels, suffix, le, amount) sample to its stored value, in one transaction."""
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO samples (name, labels, suffix, le, value) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (name, labels, suffix, le) DO UPDATE SET value = value + excluded.value",
+                samples
+            )
+
+    def samples(self, name: str) -> list:
+        """Return the (labels, suffix, le, value) samples of a metric."""
+        if not os.path.exists(self.path):
+            return []
+        return self._connection().execute(
+            "SELECT labels, suffix, le, value FROM samples WHERE name = ?", (name,)
+        ).fetchall()
+
+# =============================================================================
+# Metric Types
+# =============================================================================
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PAYLOAD_BUCKETS = (1e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: dict) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+def _labels_key(labels: dict) -> str:
+    return json.dumps(sorted(labels.items()))
+
+class Counter:
+    """Monotonic counter with labels, summed over the processes sharing `store`."""
+
+    def __init__(self, name: str, documentation: str, store: MetricStore):
+        self.name = name
+        self.documentation = documentation
+        self.store = store
+
+    def inc(self, amount: float = 1, **labels):
+        self.store.add([(self.name, _labels_key(labels), "", "", amount)])
+
+    def expose(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, _, _, value in sorted(self.store.samples(self.name)):
+            lines.append(f"{self.name}{_format_labels(dict(json.loads(key)))} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    """
+    Cumulative histogram with labels, exposed as Prometheus buckets, sum and
+    count. The store holds the count of each bucket on its own; they are made
+    cumulative when exposed.
+    """
+
+    def __init__(self, name: str, documentation: str, buckets: tuple, store: MetricStore):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self.store = store
+
+    def observe(self, value: float, **labels):
+        key = _labels_key(labels)
+        bound = next(bound for bound in self.buckets if value <= bound)
+        self.store.add([
+            (self.name, key, "_bucket", _format_value(bound), 1),
+            (self.name, key, "_sum", "", value)
+        ])
+
+    def expose(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        counts, totals = {}, {}
+        for key, suffix, le, value in self.store.samples(self.name):
+            if suffix == "_sum":
+                totals[key] = value
+            else:
+                counts.setdefault(key, {})[le] = value
+        for key in sorted(totals):
+            labels = dict(json.loads(key))
+            cumulative = 0
+            for bound in self.buckets:
+                cumulative += counts.get(key, {}).get(_format_value(bound), 0)
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(totals[key])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+        return lines
+
+# =============================================================================
+# Callback Metrics
+# =============================================================================
+
+metric_store = MetricStore(METRICS_PATH)
+
+CALLBACK_CALLS = Counter(
+    "cfc_callback_calls_total",
+    "Number of Dash callback executions.",
+    metric_store
+)
+CALLBACK_ERRORS = Counter(
+    "cfc_callback_errors_total",
+    "Number of Dash callback executions that raised an exception.",
+    metric_store
+)
+CALLBACK_PHASE_SECONDS = Histogram(
+    "cfc_callback_phase_seconds",
+    "Dash callback latency by phase (filter, build, serialize, total).",
+    LATENCY_BUCKETS,
+    metric_store
+)
+CALLBACK_PAYLOAD_BYTES = Histogram(
+    "cfc_callback_payload_bytes",
+    "Size of the JSON response sent by a Dash callback.",
+    PAYLOAD_BUCKETS,
+    metric_store
+)
+REGISTRY = [CALLBACK_CALLS, CALLBACK_ERRORS, CALLBACK_PHASE_SECONDS, CALLBACK_PAYLOAD_BYTES]
+
+_current_phases = ContextVar("cfc_callback_phases", default=None)
+_recorded = ContextVar("cfc_callback_recorded", default=True)
+
+@contextmanager
+def unrecorded():
+    """Do not record the callbacks run inside the block, which are not user traffic (e.g. the warm-up)."""
+    token = _recorded.set(False)
+    try:
+        yield
+    finally:
+        _recorded.reset(token)
+
+@contextmanager
+def callback_phase(phase: str):
+    """Time a named phase (e.g. "filter") of the callback currently running."""
+    phases = _current_phases.get()
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - start
+
+def instrumented_callback(name: str, tab=None):
+    """
+    Record call counts and phase latencies of a Dash callback.
+
+    `tab` labels the metrics with the page the callback renders; it is either a
+    fixed value or a function of the callback arguments. The time spent outside
+    the phases marked with `callback_phase` is reported as "build". Serialization
+    time and payload size are measured around the Flask response (see
+    `timed_serialization` and `init_app`).
+    Calls made inside `unrecorded` are not recorded.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            if not METRICS or not _recorded.get():
+                return func(*args)
+            labels = {
+                "callback": name,
+                "tab": str(tab(*args) if callable(tab) else (tab if tab is not None else "none"))
+            }
+            phases = {}
+            token = _current_phases.set(phases)
+            start = time.perf_counter()
+            try:
+                output = func(*args)
+            except PreventUpdate:
+                raise
+            except Exception:
+                CALLBACK_ERRORS.inc(**labels)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                _current_phases.reset(token)
+                CALLBACK_CALLS.inc(**labels)
+            for phase, seconds in phases.items():
+                CALLBACK_PHASE_SECONDS.observe(seconds, phase=phase, **labels)
+            CALLBACK_PHASE_SECONDS.observe(max(elapsed - sum(phases.values()), 0.0), phase="build", **labels)
+            if flask.has_request_context():
+                flask.g.cfc_callback = labels
+            return output
+        return wrapper
+    return decorator
+
+# =============================================================================
+# Flask Integration
+# =============================================================================
+
+def render_metrics() -> str:
+    """Return every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.expose())
+    return "\n".join(lines) + "\n"
+
+def timed_serialization(encoder):
+    """
+    Wrap the JSON encoder of Dash (see `serialization.install`) so that its time
+    is recorded as the "serialize" phase of the callback answered by the request.
+    """
+    @wraps(encoder)
+    def wrapper(value):
+        if not flask.has_request_context():
+            return encoder(value)
+        start = time.perf_counter()
+        try:
+            return encoder(value)
+        finally:
+            flask.g.cfc_serialize_seconds = flask.g.get("cfc_serialize_seconds", 0.0) + time.perf_counter() - start
+    return wrapper
+
+def init_app(server: flask.Flask, route: str = "/metrics"):
+    """
+    Register the metrics endpoint and the request hooks on the Flask server.
+
+    Dash serializes the callback output after the callback has returned: the
+    serialization phase is the time spent in its encoder, when wrapped by
+    `timed_serialization`, and the payload size is the size of the response body.
+    """
+    @server.before_request
+    def _start_timer():
+        flask.g.cfc_request_start = time.perf_counter()
+
+    @server.after_request
+    def _record_response(response):
+        labels = flask.g.pop("cfc_callback", None)
+        start = flask.g.pop("cfc_request_start", None)
+        serialize_seconds = flask.g.pop("cfc_serialize_seconds", None)
+        if labels is not None and start is not None:
+            elapsed = time.perf_counter() - start
+            if serialize_seconds is not None:
+                CALLBACK_PHASE_SECONDS.observe(serialize_seconds, phase="serialize", **labels)
+            CALLBACK_PHASE_SECONDS.observe(elapsed, phase="total", **labels)
+            if not response.direct_passthrough:
+                CALLBACK_PAYLOAD_BYTES.observe(len(response.get_data()), **labels)
+        return response
+
+    @server.route(route)
+    def _metrics():
+        return flask.Response(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,193 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from functools import wraps
+
+import flask
+import pandas as pd
+
+from config import (
+    STARTUP_PROFILE, STARTUP_PROFILE_PATH,
+    REQUEST_PROFILING, REQUEST_PROFILING_DIR, REQUEST_PROFILING_INTERVAL_MS
+)
+
+# =============================================================================
+# Startup Profiler
+# =============================================================================
+
+def count_rows(result) -> int:
+    """Return the number of rows of a DataFrame, or the total over a tuple/dict of DataFrames."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, dict):
+        return sum(count_rows(value) for value in result.values())
+    if isinstance(result, (tuple, list)):
+        return sum(count_rows(value) for value in result)
+    return 0
+
+class StartupProfiler:
+    """
+    Record wall time, CPU time, peak memory delta and output row count of each
+    named stage of the data pipeline.
+
+    When disabled, `run` only calls the stage function. When enabled, memory is
+    traced with tracemalloc, which slows the pipeline down: the timings are
+    meant to compare stages with each other, not to measure absolute startup time.
+    """
+
+    def __init__(self, enabled: bool, output_path: str = ""):
+        self.enabled = enabled
+        self.output_path = output_path
+        self.stages = []
+        self._owns_tracing = self.enabled and not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+
+    def run(self, name: str, func, *args, **kwargs):
+        """Run one stage of the pipeline and record its profile."""
+        if not self.enabled:
+            return func(*args, **kwargs)
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = func(*args, **kwargs)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        memory_peak = tracemalloc.get_traced_memory()[1]
+        self.stages.append({
+            "stage": name,
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "peak_memory_delta_mb": round((memory_peak - memory_before) / 1024 ** 2, 2),
+            "rows": count_rows(result)
+        })
+        return result
+
+    def report(self) -> dict:
+        """Return the recorded stages and their totals."""
+        return {
+            "stages": self.stages,
+            "total_wall_s": round(sum(s["wall_s"] for s in self.stages), 4),
+            "total_cpu_s": round(sum(s["cpu_s"] for s in self.stages), 4)
+        }
+
+    def emit(self):
+        """Stop tracing memory, then write the report as JSON to the output path or print it on stderr."""
+        if not self.enabled:
+            return
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        report = self.report()
+        if self.output_path:
+            with open(self.output_path, "w") as f:
+                json.dump(report, f, indent=2)
+            return
+        header = f"{'stage':<24}{'wall (s)':>10}{'cpu (s)':>10}{'peak mem (MB)':>15}{'rows':>10}"
+        lines = ["Startup profile", header, "-" * len(header)]
+        for s in self.stages:
+            lines.append(
+                f"{s['stage']:<24}{s['wall_s']:>10.3f}{s['cpu_s']:>10.3f}"
+                f"{s['peak_memory_delta_mb']:>15.2f}{s['rows']:>10}"
+            )
+        lines.append("-" * len(header))
+        lines.append(f"{'total':<24}{report['total_wall_s']:>10.3f}{report['total_cpu_s']:>10.3f}")
+        print("\n".join(lines), file=sys.stderr)
+
+startup_profiler = StartupProfiler(STARTUP_PROFILE or bool(STARTUP_PROFILE_PATH), STARTUP_PROFILE_PATH)
+
+# =============================================================================
+# On-demand Callback Profiler
+# =============================================================================
+
+PROFILE_HEADER = "X-CFC-Profile"
+PROFILE_QUERY_PARAM = "profile"
+
+class SamplingProfiler:
+    """
+    Sample the Python stack of one thread at a fixed interval from a helper thread.
+
+    Samples are aggregated as folded stacks ("root;child;leaf count"), the input
+    format of flamegraph.pl, inferno and speedscope.
+    """
+
+    def __init__(self, thread_id: int, interval_s: float):
+        self.thread_id = thread_id
+        self.interval_s = interval_s
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="callback-profiler", daemon=True)
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+    def _sample(self):
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_folded(self, path: str):
+        """Write the collected samples as folded stacks."""
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+def profile_requested() -> bool:
+    """Return True if the current callback request asks to be profiled (debug hook only)."""
+    if not REQUEST_PROFILING or not flask.has_request_context():
+        return False
+    request = flask.request
+    return request.headers.get(PROFILE_HEADER) == "1" or request.args.get(PROFILE_QUERY_PARAM) == "1"
+
+def profiled_callback(name: str):
+    """
+    Sample-profile one execution of a Dash callback when the request carries the
+    `X-CFC-Profile: 1` header or the `profile=1` query flag.
+
+    The folded stacks are written under REQUEST_PROFILING_DIR and the file path is
+    returned in the `X-CFC-Profile-File` response header. Without CFC_REQUEST_PROFILING
+    the wrapper only checks a module flag.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            if not profile_requested():
+                return func(*args)
+            profiler = SamplingProfiler(threading.get_ident(), REQUEST_PROFILING_INTERVAL_MS / 1000)
+            profiler.start()
+            try:
+                return func(*args)
+            finally:
+                profiler.stop()
+                os.makedirs(REQUEST_PROFILING_DIR, exist_ok=True)
+                path = os.path.join(
+                    REQUEST_PROFILING_DIR,
+                    f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() // 1_000_000 % 1000:03d}-{os.getpid()}.folded"
+                )
+                profiler.write_folded(path)
+
+                @flask.after_this_request
+                def _add_profile_header(response):
+                    response.headers["X-CFC-Profile-File"] = path
+                    return response
+        return wrapper
+    return decorator
@@ -0,0 +1,123 @@
+"""
+Batch export of the per-player season reports to standalone HTML files.
+
+`python report_export.py` renders, for every player and season, the overview,
+load demand and recovery pages of the dashboard (the same components as the
+page callbacks) into one HTML file per player and season, plus an index. The
+files open offline: they share one copy of plotly.min.js, of the fonts and of
+the prefetched images (see image_cache.py), written next to them. The reports
+are rendered in parallel by a process pool.
+"""
+import os
+
+# Reports are rendered from the data, not from the response cache, and do not
+# need the warm-up or the metrics.
+os.environ.setdefault("CFC_RESPONSE_CACHE", "0")
+os.environ.setdefault("CFC_WARMUP", "0")
+os.environ.setdefault("CFC_METRICS", "0")
+
+import argparse
+import html as html_text
+import multiprocessing
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from image_cache import image_cache
+from static_html import ReportRenderer, inline_figures_script, page, section, write_shared_assets
+
+# =============================================================================
+# Report Pages
+# =============================================================================
+
+def report_filename(name: str, season: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", f"{name} {season}".lower()).strip("-")
+    return f"{slug}.html"
+
+def export_report(job: tuple) -> tuple:
+    """Render one player's season report into `output_dir`; return its file name and the images it uses."""
+    import app
+
+    player_id, name, season, output_dir = job
+    renderer = ReportRenderer()
+    body = f'<header class="report-header">{html_text.escape(name.upper())} <span>{html_text.escape(season)}</span></header>\n'
+    for _, title, components in app.report_pages(player_id, season):
+        body += section(title, renderer.render(components))
+    filename = report_filename(name, season)
+    with open(os.path.join(output_dir, filename), "w", encoding="utf-8") as f:
+        f.write(page(f"{name} - {season}", body, inline_figures_script(renderer)))
+    return filename, renderer.images
+
+# =============================================================================
+# Shared Assets and Export Command
+# =============================================================================
+
+def copy_images(filenames: set, output_dir: str):
+    """Copy the prefetched images used by the reports next to them, once each."""
+    if image_cache is None:
+        return
+    for filename in filenames:
+        target = os.path.join(output_dir, "images", filename)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(os.path.join(image_cache.cache_dir, filename), target)
+
+def write_index(reports: list, output_dir: str):
+    rows = "\n".join(
+        f'<li><a href="{filename}">{html_text.escape(name)} - {html_text.escape(season)}</a></li>'
+        for name, season, filename in reports
+    )
+    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(page("Player reports", f'<header class="report-header">PLAYER REPORTS</header>\n<ul>\n{rows}\n</ul>'))
+
+def export_jobs(output_dir: str, player_ids=None, seasons=None) -> list:
+    """Return one (player_id, name, season, output_dir) job per player and season with data."""
+    import app
+
+    all_seasons = app.report_seasons()
+    jobs = []
+    for _, player in app.df_player_resume.iterrows():
+        if player_ids and int(player["player_id"]) not in player_ids:
+            continue
+        for season in all_seasons:
+            if not seasons or season in seasons:
+                jobs.append((int(player["player_id"]), player["name"], season, output_dir))
+    return jobs
+
+def pool_context():
+    """Fork the workers when possible, so that they inherit the loaded data instead of loading it again."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output-dir", default="reports", help="Directory of the HTML reports.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--players", type=int, nargs="+", help="Export these player ids only.")
+    parser.add_argument("--seasons", nargs="+", help="Export these seasons only (e.g. 2024/2025).")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    import app  # noqa: F401  (loads the data once, before the workers are forked)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    write_shared_assets(args.output_dir)
+    jobs = export_jobs(args.output_dir, args.players, args.seasons)
+    images = set()
+    reports = []
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=pool_context()) as pool:
+        for job, (filename, job_images) in zip(jobs, pool.map(export_report, jobs)):
+            reports.append((job[1], job[2], filename))
+            images |= job_images
+    copy_images(images, args.output_dir)
+    write_index(reports, args.output_dir)
+    print(
+        f"{len(reports)} reports written to {args.output_dir} in {time.perf_counter() - start:.1f} s",
+        file=sys.stderr
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from functools import lru_cache, wraps
+
+from config import RESPONSE_CACHE, RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_MB, RENDER_OPTIONS
+from data_loader import DATA_VERSION
+from image_cache import image_cache_version
+from profiling import profile_requested
+from serialization import to_json
+
+# =============================================================================
+# SQLite Response Cache
+# =============================================================================
+
+class ResponseCache:
+    """
+    Cache of serialized callback outputs stored in a SQLite file.
+
+    The file is shared by every process of the app (gunicorn workers, background
+    callback workers), so a figure built once is reused by all of them. Entries
+    expire after `ttl` seconds and the least recently used entries are evicted
+    once the stored payloads exceed `max_bytes`.
+    """
+
+    def __init__(self, path: str, ttl: float, max_bytes: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current thread and process."""
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._local.pid = pid
+            self._local.conn = conn
+        return self._local.conn
+
+    def get(self, key: str):
+        """Return the cached payload for `key`, or None if missing or expired."""
+        conn = self._connection()
+        row = conn.execute("SELECT payload, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > self.ttl:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key: str, payload: str):
+        """Store `payload` under `key` and evict entries beyond the size limit."""
+        conn = self._connection()
+        now = time.time()
+        size = len(payload)
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, payload, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, payload, size, now, now)
+        )
+        conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC").fetchall()
+            stale = []
+            for old_key, old_size in rows:
+                if total <= self.max_bytes:
+                    break
+                stale.append((old_key,))
+                total -= old_size
+            conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self):
+        """Remove every entry."""
+        self._connection().execute("DELETE FROM responses")
+
+response_cache = (
+    ResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL, int(RESPONSE_CACHE_MAX_MB * 1024 * 1024))
+    if RESPONSE_CACHE else None
+)
+
+# =============================================================================
+# Callback Decorator
+# =============================================================================
+
+# Modules whose code shapes the callback outputs, besides the callback module.
+RENDER_MODULES = (
+    "components", "chart_hover", "figure_templates", "downsampling", "data_loader", "constants", "styles", "serialization"
+)
+
+def _module_path(name: str):
+    path = getattr(sys.modules.get(name), "__file__", None)
+    if path is None and name != "__main__":
+        spec = importlib.util.find_spec(name)
+        path = spec.origin if spec is not None else None
+    return path
+
+@lru_cache(maxsize=None)
+def render_version(*module_names: str) -> str:
+    """
+    Hash the source of the given modules (the callback module) and of
+    RENDER_MODULES, the resolved RENDER_OPTIONS and the version of the
+    prefetched images.
+    """
+    digest = hashlib.sha1(image_cache_version().encode("utf-8"))
+    digest.update(json.dumps(RENDER_OPTIONS, sort_keys=True).encode("utf-8"))
+    for name in (*module_names, *RENDER_MODULES):
+        path = _module_path(name)
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+def make_cache_key(name: str, args: tuple, version: str = "") -> str:
+    """Build the cache key of a callback call from its name, inputs and the data version."""
+    raw = json.dumps([name, DATA_VERSION, version, list(args)], default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def cached_response(name: str):
+    """
+    Cache the serialized output of a Dash callback in the shared response cache.
+
+    The key is made of the callback name, its input values, the data version and
+    the render version (rendering code and options, see `render_version`). Hits are returned as the decoded JSON tree,
+    which Dash sends to the browser unchanged. Profiled requests bypass the cache
+    so that the profile covers a real render.
+    """
+    def decorator(func):
+        version = None
+
+        @wraps(func)
+        def wrapper(*args):
+            nonlocal version
+            if response_cache is None or profile_requested():
+                return func(*args)
+            if version is None:
+                version = render_version(func.__module__)
+            key = make_cache_key(name, args, version)
+            payload = response_cache.get(key)
+            if payload is not None:
+                return json.loads(payload)
+            output = func(*args)
+            response_cache.set(key, to_json(output))
+            return output
+        return wrapper
+    return decorator
@@ -0,0 +1,120 @@
+"""
+Fast JSON serialization of the callback responses.
+
+Dash serializes every response with plotly's `to_json_plotly`. Its orjson
+engine gives up as soon as the response holds a Dash component, and then walks
+the whole response in Python (`clean_to_json_compatible`) before encoding it.
+`to_json` encodes the response with orjson in a single pass instead: numeric
+numpy arrays, datetimes and NaN are handled natively, and the few other types
+(components, Timestamps, pandas objects, object arrays) by `_default`.
+
+The engine is chosen with CFC_JSON_ENGINE; without orjson, or for a value it
+cannot encode, `to_json` falls back to plotly's encoder. Dash has no public hook
+for its encoder: `install` replaces private module attributes, and only on the
+Dash versions it was checked against (SUPPORTED_DASH_VERSIONS).
+"""
+import decimal
+import logging
+
+import numpy as np
+import pandas as pd
+from plotly.io.json import to_json_plotly
+
+from config import JSON_ENGINE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+# Dash versions (prefixes) whose private encoder hooks `install` replaces.
+SUPPORTED_DASH_VERSIONS = ("3.0.",)
+
+logger = logging.getLogger(__name__)
+
+# Characters escaped like plotly does, so the JSON can be embedded in HTML.
+UNSAFE_CHARACTERS = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("/", "\\u002f"),
+    ("\u2028", "\\u2028"),
+    ("\u2029", "\\u2029")
+)
+
+# =============================================================================
+# Encoders
+# =============================================================================
+
+def _default(value):
+    """Convert the values orjson does not encode natively."""
+    if hasattr(value, "to_plotly_json"):
+        return value.to_plotly_json()
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, (pd.Series, pd.Index)):
+        value = value.to_numpy()
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "biufM":
+            return np.ascontiguousarray(value)
+        return value.tolist()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _escape(text: str) -> str:
+    for character, escaped in UNSAFE_CHARACTERS:
+        if character in text:
+            text = text.replace(character, escaped)
+    return text
+
+def orjson_dumps(value) -> str:
+    """Encode `value` with orjson; raise TypeError for a value it cannot encode."""
+    return _escape(orjson.dumps(value, default=_default, option=ORJSON_OPTIONS).decode("utf-8"))
+
+def to_json(value) -> str:
+    """
+    Encode a callback response (or any Dash/plotly value) as JSON, with the
+    engine selected by CFC_JSON_ENGINE and plotly's encoder as the fallback.
+    """
+    if JSON_ENGINE == "orjson" and orjson is not None:
+        try:
+            return orjson_dumps(value)
+        except TypeError:
+            pass
+    return to_json_plotly(value)
+
+# =============================================================================
+# Dash Integration
+# =============================================================================
+
+def install(wrap=None):
+    """
+    Make Dash serialize its callback responses and layout with `to_json`, or
+    with plotly's encoder when the orjson engine is off, wrapped by `wrap`
+    (e.g. to time it). On an unsupported Dash version, Dash keeps plotly's
+    encoder, unwrapped.
+    """
+    encoder = to_json if JSON_ENGINE == "orjson" and orjson is not None else to_json_plotly
+    if encoder is to_json_plotly and wrap is None:
+        return
+    import dash
+    import dash._callback
+    import dash.dash
+    # Private hooks: `dash._callback.to_json` encodes the callback responses and
+    # `dash.dash.to_json` the layout and the dependencies. Both are module-level
+    # names bound to plotly's `to_json_plotly` in Dash 3.0; their names and
+    # roles may change in any other release.
+    hooks = (dash._callback, dash.dash)
+    if not dash.__version__.startswith(SUPPORTED_DASH_VERSIONS) or not all(hasattr(hook, "to_json") for hook in hooks):
+        logger.warning("Dash %s does not support the serialization hooks: using plotly's encoder", dash.__version__)
+        return
+    if wrap is not None:
+        encoder = wrap(encoder)
+    for hook in hooks:
+        hook.to_json = encoder
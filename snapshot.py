@@ -0,0 +1,209 @@
+"""
+Static read-only snapshot of the dashboard (CFC_SNAPSHOT=1).
+
+Every tab of every player and season is rendered once, by the page callbacks,
+into a static HTML page and the JSON of its figures, written under
+CFC_SNAPSHOT_DIR/<version>/. The Flask server then serves them from
+/snapshot/ as static responses with ETags: viewers run no Dash callback, and a
+page already in the browser cache is revalidated with a 304. The version
+combines the data version and the render version of the response cache, so the
+snapshot is regenerated whenever the data, the rendering code or the render
+options change; older snapshots are removed.
+
+`python snapshot.py build` generates it before the server starts, so that the
+workers only serve it. Otherwise the first worker to start generates it while
+the others wait for it on a file lock.
+"""
+import argparse
+import hashlib
+import html as html_text
+import logging
+import mimetypes
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import flask
+from werkzeug.security import safe_join
+
+from static_html import ReportRenderer, fetched_figures_script, page, section, write_shared_assets
+
+try:
+    import fcntl
+except ImportError:  # Windows: no gunicorn workers, a single process generates the snapshot
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ROUTE = "/snapshot"
+INDEX = "index.html"
+LOCK_FILE = ".lock"
+
+# =============================================================================
+# Snapshot Generation
+# =============================================================================
+
+def season_slug(season: str) -> str:
+    return season.replace("/", "-")
+
+def page_path(player_id: int, season: str, tab: str) -> str:
+    """Return the path of a tab's page in the snapshot; its figures are in the same path with .json."""
+    return f"{player_id}/{season_slug(season)}/{tab}.html"
+
+def _link(href: str, text: str, active: bool = False) -> str:
+    active_class = ' class="active"' if active else ""
+    return f'<a href="{SNAPSHOT_ROUTE}/{href}"{active_class}>{html_text.escape(text)}</a>'
+
+def _write(path: str, text: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def generate(output_dir: str, report_pages, players: list, seasons: list):
+    """
+    Write the page and figure JSON of each (player, season, tab) into
+    `output_dir`, with the shared assets and an index.
+
+    `report_pages(player_id, season)` returns the (tab, title, components) of
+    each tab; `players` is a list of (player_id, name).
+    """
+    write_shared_assets(output_dir)
+    root = f"{SNAPSHOT_ROUTE}/"
+    index = []
+    for player_id, name in players:
+        player_nav = " ".join(
+            _link(page_path(other_id, seasons[-1], "overview"), other_name, other_id == player_id)
+            for other_id, other_name in players
+        )
+        for season in seasons:
+            pages = report_pages(player_id, season)
+            season_nav = " ".join(
+                _link(page_path(player_id, other, "overview"), other, other == season) for other in seasons
+            )
+            for tab, title, components in pages:
+                renderer = ReportRenderer(local_images=False)
+                content = section(title, renderer.render(components))
+                tab_nav = " ".join(
+                    _link(page_path(player_id, season, other), other_title, other == tab)
+                    for other, other_title, _ in pages
+                )
+                header = (
+                    f'<header class="report-header">{html_text.escape(name.upper())} '
+                    f'<span>{html_text.escape(season)}</span></header>\n'
+                    f'<nav class="report-nav">{player_nav}</nav>\n<nav class="report-nav">{season_nav}</nav>\n'
+                    f'<nav class="report-nav">{tab_nav}</nav>\n'
+                )
+                path = page_path(player_id, season, tab)
+                _write(os.path.join(output_dir, path), page(
+                    f"{name} - {season} - {title}", header + content,
+                    fetched_figures_script(f"{SNAPSHOT_ROUTE}/{path[:-len('.html')]}.json"), root
+                ))
+                _write(os.path.join(output_dir, path[:-len(".html")] + ".json"), renderer.figures_json())
+            index.append(f"<li>{_link(page_path(player_id, season, 'overview'), f'{name} - {season}')}</li>")
+    _write(os.path.join(output_dir, INDEX), page(
+        "Player reports", '<header class="report-header">PLAYER REPORTS</header>\n<ul>\n' + "\n".join(index) + "\n</ul>",
+        root=root
+    ))
+
+# =============================================================================
+# Snapshot Store
+# =============================================================================
+
+@contextmanager
+def build_lock(snapshot_dir: str):
+    """Hold an exclusive lock on the snapshot directory, shared by every process of the host."""
+    os.makedirs(snapshot_dir, exist_ok=True)
+    with open(os.path.join(snapshot_dir, LOCK_FILE), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+class Snapshot:
+    """The files of one snapshot, read from disk once and kept in memory with their ETag."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files = {}
+
+    @classmethod
+    def build(cls, snapshot_dir: str, version: str, report_pages, players: list, seasons: list) -> "Snapshot":
+        """
+        Return the snapshot of `version`, generating it first if it does not
+        exist yet. The generation holds `build_lock`: workers starting together
+        wait for the first one and then serve its snapshot. It is written to a
+        temporary directory and renamed, so a crash never leaves a partial
+        snapshot behind.
+        """
+        path = os.path.join(snapshot_dir, version)
+        if os.path.isdir(path):
+            return cls(path)
+        with build_lock(snapshot_dir):
+            if not os.path.isdir(path):
+                start = time.perf_counter()
+                staging = tempfile.mkdtemp(prefix=".staging-", dir=snapshot_dir)
+                try:
+                    generate(staging, report_pages, players, seasons)
+                    os.rename(staging, path)
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+                logger.info("Snapshot %s generated in %.1f s", version, time.perf_counter() - start)
+                for name in os.listdir(snapshot_dir):
+                    if name != version and not name.startswith("."):
+                        shutil.rmtree(os.path.join(snapshot_dir, name), ignore_errors=True)
+        return cls(path)
+
+    def get(self, filename: str):
+        """Return the (body, ETag) of a snapshot file, or None if there is no such file."""
+        if filename not in self.files:
+            path = safe_join(self.path, filename)
+            if path is None or not os.path.isfile(path):
+                return None
+            with open(path, "rb") as f:
+                body = f.read()
+            self.files[filename] = (body, hashlib.sha1(body).hexdigest())
+        return self.files[filename]
+
+# =============================================================================
+# Flask Integration
+# =============================================================================
+
+def init_app(server: flask.Flask, snapshot: Snapshot):
+    """Serve the snapshot from /snapshot/, with ETags so that browsers revalidate it with a 304."""
+    @server.route(f"{SNAPSHOT_ROUTE}/", defaults={"filename": INDEX})
+    @server.route(f"{SNAPSHOT_ROUTE}/<path:filename>")
+    def serve_snapshot(filename):
+        file = snapshot.get(filename)
+        if file is None:
+            flask.abort(404)
+        body, etag = file
+        response = flask.Response(body, mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(flask.request)
+
+# =============================================================================
+# Build Command
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["build"], help="Generate the snapshot of the current version.")
+    parser.parse_args(argv)
+
+    # The app is imported to render the pages, not to serve them: no warm-up,
+    # and the snapshot is built below rather than at import.
+    os.environ["CFC_WARMUP"] = "0"
+    os.environ["CFC_SNAPSHOT"] = "0"
+    import app
+
+    print(f"Snapshot ready in {app.build_snapshot().path}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Static HTML rendering of the dashboard pages, shared by report_export.py and
+the snapshot mode (snapshot.py).
+
+`ReportRenderer` writes the Dash components returned by the page callbacks (or
+their cached JSON trees) as static HTML, and collects their figures, which the
+page draws with Plotly.newPlot. The pages link a shared plotly.min.js and
+stylesheet, written once by `write_shared_assets`.
+"""
+import html as html_text
+import os
+import re
+import shutil
+
+from plotly.offline import get_plotlyjs
+
+from constants import COLOR_BLUE, COLOR_DARK_BLUE, COLOR_SNOW
+from image_cache import IMAGE_ROUTE
+from serialization import to_json
+
+PLOTLY_BUNDLE = "plotly.min.js"
+STYLESHEET = "report.css"
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+VOID_TAGS = {"img", "br", "hr", "input"}
+HTML_ATTRIBUTES = {"id": "id", "className": "class", "src": "src", "href": "href", "title": "title", "alt": "alt"}
+# Components that only make sense in the live dashboard.
+SKIPPED_COMPONENTS = {"Store", "Tooltip", "Dropdown", "DatePickerRange"}
+
+REPORT_CSS = f"""
+body {{ background-color: {COLOR_BLUE}; color: {COLOR_SNOW}; margin: 0; }}
+a {{ color: {COLOR_SNOW}; }}
+.report-header {{ background-color: {COLOR_DARK_BLUE}; font-family: "ChelseaBold"; font-size: 4vh; padding: 2vh 2vw; }}
+.report-header span {{ font-family: "ChelseaRegular"; margin-left: 1vw; }}
+.report-nav {{ background-color: {COLOR_DARK_BLUE}; font-family: "ChelseaRegular"; font-size: 2vh; padding: 0 2vw 1vh 2vw; }}
+.report-nav a {{ margin-right: 1.5vw; text-decoration: none; opacity: 0.7; }}
+.report-nav a.active {{ font-family: "ChelseaBold"; opacity: 1; }}
+.report-page {{ position: relative; height: 100vh; padding: 2vh 2vw; box-sizing: border-box; overflow: hidden; }}
+.report-page h2 {{ font-family: "ChelseaBold"; font-size: 3vh; margin: 0 0 2vh 0; }}
+.report-content {{ position: relative; height: 88vh; }}
+"""
+
+# =============================================================================
+# Static HTML Rendering of Dash Components
+# =============================================================================
+
+def css(style: dict) -> str:
+    """Return a Dash style dict (camelCase properties) as an inline CSS declaration list."""
+    def property_name(name):
+        return name if name.startswith("--") else re.sub(r"(?<!^)([A-Z])", r"-\1", name).lower()
+    return "; ".join(f"{property_name(name)}: {value}" for name, value in style.items())
+
+def _component(value):
+    """Return the (type, namespace, props) of a Dash component or of its JSON tree, or None."""
+    if hasattr(value, "to_plotly_json"):
+        return value._type, value._namespace, {name: getattr(value, name, None) for name in value._prop_names}
+    if isinstance(value, dict) and "type" in value and "namespace" in value and "props" in value:
+        return value["type"], value["namespace"], value["props"]
+    return None
+
+class ReportRenderer:
+    """
+    Render Dash components as static HTML; their graphs become empty divs and
+    their figures are collected in `figures`. With `local_images`, prefetched
+    images (/images/...) point at a copy next to the page, and their file names
+    are collected in `images`.
+    """
+
+    def __init__(self, local_images: bool = True):
+        self.local_images = local_images
+        self.figures = []
+        self.images = set()
+
+    def image(self, src):
+        if self.local_images and isinstance(src, str) and src.startswith(IMAGE_ROUTE + "/"):
+            filename = src[len(IMAGE_ROUTE) + 1:]
+            self.images.add(filename)
+            return f"images/{filename}"
+        return src
+
+    def render(self, value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (list, tuple)):
+            return "".join(self.render(child) for child in value)
+        component = _component(value)
+        if component is None:
+            return html_text.escape(str(value))
+        component_type, namespace, props = component
+        if component_type in SKIPPED_COMPONENTS:
+            return ""
+        if component_type == "Graph":
+            return self.graph(props)
+        if component_type == "Loading":
+            return self.render(props.get("children"))
+        tag = component_type.lower() if namespace == "dash_html_components" else "div"
+        attributes = ""
+        for prop, attribute in HTML_ATTRIBUTES.items():
+            value = props.get(prop)
+            if value is not None:
+                if prop == "src":
+                    value = self.image(value)
+                attributes += f' {attribute}="{html_text.escape(str(value))}"'
+        if props.get("style"):
+            attributes += f' style="{html_text.escape(css(props["style"]))}"'
+        if tag in VOID_TAGS:
+            return f"<{tag}{attributes}>"
+        return f"<{tag}{attributes}>{self.render(props.get('children'))}</{tag}>"
+
+    def graph(self, props: dict) -> str:
+        figure = dict(props.get("figure") or {})
+        layout = dict(figure.get("layout") or {})
+        if layout.get("images"):
+            layout["images"] = [{**image, "source": self.image(image.get("source"))} for image in layout["images"]]
+        figure["layout"] = layout
+        graph_id = f"figure-{len(self.figures)}"
+        self.figures.append({"id": graph_id, "figure": figure, "config": props.get("config") or {}})
+        return f'<div id="{graph_id}" style="{html_text.escape(css(props.get("style") or {}))}"></div>'
+
+    def figures_json(self) -> str:
+        return to_json(self.figures)
+
+# =============================================================================
+# Pages and Shared Assets
+# =============================================================================
+
+PLOT_FIGURES = "function plotFigures(figures) {\n" \
+    "    figures.forEach(function (f) { Plotly.newPlot(f.id, f.figure.data, f.figure.layout, f.config); });\n}\n"
+
+def inline_figures_script(renderer: ReportRenderer) -> str:
+    """Return a script drawing the renderer's figures, embedded in the page."""
+    return f"<script>\n{PLOT_FIGURES}plotFigures({renderer.figures_json()});\n</script>\n"
+
+def fetched_figures_script(url: str) -> str:
+    """Return a script drawing the figures fetched from a JSON file."""
+    return (
+        f"<script>\n{PLOT_FIGURES}"
+        f"fetch({to_json(url)}).then(function (r) {{ return r.json(); }}).then(plotFigures);\n</script>\n"
+    )
+
+def section(title: str, body: str) -> str:
+    return (
+        f'<section class="report-page"><h2>{html_text.escape(title)}</h2>'
+        f'<div class="report-content">{body}</div></section>\n'
+    )
+
+def page(title: str, body: str, scripts: str = "", root: str = "") -> str:
+    """Return an HTML page linking the shared stylesheet and Plotly bundle found under `root`."""
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html_text.escape(title)}</title>\n"
+        f"<link rel=\"stylesheet\" href=\"{root}{STYLESHEET}\">\n"
+        f"<script src=\"{root}{PLOTLY_BUNDLE}\"></script>\n</head>\n<body>\n{body}\n{scripts}</body>\n</html>\n"
+    )
+
+def write_shared_assets(output_dir: str):
+    """Write the files shared by every page: the Plotly bundle, the fonts and the stylesheet."""
+    with open(os.path.join(output_dir, PLOTLY_BUNDLE), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+    shutil.copytree(os.path.join(ASSETS_DIR, "fonts"), os.path.join(output_dir, "fonts"), dirs_exist_ok=True)
+    with open(os.path.join(ASSETS_DIR, "style.css"), encoding="utf-8") as f:
+        stylesheet = f.read().replace("/assets/fonts/", "fonts/")
+    with open(os.path.join(output_dir, STYLESHEET), "w", encoding="utf-8") as f:
+        f.write(stylesheet + REPORT_CSS)
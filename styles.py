@@ -31,6 +31,22 @@ SIDEBAR_BACKGROUND_STYLE = {
     "zIndex": "1"
 }
 
+SIDEBAR_STYLE = {
+    "height": "100%",
+    "width": f"{SIDEBAR_WIDTH_VW}vw",
+    "position": "absolute",
+    "top": "0",
+    "left": "0",
+    "zIndex": "4",
+    "paddingTop": f"{HEADER_HEIGHT_VH + LOGO_SIZE_VH / 2}vh",
+    "overflowY": "auto"
+}
+
+SIDEBAR_WINDOW_STYLE = {
+    "position": "relative",
+    "width": "100%"
+}
+
 LOGO_STYLE = {
     "position": "absolute",
     "top": f"{HEADER_HEIGHT_VH}vh",
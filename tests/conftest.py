@@ -0,0 +1,229 @@
+import json
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+# The tests render from the data: no shared response cache, warm-up or metrics.
+os.environ.setdefault("CFC_RESPONSE_CACHE", "0")
+os.environ.setdefault("CFC_WARMUP", "0")
+os.environ.setdefault("CFC_METRICS", "0")
+os.environ.setdefault("CFC_BACKGROUND_CALLBACKS", "0")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.callbacks import CALLBACK_ENDPOINT, callback_request, stringify_id  # noqa: E402
+from serialization import to_json  # noqa: E402
+
+# =============================================================================
+# Dash Renderer Stand-in
+# =============================================================================
+
+def _parse_id(component_id: str):
+    return json.loads(component_id) if component_id.startswith("{") else component_id
+
+def _matches(pattern, component_id) -> bool:
+    """Match a component id against a callback dependency id (ALL wildcards in pattern-matching ids)."""
+    if not isinstance(pattern, dict) or not isinstance(component_id, dict):
+        return pattern == component_id
+    return pattern.keys() == component_id.keys() and all(
+        value == ["ALL"] or component_id[key] == value for key, value in pattern.items()
+    )
+
+def _components(tree):
+    """Yield (id, props) of every component with an id in a JSON layout tree."""
+    if isinstance(tree, list):
+        for item in tree:
+            yield from _components(item)
+    elif isinstance(tree, dict) and "props" in tree and "type" in tree:
+        if tree["props"].get("id") is not None:
+            yield tree["props"]["id"], tree["props"]
+        for value in tree["props"].values():
+            yield from _components(value)
+
+class DashRenderer:
+    """
+    Replay the callbacks the Dash renderer fires for an interaction, on the
+    app's own callback graph. Server callbacks are posted to the callback
+    endpoint, and the components they mount fire their initial callbacks.
+    Clientside callbacks are counted, and run if `clientside` holds a Python
+    stand-in for them: a function of (renderer, changed prop ids) returning
+    the {(id, property): value} updates, or None for no update. A callback
+    whose input is the output of another pending callback waits for it, as in
+    the browser. `calls` counts the callbacks fired by name, `server_calls`
+    the requests sent to the server.
+    """
+
+    def __init__(self, dash_app, clientside: dict = None):
+        self.app = dash_app
+        self.client = dash_app.server.test_client()
+        self.clientside = clientside or {}
+        self.values = {}
+        self.mounted = {}
+        self.calls = Counter()
+        self.server_calls = 0
+        self.load()
+
+    # -- callback graph ---------------------------------------------------------
+
+    def name(self, callback: dict) -> str:
+        if callback["clientside_function"]:
+            function = callback["clientside_function"]
+            return f"{function['namespace']}.{function['function_name']}"
+        return self.app.callback_map[callback["output"]]["callback"].__name__
+
+    @staticmethod
+    def outputs(callback: dict) -> list:
+        output = callback["output"]
+        specs = output.strip(".").split("...") if output.startswith("..") else [output]
+        return [tuple(spec.rsplit(".", 1)) for spec in specs]
+
+    def mounted_ids(self):
+        return [component_id for ids in self.mounted.values() for component_id in ids]
+
+    def ready(self, callback: dict) -> bool:
+        """Whether the inputs and outputs of a callback are all in the layout."""
+        dependencies = [_parse_id(i["id"]) for i in callback["inputs"]]
+        dependencies += [_parse_id(component_id) for component_id, _ in self.outputs(callback)]
+        return all(isinstance(d, dict) or d in self.mounted_ids() for d in dependencies)
+
+    def triggered(self, changed: set, initial: set = frozenset()) -> dict:
+        """Return the callbacks fired by changed (id, property) pairs and by newly mounted ids."""
+        fired = {}
+        for index, callback in enumerate(self.app._callback_list):
+            inputs = [(_parse_id(i["id"]), i["property"]) for i in callback["inputs"]]
+            props = {
+                f"{component_id}.{prop}" for component_id, prop in changed
+                for pattern, input_prop in inputs if input_prop == prop and _matches(pattern, _parse_id(component_id))
+            }
+            if not props:
+                # Adding components that match an ALL input changes its value, even with prevent_initial_call.
+                props = {
+                    f"{component_id}.{prop}" for component_id in initial
+                    for pattern, prop in inputs
+                    if isinstance(pattern, dict) and _matches(pattern, _parse_id(component_id))
+                }
+            if not props and not callback["prevent_initial_call"]:
+                # Components mounted by a layout fire the callbacks with an input or output among them.
+                outputs = [(_parse_id(component_id), prop) for component_id, prop in self.outputs(callback)]
+                if any(not isinstance(component_id, dict) and component_id in initial for component_id, _ in outputs + inputs):
+                    props = {f"{callback['inputs'][0]['id']}.{callback['inputs'][0]['property']}"}
+            if props and self.ready(callback):
+                fired[index] = props
+        return fired
+
+    # -- rendering --------------------------------------------------------------
+
+    def unmount(self, container: str):
+        for component_id in self.mounted.pop(container, []):
+            self.unmount(stringify_id(component_id))
+
+    def mount(self, container: str, tree) -> set:
+        """Replace the components under `container` with those of `tree`; return the new ids."""
+        self.unmount(container)
+        ids = []
+        for component_id, props in _components(tree):
+            ids.append(component_id)
+            for prop, value in props.items():
+                self.values[(stringify_id(component_id), prop)] = value
+        self.mounted[container] = ids
+        return {stringify_id(component_id) for component_id in ids}
+
+    def load(self):
+        """Mount the app layout and fire its initial callbacks."""
+        layout = json.loads(to_json(self.app.layout))
+        self.run(set(), self.mount("_layout", layout))
+
+    def interact(self, component_id, prop: str, value) -> Counter:
+        """Set a property as a user interaction would; return the callbacks it fired."""
+        self.values[(stringify_id(component_id), prop)] = value
+        self.calls = Counter()
+        self.server_calls = 0
+        self.run({(stringify_id(component_id), prop)})
+        return self.calls
+
+    def render_children(self, container: str, tree) -> Counter:
+        """Replace the children of a container as a clientside render would; return the callbacks it fired."""
+        self.calls = Counter()
+        self.server_calls = 0
+        self.run(set(), self.mount(container, tree))
+        return self.calls
+
+    def request(self, callback: dict, changed: set) -> dict:
+        def dependency(item):
+            pattern = _parse_id(item["id"])
+            if isinstance(pattern, dict):
+                return [
+                    (component_id, item["property"], self.values.get((stringify_id(component_id), item["property"])))
+                    for component_id in self.mounted_ids() if _matches(pattern, component_id)
+                ]
+            return (pattern, item["property"], self.values.get((pattern, item["property"])))
+
+        outputs = [f"{component_id}.{prop}" for component_id, prop in self.outputs(callback)]
+        body = callback_request(
+            outputs if len(outputs) > 1 else outputs[0],
+            [dependency(i) for i in callback["inputs"]],
+            [dependency(s) for s in callback["state"]]
+        )
+        body["changedPropIds"] = sorted(changed)
+        return body
+
+    def run(self, changed: set, initial: set = frozenset()):
+        pending = self.triggered(changed, initial)
+        while pending:
+            callbacks = self.app._callback_list
+            waiting = {
+                index for index in pending
+                if any(
+                    _matches(_parse_id(i["id"]), _parse_id(component_id)) and i["property"] == prop
+                    for other in pending if other != index
+                    for component_id, prop in self.outputs(callbacks[other])
+                    for i in callbacks[index]["inputs"]
+                )
+            }
+            index = min(set(pending) - waiting or pending)
+            callback = callbacks[index]
+            props = pending.pop(index)
+            name = self.name(callback)
+            self.calls[name] += 1
+            if callback["clientside_function"]:
+                updates = self.clientside[name](self, props) if name in self.clientside else None
+                response = {}
+                for (component_id, prop), value in (updates or {}).items():
+                    response.setdefault(stringify_id(component_id), {})[prop] = value
+            else:
+                reply = self.client.post(CALLBACK_ENDPOINT, json=self.request(callback, props))
+                self.server_calls += 1
+                if reply.status_code == 204:
+                    continue
+                assert reply.status_code == 200, reply.get_data(as_text=True)
+                response = reply.get_json()["response"]
+            changed, mounted = set(), set()
+            for component_id, updates in response.items():
+                for prop, value in updates.items():
+                    self.values[(component_id, prop)] = value
+                    changed.add((component_id, prop))
+                    if prop == "children":
+                        mounted |= self.mount(component_id, value)
+            for fired, fired_props in self.triggered(changed, mounted).items():
+                pending.setdefault(fired, set()).update(fired_props)
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def dashboard():
+    import app
+    return app
+
+def select_player(renderer, props):
+    """Stand-in for sidebar.select_player (assets/sidebar.js)."""
+    component_id, prop = sorted(props)[0].rsplit(".", 1)
+    if not renderer.values.get((component_id, prop)):
+        return None
+    return {("selected-player", "data"): json.loads(component_id)["index"]}
+
+@pytest.fixture
+def renderer(dashboard):
+    return DashRenderer(dashboard.app, clientside={"sidebar.select_player": select_player})
@@ -0,0 +1,67 @@
+"""Callback invocations per user interaction, on the app's callback graph."""
+import pytest
+
+def page_callbacks(calls) -> dict:
+    return {name: count for name, count in calls.items() if name.startswith("update_")}
+
+@pytest.fixture
+def renderer_on_tab(renderer, dashboard):
+    def open_tab(tab: int):
+        renderer.interact(dashboard.TAB_IDS[tab - 1], "n_clicks", 1)
+        return renderer
+    return open_tab
+
+def test_initial_load_renders_overview_once(renderer):
+    assert renderer.calls["update_content"] == 1
+    assert renderer.calls["update_tab_bar"] == 1
+    assert renderer.calls["update_page1_content"] == 1
+    assert "update_page2_content" not in renderer.calls
+    assert "update_page3_content" not in renderer.calls
+
+@pytest.mark.parametrize("tab, page", [(2, "update_page2_content"), (3, "update_page3_content")])
+def test_tab_switch_renders_page_once(renderer_on_tab, tab, page):
+    calls = renderer_on_tab(tab).calls
+    assert calls["select_tab"] == 1
+    assert page_callbacks(calls) == {"update_content": 1, "update_tab_bar": 1, page: 1}
+
+@pytest.mark.parametrize("tab, page", [(2, "update_page2_content"), (3, "update_page3_content")])
+def test_season_change_renders_page_once(renderer_on_tab, tab, page):
+    renderer = renderer_on_tab(tab)
+    calls = renderer.interact("season-dropdown", "value", "2023/2024")
+    assert calls["store_selected_season"] == 1
+    assert page_callbacks(calls) == {page: 1}
+
+def test_season_change_presets_load_page_date_range(renderer_on_tab, dashboard):
+    renderer = renderer_on_tab(2)
+    calls = renderer.interact("season-dropdown", "value", "2023/2024")
+    assert calls["select_season_date_range"] == 1
+    assert renderer.values[("date-range", "start_date")] == str(dashboard.season_date_range("2023/2024")[0])
+
+def mount_avatars(renderer, player_ids):
+    """Mount the sidebar avatars, as the client-side sidebar renders them."""
+    return renderer.render_children("sidebar-window", [
+        {"type": "Div", "namespace": "dash_html_components", "props": {"id": {"type": "player-img", "index": player_id}}}
+        for player_id in player_ids
+    ])
+
+@pytest.mark.parametrize("tab, page", [
+    (1, "update_page1_content"), (2, "update_page2_content"), (3, "update_page3_content")
+])
+def test_player_click_renders_page_once(renderer_on_tab, dashboard, tab, page):
+    renderer = renderer_on_tab(tab)
+    player_ids = [int(p) for p in dashboard.df_player_resume["player_id"]]
+    mount_avatars(renderer, player_ids)
+    calls = renderer.interact({"type": "player-img", "index": player_ids[0]}, "n_clicks", 1)
+    assert calls["sidebar.select_player"] == 1
+    assert page_callbacks(calls) == {page: 1}
+    assert renderer.server_calls == 1
+
+def test_sidebar_scroll_sends_no_request(renderer, dashboard):
+    player_ids = [int(p) for p in dashboard.df_player_resume["player_id"]]
+    mount_avatars(renderer, player_ids[:2])
+    calls = renderer.interact("sidebar-viewport", "data", {"scrollTop": 400, "height": 800, "width": 1920})
+    assert calls == {"sidebar.render": 1}
+    # The render mounts other avatars: only the client-side selection sees them.
+    calls = mount_avatars(renderer, player_ids[2:])
+    assert calls == {"sidebar.select_player": 1}
+    assert renderer.server_calls == 0
@@ -0,0 +1,16 @@
+"""Cached overview components."""
+from components import COMPONENT_CACHE_SIZE, donut_widget
+
+DONUT = (55, "Minutes: ", "1200", " min", "minutes_played_pct", 10, 20, 15, "#fff", "#000", "MINUTES", 1.2)
+
+def test_cached_component_returns_a_new_tree_per_call():
+    first = donut_widget(*DONUT)
+    first["props"]["style"]["position"] = "fixed"
+    first["props"]["children"].clear()
+    second = donut_widget(*DONUT)
+    assert second["props"]["style"]["position"] == "relative"
+    assert len(second["props"]["children"]) == 2
+    assert donut_widget.cache_info().hits >= 1
+
+def test_cached_component_cache_is_bounded():
+    assert donut_widget.cache_info().maxsize == COMPONENT_CACHE_SIZE
@@ -0,0 +1,37 @@
+"""Regression tests of the data pipeline stages."""
+import pandas as pd
+import pytest
+
+from data_loader import build_recovery_weekly, last_recovery_date
+
+def recovery_rows(player_id: int, date: str, composite: float, completeness: float) -> list:
+    base = {"player_id": player_id, "sessionDate": pd.Timestamp(date), "seasonName": "2024/2025", "category": "sleep"}
+    return [
+        {**base, "metric": "sleep_baseline_composite", "value": composite},
+        {**base, "metric": "sleep_baseline_completeness", "value": completeness}
+    ]
+
+@pytest.fixture
+def two_players_same_day() -> pd.DataFrame:
+    # Player 1's day is incomplete (20% threshold), player 2's is complete.
+    return pd.DataFrame(
+        recovery_rows(1, "2024-10-07", composite=-0.5, completeness=0.1)
+        + recovery_rows(2, "2024-10-07", composite=0.8, completeness=0.9)
+        + recovery_rows(2, "2024-10-08", composite=0.4, completeness=0.9)
+    )
+
+def test_weekly_completeness_is_matched_per_player(two_players_same_day):
+    # The completeness used to be merged on the date only, so that player 1's
+    # incomplete day passed the filter on player 2's completeness.
+    weekly = build_recovery_weekly(two_players_same_day)
+    assert set(weekly["player_id"]) == {2}
+
+def test_weekly_average_uses_only_the_players_own_days(two_players_same_day):
+    weekly = build_recovery_weekly(two_players_same_day)
+    assert len(weekly) == 1
+    assert weekly["value_composite"].iloc[0] == pytest.approx(0.6)
+
+def test_last_7_days_end_at_the_last_recovery_date_of_the_window(two_players_same_day):
+    assert last_recovery_date(two_players_same_day, pd.Timestamp("2025-03-13")) == pd.Timestamp("2024-10-08")
+    assert last_recovery_date(two_players_same_day, pd.Timestamp("2024-10-07")) == pd.Timestamp("2024-10-07")
+    assert last_recovery_date(two_players_same_day, pd.Timestamp("2024-01-01")) == pd.Timestamp("2024-01-01")
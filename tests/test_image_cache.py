@@ -0,0 +1,119 @@
+"""Image prefetch against a local stand-in for the image CDNs."""
+import io
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import flask
+import pytest
+
+import image_cache
+from image_cache import IMAGE_ROUTE, THUMBNAIL_HEIGHTS, ImageCache
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+SVG = b"<svg xmlns='http://www.w3.org/2000/svg'><script>alert(1)</script></svg>"
+
+def png(width: int, height: int) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "blue").save(output, format="PNG")
+    return output.getvalue()
+
+@pytest.fixture(scope="module")
+def cdn():
+    """Serve a few images over HTTP on localhost; yield (base URL, request counts by path)."""
+    files = {
+        "/player.png": (png(1000, 1500), "image/png"),
+        "/flag.png": (png(60, 40), "image/png"),
+        "/logo.svg": (SVG, "image/svg+xml")
+    }
+    requests = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests[self.path] = requests.get(self.path, 0) + 1
+            if self.path not in files:
+                self.send_error(404)
+                return
+            content, content_type = files[self.path]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+
+@pytest.fixture
+def prefetched(cdn, tmp_path):
+    base_url, requests = cdn
+    requests.clear()
+    urls = {
+        "player_sidebar": {f"{base_url}/player.png"},
+        "player_portrait": {f"{base_url}/player.png"},
+        "flag": {f"{base_url}/flag.png"},
+        "club_logo": {f"{base_url}/logo.svg", f"{base_url}/missing.png"}
+    }
+    cache = ImageCache(str(tmp_path))
+    summary = cache.prefetch(urls, workers=2, timeout=5)
+    return cache, urls, summary, base_url, requests
+
+def test_prefetch_downloads_each_url_once(prefetched):
+    cache, urls, summary, base_url, requests = prefetched
+    assert summary == {"downloaded": 3, "skipped": 0, "failed": 1}
+    assert requests["/player.png"] == 1
+
+def test_thumbnails_are_sized_per_context(prefetched):
+    cache, urls, summary, base_url, requests = prefetched
+    player = cache.manifest[f"{base_url}/player.png"]
+    for context in ("player_sidebar", "player_portrait"):
+        with Image.open(f"{cache.cache_dir}/{player[context]}") as image:
+            assert image.height == THUMBNAIL_HEIGHTS[context]
+    # Smaller images are never upscaled.
+    with Image.open(f"{cache.cache_dir}/{cache.manifest[f'{base_url}/flag.png']['flag']}") as image:
+        assert image.size == (60, 40)
+
+def test_urls_point_to_the_local_route_once_cached(prefetched):
+    cache, urls, summary, base_url, requests = prefetched
+    assert cache.url(f"{base_url}/flag.png", "flag").startswith(f"{IMAGE_ROUTE}/flag/")
+    assert cache.url(f"{base_url}/missing.png", "club_logo") == f"{base_url}/missing.png"
+    with open(cache.manifest_path) as f:
+        assert json.load(f) == cache.manifest
+
+def test_second_prefetch_skips_cached_urls(prefetched):
+    cache, urls, summary, base_url, requests = prefetched
+    summary = ImageCache(cache.cache_dir).prefetch(urls, workers=2, timeout=5)
+    assert summary == {"downloaded": 0, "skipped": 3, "failed": 1}
+    assert requests["/player.png"] == 1
+
+def test_route_serves_immutable_images_and_inert_svgs(prefetched, monkeypatch):
+    cache, urls, summary, base_url, requests = prefetched
+    monkeypatch.setattr(image_cache, "image_cache", cache)
+    server = flask.Flask(__name__)
+    image_cache.init_app(server)
+    client = server.test_client()
+
+    response = client.get(cache.url(f"{base_url}/flag.png", "flag"))
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+    assert "attachment" not in response.headers["Content-Disposition"]
+
+    response = client.get(cache.url(f"{base_url}/logo.svg", "club_logo"))
+    assert response.mimetype == "image/svg+xml"
+    assert "default-src 'none'" in response.headers["Content-Security-Policy"]
+    assert response.headers["Content-Disposition"] == "attachment"
+
+def test_collect_image_urls_reads_the_raw_files():
+    data_dir = os.path.join(os.path.dirname(image_cache.__file__), "data")
+    urls = image_cache.collect_image_urls(data_dir)
+    assert set(urls) == set(THUMBNAIL_HEIGHTS)
+    assert urls["player_sidebar"] == urls["player_portrait"]
+    assert all(url.startswith("http") for context_urls in urls.values() for url in context_urls)
@@ -0,0 +1,41 @@
+"""Callback metrics shared by every process of the app."""
+import multiprocessing
+
+import metrics
+from metrics import Counter, Histogram, MetricStore
+
+def record(path: str):
+    store = MetricStore(path)
+    Counter("calls", "Calls.", store).inc(callback="page2")
+    Histogram("seconds", "Latency.", (0.1, 1), store).observe(0.5, callback="page2")
+
+def test_metrics_are_summed_over_processes(tmp_path):
+    path = str(tmp_path / "metrics.sqlite")
+    store = MetricStore(path)
+    counter = Counter("calls", "Calls.", store)
+    histogram = Histogram("seconds", "Latency.", (0.1, 1), store)
+    counter.inc(callback="page2")
+    histogram.observe(0.05, callback="page2")
+    worker = multiprocessing.get_context("spawn").Process(target=record, args=(path,))
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    assert 'calls{callback="page2"} 2' in counter.expose()
+    assert histogram.expose()[2:] == [
+        'seconds_bucket{callback="page2",le="0.1"} 1',
+        'seconds_bucket{callback="page2",le="1"} 2',
+        'seconds_bucket{callback="page2",le="+Inf"} 2',
+        'seconds_sum{callback="page2"} 0.55',
+        'seconds_count{callback="page2"} 2'
+    ]
+
+def test_unrecorded_calls_are_not_counted(tmp_path, monkeypatch):
+    calls = Counter("calls", "Calls.", MetricStore(str(tmp_path / "metrics.sqlite")))
+    monkeypatch.setattr(metrics, "METRICS", True)
+    monkeypatch.setattr(metrics, "CALLBACK_CALLS", calls)
+    monkeypatch.setattr(metrics, "CALLBACK_PHASE_SECONDS", Histogram("seconds", "Latency.", (1,), calls.store))
+    callback = metrics.instrumented_callback("update_page2_content", tab=2)(lambda: "page")
+    callback()
+    with metrics.unrecorded():
+        callback()
+    assert calls.expose()[2:] == ['calls{callback="update_page2_content",tab="2"} 1']
@@ -0,0 +1,43 @@
+"""Static snapshot generation shared by the workers."""
+import multiprocessing
+import os
+import time
+
+from dash import html
+
+from snapshot import Snapshot
+
+PLAYERS = [(1, "Player One"), (2, "Player Two")]
+SEASONS = ["2024/2025"]
+
+def build(snapshot_dir: str, log_path: str):
+    def report_pages(player_id, season):
+        with open(log_path, "a") as log:
+            log.write(f"{os.getpid()} {player_id}\n")
+        time.sleep(0.2)
+        return [("overview", "Overview", html.Div(f"Player {player_id}"))]
+    Snapshot.build(snapshot_dir, "v1", report_pages, PLAYERS, SEASONS)
+
+def test_workers_starting_together_generate_the_snapshot_once(tmp_path):
+    snapshot_dir, log_path = str(tmp_path / "snapshots"), str(tmp_path / "renders.log")
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=build, args=(snapshot_dir, log_path)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0, 0, 0]
+    with open(log_path) as log:
+        renders = log.read().splitlines()
+    assert len(renders) == len(PLAYERS) * len(SEASONS)
+    assert len({render.split()[0] for render in renders}) == 1
+    assert Snapshot(os.path.join(snapshot_dir, "v1")).get("1/2024-2025/overview.html") is not None
+
+def test_new_version_replaces_the_old_snapshot(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshots")
+
+    def report_pages(player_id, season):
+        return [("overview", "Overview", html.Div("x"))]
+    Snapshot.build(snapshot_dir, "v1", report_pages, PLAYERS, SEASONS)
+    Snapshot.build(snapshot_dir, "v2", report_pages, PLAYERS, SEASONS)
+    assert sorted(name for name in os.listdir(snapshot_dir) if not name.startswith(".")) == ["v2"]
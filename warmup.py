@@ -0,0 +1,82 @@
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from metrics import unrecorded
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Startup Warm-up
+# =============================================================================
+
+def _run_job(job):
+    """
+    Call a cached callback so that its output lands in the response cache. The
+    call is not user traffic: it is left out of the callback metrics.
+    """
+    func, args = job
+    with unrecorded():
+        func(*args)
+
+class Warmup:
+    """
+    Pre-render callback outputs into the shared response cache after data loading.
+
+    Each job is a (callback, args) pair run in a thread pool; a thread pool is
+    used rather than a process pool because the warm-up starts while the app
+    module is still being imported, which makes forking unsafe. The job order
+    is shuffled per process so that several gunicorn workers warming up at the
+    same time mostly build different pages and pick up each other's results
+    from the cache.
+    """
+
+    def __init__(self, jobs: list, max_workers: int):
+        self.jobs = list(jobs)
+        random.Random(os.getpid()).shuffle(self.jobs)
+        self.max_workers = max_workers
+        self.done = 0
+        self.failed = 0
+        self.started_at = None
+        self.finished_at = None
+        self.ready = threading.Event()
+
+    def start(self):
+        """Run the warm-up in a daemon thread, or flag readiness at once if there is nothing to do."""
+        if not self.jobs:
+            self.ready.set()
+            return
+        threading.Thread(target=self.run, name="warmup", daemon=True).start()
+
+    def run(self):
+        """Render every job, then flag readiness."""
+        self.started_at = time.time()
+        try:
+            with ThreadPoolExecutor(self.max_workers, thread_name_prefix="warmup") as executor:
+                futures = [executor.submit(_run_job, job) for job in self.jobs]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        self.failed += 1
+                        logger.exception("Warm-up job failed")
+                    self.done += 1
+        finally:
+            self.finished_at = time.time()
+            self.ready.set()
+            logger.info(
+                "Warm-up finished: %d pages in %.1fs (%d failed)",
+                self.done, self.finished_at - self.started_at, self.failed
+            )
+
+    def status(self) -> dict:
+        """Return the warm-up progress as a JSON-serializable dict."""
+        return {
+            "status": "ready" if self.ready.is_set() else "warming-up",
+            "done": self.done,
+            "failed": self.failed,
+            "total": len(self.jobs)
+        }